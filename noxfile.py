@@ -73,3 +73,10 @@ def tests(session: Session) -> None:
     session.install(".")
     session.install(*deps)
     session.run("pytest", *session.posargs)
+
+
+@session(python=main_python_version)
+def benchmark(session: Session) -> None:
+    """Measure stream throughput against the mock Jotform API."""
+    session.install(".")
+    session.run("python", "-m", "tests.benchmark", *session.posargs)
@@ -0,0 +1,101 @@
+"""Writing of records to batch files, for the Singer BATCH message mode."""
+
+from __future__ import annotations
+
+import gzip
+import typing as t
+from uuid import uuid4
+
+from tap_jotform.output import dumps
+
+if t.TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from singer_sdk.helpers._batch import BatchConfig
+
+
+class JSONLinesBatchWriter:
+    """Write records to JSON Lines files, optionally compressed with gzip.
+
+    A file is closed once it holds ``batch_size`` records from the batch
+    configuration, or ``max_bytes`` bytes of uncompressed JSON. Records are
+    written as they arrive, without holding a whole batch in memory, and no
+    record is read past the end of the current file until it has been closed.
+    """
+
+    def __init__(
+        self,
+        tap_name: str,
+        stream_name: str,
+        batch_config: BatchConfig,
+        *,
+        max_bytes: int | None = None,
+    ) -> None:
+        """Create a new batch writer.
+
+        Args:
+            tap_name: The name of the tap.
+            stream_name: The name of the stream.
+            batch_config: The batch configuration.
+            max_bytes: Maximum size of the JSON in a file, or None for no limit.
+        """
+        self.tap_name = tap_name
+        self.stream_name = stream_name
+        self.batch_config = batch_config
+        self.max_bytes = max_bytes
+
+    @property
+    def compressed(self) -> bool:
+        """Return whether files are compressed with gzip.
+
+        Returns:
+            True for gzip files.
+        """
+        return (self.batch_config.encoding.compression or "none") == "gzip"
+
+    def get_batches(self, records: Iterable[dict]) -> Iterator[list[str]]:
+        """Write records to files, yielding a manifest once each file is closed.
+
+        Args:
+            records: The records to write.
+
+        Yields:
+            A list with the URL of each file written.
+        """
+        storage = self.batch_config.storage
+        sync_id = f"{self.tap_name}--{self.stream_name}-{uuid4()}"
+        suffix = ".json.gz" if self.compressed else ".json"
+        iterator = iter(records)
+
+        index = 0
+        while (record := next(iterator, None)) is not None:
+            index += 1
+            filename = f"{storage.prefix or ''}{sync_id}-{index}{suffix}"
+            with storage.fs(create=True) as fs:
+                with fs.open(filename, "wb") as raw:
+                    if self.compressed:
+                        with gzip.GzipFile(fileobj=raw, mode="wb") as file:
+                            self._write(file, record, iterator)
+                    else:
+                        self._write(raw, record, iterator)
+                url = fs.geturl(filename)
+            yield [url]
+
+    def _write(
+        self,
+        file: t.IO[bytes] | gzip.GzipFile,
+        first: dict,
+        iterator: Iterator[dict],
+    ) -> None:
+        batch_size = self.batch_config.batch_size
+        max_bytes = self.max_bytes
+        count = size = 0
+        record: dict | None = first
+        while record is not None:
+            line = dumps(record) + b"\n"
+            file.write(line)
+            count += 1
+            size += len(line)
+            if count >= batch_size or (max_bytes and size >= max_bytes):
+                return
+            record = next(iterator, None)
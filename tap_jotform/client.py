@@ -2,20 +2,141 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import datetime
+import itertools
+import json
+import queue
+import re
+import threading
+import time
 import typing as t
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from functools import partial
+from urllib.parse import parse_qs, urlparse
 
-import requests
-import requests_cache
+from singer_sdk import metrics
 from singer_sdk.authenticators import APIKeyAuthenticator
-from singer_sdk.pagination import BaseOffsetPaginator
+from singer_sdk.helpers._state import PROGRESS_MARKERS
+from singer_sdk.helpers._util import utc_now
+from singer_sdk.helpers.jsonpath import extract_jsonpath
+from singer_sdk.pagination import BaseAPIPaginator, BaseOffsetPaginator
 from singer_sdk.streams import RESTStream
 
+from tap_jotform.batch import JSONLinesBatchWriter
+from tap_jotform.decoding import (
+    decode_response,
+    decode_seconds,
+    response_size,
+    set_payload,
+    stream_content,
+)
+from tap_jotform.engine import AsyncRequestExecutor
+from tap_jotform.instrumentation import StreamMetrics
+from tap_jotform.scheduler import RequestBudgetExhaustedError
+from tap_jotform.transform import RecordTransformer, to_integer, transform_page
+from tap_jotform.tuning import PageSizeTuner
+
 if t.TYPE_CHECKING:
+    from concurrent.futures import Executor, Future, ProcessPoolExecutor
+
+    import requests
+    from backoff.types import Details
+    from singer_sdk._singerlib import Catalog
+    from singer_sdk.helpers._batch import BaseBatchFileEncoding, BatchConfig
     from singer_sdk.helpers.types import Context, Record
 
+    from tap_jotform.scheduler import RequestScheduler
+    from tap_jotform.session import SessionRegistry
+    from tap_jotform.tap import TapJotform
+    from tap_jotform.transform import Converter
+
+
+#: Response attribute holding callbacks to run once the page has been parsed.
+_PARSED_ATTR = "_jotform_on_parsed"
+
+#: Format of date-time values in Jotform API filters.
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def format_datetime(value: datetime.datetime) -> str:
+    """Format a date-time value for a Jotform API filter.
+
+    Args:
+        value: The date-time value.
+
+    Returns:
+        The formatted value.
+    """
+    return value.strftime(DATETIME_FORMAT)
+
+
+def parse_datetime(value: str) -> datetime.datetime:
+    """Parse a date-time value formatted for a Jotform API filter.
+
+    Args:
+        value: The formatted value.
+
+    Returns:
+        The date-time value.
+    """
+    return datetime.datetime.strptime(value, DATETIME_FORMAT).replace(
+        tzinfo=datetime.timezone.utc,
+    )
+
+
+@dataclass(frozen=True)
+class Sweep:
+    """A pass over a paginated endpoint, sorted and filtered by one date field."""
+
+    #: The field to sort and filter by.
+    field: str = "created_at"
+
+    #: Exclusive lower bound for the field.
+    after: str | None = None
+
+    #: Exclusive upper bound for the field.
+    before: str | None = None
+
+    @property
+    def filter(self) -> dict[str, str]:
+        """Return the API filter for this sweep.
+
+        Returns:
+            A filter object, empty if the sweep is unbounded.
+        """
+        result = {}
+        if self.after:
+            result[f"{self.field}:gt"] = self.after
+        if self.before:
+            result[f"{self.field}:lt"] = self.before
+        return result
+
+
+def _requested_limit(response: requests.Response, default: int) -> int:
+    """Return the page size a response was requested with.
+
+    Args:
+        response: The response object.
+        default: The page size to assume if the request did not set one.
+
+    Returns:
+        The ``limit`` parameter of the request.
+    """
+    query = parse_qs(urlparse(str(response.request.url)).query)
+    return int(query["limit"][0]) if "limit" in query else default
+
 
 class JotformPaginator(BaseOffsetPaginator):
-    """Jotform pagination class."""
+    """Jotform pagination class.
+
+    The page size may change between requests, so each page is compared with the
+    ``limit`` it was requested with, and the offset advances by the number of
+    records actually returned.
+    """
 
     def has_more(self, response: requests.Response) -> bool:
         """Return True if there are more pages to fetch.
@@ -26,10 +147,119 @@ class JotformPaginator(BaseOffsetPaginator):
         Returns:
             True if there are more pages to fetch, False otherwise.
         """
-        result_set = response.json()["resultSet"]
+        result_set = decode_response(response)["resultSet"]
         count = int(result_set["count"])
 
-        return count == self._page_size
+        return count == _requested_limit(response, self._page_size)
+
+    def get_next(self, response: requests.Response) -> int:
+        """Return the offset of the page after the response.
+
+        Args:
+            response: The response object from the last request.
+
+        Returns:
+            The next offset.
+        """
+        return self._value + int(decode_response(response)["resultSet"]["count"])
+
+
+@dataclass(frozen=True)
+class SeekToken:
+    """Page token for keyset pagination."""
+
+    #: Exclusive lower bound for the sweep field, None to start at the sweep bound.
+    after: str | None = None
+
+    #: Number of records to skip past the lower bound.
+    offset: int = 0
+
+
+class JotformKeysetPaginator(BaseAPIPaginator[SeekToken]):
+    """Jotform keyset pagination class.
+
+    Instead of skipping a growing number of records with ``offset``, each page is
+    requested with a filter on the last value of the sort field seen so far. Records
+    that share the last value of a page are skipped with a small offset, since a
+    strict filter on that value could drop ties that did not fit in the page. If a
+    whole page shares one value, pagination falls back to offsets past the same
+    lower bound.
+    """
+
+    def __init__(
+        self,
+        page_size: int,
+        start_value: SeekToken | None = None,
+        last_value: str | None = None,
+    ) -> None:
+        """Create a new paginator.
+
+        Args:
+            page_size: Number of records requested per page.
+            start_value: Token of the first page, to resume pagination.
+            last_value: Last value of the sort field seen, to resume pagination.
+        """
+        super().__init__(start_value or SeekToken())
+        self._page_size = page_size
+        self._last_value = last_value
+
+    @property
+    def last_value(self) -> str | None:
+        """Return the last value of the sort field seen so far.
+
+        Returns:
+            The last value seen, or None before the first page.
+        """
+        return self._last_value
+
+    def has_more(self, response: requests.Response) -> bool:
+        """Return True if there are more pages to fetch.
+
+        Args:
+            response: The response object from the last request.
+
+        Returns:
+            True if there are more pages to fetch, False otherwise.
+        """
+        result_set = decode_response(response)["resultSet"]
+        return int(result_set["count"]) == _requested_limit(response, self._page_size)
+
+    def get_next(self, response: requests.Response) -> SeekToken:
+        """Return the token for the page after the response.
+
+        Args:
+            response: The response object from the last request.
+
+        Returns:
+            The next page token.
+
+        Raises:
+            RuntimeError: If the records are not sorted by the sweep field.
+        """
+        query = parse_qs(urlparse(str(response.request.url)).query)
+        field = query["orderby"][0]
+        values = [row[field] for row in decode_response(response)["content"]]
+
+        previous = [self._last_value] if self._last_value is not None else []
+        if previous + values != sorted(previous + values):
+            msg = f"Records are not sorted by '{field}', cannot use keyset pagination"
+            raise RuntimeError(msg)
+
+        last = values[-1]
+        ties = len(values) - values.index(last)
+
+        if ties < len(values):
+            # Seek past the last distinct value and skip the ties seen so far
+            token = SeekToken(after=values[-ties - 1], offset=ties)
+        elif self._last_value is not None and self._last_value != last:
+            # The whole page is a new run of ties that started on this page
+            token = SeekToken(after=self._last_value, offset=ties)
+        else:
+            # The run of ties spans pages, so fall back to offsets
+            token = replace(self._value, offset=self._value.offset + ties)
+
+        self._last_value = last
+        return token
 
 
 class JotformStream(RESTStream):
@@ -41,12 +271,42 @@ class JotformStream(RESTStream):
 
     INTEGER_FIELDS: tuple[str, ...] = ()
 
+    #: Fields filled in from another field when they are empty.
+    FIELD_FALLBACKS: t.ClassVar[dict[str, str]] = {}
+
+    #: Whether the stream writes BATCH messages when ``batch_config`` is set.
+    SUPPORTS_BATCH = False
+
+    #: Whether pages are converted by worker processes when
+    #: ``transform_workers`` is set.
+    TRANSFORM_IN_WORKERS = False
+
+    #: State key for the fingerprint of the last synced version of a context.
+    FINGERPRINT_STATE_KEY = "fingerprint"
     _requests_session: requests.Session | None
+    _prefetched: dict[tuple[tuple[str, t.Any], ...], Future[requests.Response]]
+    _partition_executor: Executor | None
+    _partition_index: dict[tuple[tuple[str, t.Any], ...], int] | None
+    _child_executor: Executor | None
+    _transformer: RecordTransformer | None
 
     def __init__(self, *args: t.Any, **kwargs: t.Any) -> None:
         """Initialize the stream object."""
         super().__init__(*args, **kwargs)
         self._requests_session = None
+        self._prefetched = {}
+        self._partition_executor = None
+        self._partition_index = None
+        self._child_executor = None
+        self._transformer = None
+        self._batching = False
+        self._transform_in_workers = (
+            self.TRANSFORM_IN_WORKERS
+            and (self.config.get("transform_workers") or 0) > 0
+        )
+        self.perf_metrics: StreamMetrics | None = None
+        if self.config.get("performance_metrics", True):
+            self.perf_metrics = StreamMetrics(self.name, self.metrics_logger)
 
     @property
     def url_base(self) -> str:
@@ -83,6 +343,77 @@ class JotformStream(RESTStream):
             headers["User-Agent"] = self.config.get("user_agent")
         return headers
 
+    def get_field_converters(self) -> dict[str, Converter]:
+        """Return the functions converting the value of each field.
+
+        Returns:
+            A mapping of field names to converters.
+        """
+        return dict.fromkeys(self.INTEGER_FIELDS, to_integer)
+
+    @property
+    def selected_properties(self) -> tuple[str, ...]:
+        """Return the top-level properties selected in the catalog.
+
+        A stream that is not selected is only synced for its child streams, so all
+        its properties are kept for :meth:`get_child_context`.
+
+        Returns:
+            The names of the selected properties, in schema order.
+        """
+        if not self.selected:
+            return tuple(self.schema["properties"])
+
+        mask = self.mask
+        return tuple(
+            key
+            for key in self.schema["properties"]
+            if mask.get(("properties", key), True)
+        )
+
+    def build_transformer(
+        self,
+        properties: t.Iterable[str] | None = None,
+    ) -> RecordTransformer:
+        """Build a transformer converting rows into records of the stream.
+
+        Args:
+            properties: The fields to keep, by default the selected properties.
+
+        Returns:
+            A transformer producing records with the given fields.
+        """
+        if properties is None:
+            properties = self.selected_properties
+        return RecordTransformer(
+            properties,
+            converters=self.get_field_converters(),
+            fallbacks=self.FIELD_FALLBACKS,
+        )
+
+    @property
+    def transformer(self) -> RecordTransformer:
+        """Return the transformer applied to every record of the stream.
+
+        It is built on first use, once the catalog has been applied, so fields
+        that are not selected are neither converted nor copied.
+
+        Returns:
+            The stream transformer.
+        """
+        if self._transformer is None:
+            self._transformer = self.build_transformer()
+        return self._transformer
+
+    def apply_catalog(self, catalog: Catalog) -> None:
+        """Apply the input catalog, and rebuild the transformer from its selection.
+
+        Args:
+            catalog: The input catalog.
+        """
+        super().apply_catalog(catalog)
+        self._transformer = None
+
     def post_process(
         self,
         row: Record,
@@ -97,10 +428,17 @@ class JotformStream(RESTStream):
         Returns:
             The post-processed record.
         """
-        for field in self.INTEGER_FIELDS:
-            value = row.get(field)
-            row[field] = int(value) if value else None
-        return row
+        if self._transform_in_workers:
+            # Already converted by a worker
+            return row
+
+        if self.perf_metrics is None:
+            return self.transformer(row)
+
+        start = time.perf_counter()
+        record = self.transformer(row)
+        self.perf_metrics.post_process_seconds += time.perf_counter() - start
+        return record
 
     def parse_response(
         self,
@@ -114,82 +452,1423 @@ class JotformStream(RESTStream):
         Yields:
             An iterator of parsed records.
         """
+        if self.stream_responses:
+            # Keep the sort field of each record for keyset pagination
+            query = parse_qs(urlparse(str(response.request.url)).query)
+            yield from stream_content(response, keep=query.get("orderby", []))
+            payload = decode_response(response)
+        else:
+            payload = decode_response(response)
+            yield from extract_jsonpath(self.records_jsonpath, input=payload)
         self.logger.info(
             "Received response",
-            extra={"limit_left": response.json()["limit-left"]},
+            extra={"limit_left": payload.get("limit-left")},
+        )
+
+    @property
+    def stream_responses(self) -> bool:
+        """Return True if response bodies are parsed as they are downloaded.
+
+        The HTTP cache and the ``aiohttp`` engine read every response in full, so
+        responses are not streamed when either is enabled.
+
+        Returns:
+            True if responses are streamed.
+        """
+        return (
+            bool(self.config.get("stream_responses"))
+            and self.sessions.cache_config is None
+            and not self.sessions.use_async_engine
         )
-        yield from super().parse_response(response)
 
     @property
-    def requests_session(self) -> requests_cache.CachedSession | requests.Session:
-        """Return a new requests session object.
+    def transform_pool(self) -> ProcessPoolExecutor | None:
+        """Return the pool of processes converting the pages of this stream.
 
         Returns:
-            A new requests session object.
+            The tap-wide process pool, or None if records are converted in this
+            process.
         """
-        if self._requests_session is None:  # type: ignore[has-type]
-            if (
-                self.config.get("requests_cache")
-                and self.config["requests_cache"]["enabled"]
-            ):
-                self._requests_session = requests_cache.CachedSession(
-                    **self.config["requests_cache"]["config"],
-                )
-            else:
-                self._requests_session = requests.Session()
-        return self._requests_session
+        if not self._transform_in_workers:
+            return None
+        return t.cast("TapJotform", self._tap).transform_pool
 
+    def after_parse(
+        self,
+        response: requests.Response,
+        callback: t.Callable[[], None],
+    ) -> None:
+        """Run a callback that reads the payload of a response once it is parsed.
 
-class JotformPaginatedStream(JotformStream):
-    """A Jotform stream with pagination."""
+        The ``resultSet`` and ``limit-left`` fields follow the records in the
+        body, so for streamed responses the callback is deferred until
+        :meth:`finish_page` is called. Responses decoded by worker processes
+        defer it the same way. Otherwise it runs right away.
 
-    def get_new_paginator(self) -> JotformPaginator:
-        """Return a new instance of a paginator.
+        Args:
+            response: The response object.
+            callback: The function to call.
+        """
+        if not self.stream_responses and not self._transform_in_workers:
+            callback()
+            return
+
+        callbacks: list[t.Callable[[], None]] | None = getattr(
+            response, _PARSED_ATTR, None
+        )
+        if callbacks is None:
+            callbacks = []
+            setattr(response, _PARSED_ATTR, callbacks)
+        callbacks.append(callback)
+
+    @staticmethod
+    def finish_page(response: requests.Response) -> None:
+        """Run the callbacks deferred until the records of a page were parsed.
+
+        Args:
+            response: The response object, with all its records consumed.
+        """
+        callbacks: list[t.Callable[[], None]] = getattr(response, _PARSED_ATTR, [])
+        setattr(response, _PARSED_ATTR, [])
+        for callback in callbacks:
+            callback()
+
+    @property
+    def cache_url_pattern(self) -> str:
+        """Return a pattern matching the URLs requested by this stream.
 
         Returns:
-            A new instance of a paginator.
+            A glob pattern for URLs without their scheme.
         """
-        return JotformPaginator(0, self.page_size)
+        host = urlparse(self.url_base).netloc
+        return host + re.sub(r"\{[^}]+\}", "*", self.path)
 
-    def get_url_params(
+    @property
+    def scheduler(self) -> RequestScheduler:
+        """Return the tap-wide request scheduler.
+
+        Returns:
+            The request scheduler.
+        """
+        return t.cast("TapJotform", self._tap).scheduler
+
+    @property
+    def sessions(self) -> SessionRegistry:
+        """Return the tap-wide HTTP session registry.
+
+        Returns:
+            The session registry.
+        """
+        return t.cast("TapJotform", self._tap).sessions
+
+    def _request(
         self,
+        prepared_request: requests.PreparedRequest,
         context: Context | None,
-        next_page_token: int | None,
-    ) -> dict[str, t.Any]:
-        """Return a dictionary of values to be used in URL parameterization.
+    ) -> requests.Response:
+        """Send a request once the scheduler grants a slot.
 
         Args:
+            prepared_request: The request to send.
             context: The context object.
-            next_page_token: The next page token.
 
         Returns:
-            A dictionary of values to be used in URL parameterization.
+            The response object.
         """
-        params: dict[str, t.Any] = {"limit": self.page_size}
+        self.scheduler.acquire(self.name)
+        start = time.perf_counter()
+        response = super()._request(prepared_request, context)
+        self.handle_response(response, time.perf_counter() - start)
+        return response
 
-        starting_value = self.get_starting_timestamp(context)
-        if starting_value and self.replication_key:
+    async def _request_async(
+        self,
+        prepared_request: requests.PreparedRequest,
+        context: Context | None,
+    ) -> requests.Response:
+        """Send a request as a coroutine on the event loop of the async engine.
+
+        This does what :meth:`_request` does, without blocking the event loop
+        while waiting for a slot or for the response.
+
+        Args:
+            prepared_request: The request to send.
+            context: The context object.
+
+        Returns:
+            The response object.
+
+        Raises:
+            RuntimeError: If the async engine is not enabled.
+        """
+        engine = self.sessions.engine
+        if engine is None:
+            msg = "The async HTTP engine is not enabled"
+            raise RuntimeError(msg)
+
+        await asyncio.sleep(self.scheduler.reserve(self.name))
+        start = time.perf_counter()
+        response = await engine.send(
+            prepared_request,
+            timeout=self.timeout,
+            allow_redirects=self.allow_redirects,
+        )
+        self._write_request_duration_log(
+            endpoint=self.path,
+            response=response,
+            context=context,
+            extra_tags={"url": prepared_request.path_url}
+            if self._LOG_REQUEST_METRIC_URLS
+            else None,
+        )
+        self.validate_response(response)
+        self.handle_response(response, time.perf_counter() - start)
+        return response
+
+    def handle_response(self, response: requests.Response, seconds: float) -> None:
+        """Account for a successful response, whichever engine sent it.
+
+        Args:
+            response: The response object.
+            seconds: Time spent sending the request and receiving the response.
+        """
+        if self.perf_metrics is not None:
+            self.after_parse(response, partial(self.observe_page, response, seconds))
+        self.after_parse(
+            response,
+            lambda: self.scheduler.update(decode_response(response).get("limit-left")),
+        )
+        if self.sessions.cache_config is not None:
+            self.sessions.cache_stats.add(self.name, response)
+
+    def create_executor(self, max_workers: int, purpose: str) -> Executor:
+        """Create a pool to send requests ahead of time.
+
+        With the ``aiohttp`` engine, requests run as coroutines on its event loop.
+        Otherwise, each request in flight runs on a thread of its own.
+
+        Args:
+            max_workers: Maximum number of requests in flight.
+            purpose: What the requests are for, used to name the threads.
+
+        Returns:
+            A new executor, to use with :meth:`submit_request`.
+        """
+        if (engine := self.sessions.engine) is not None:
+            return AsyncRequestExecutor(engine, max_workers)
+        return ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix=f"{self.name}-{purpose}",
+        )
+
+    def submit_request(
+        self,
+        executor: Executor,
+        prepared_request: requests.PreparedRequest,
+        context: Context | None,
+    ) -> Future[requests.Response]:
+        """Send a request in the background, retrying it if needed.
+
+        Args:
+            executor: An executor from :meth:`create_executor`.
+            prepared_request: The request to send.
+            context: The context object.
+
+        Returns:
+            A future for the response.
+        """
+        if isinstance(executor, AsyncRequestExecutor):
+            return executor.submit(
+                self.request_decorator(self._request_async),
+                prepared_request,
+                context,
+            )
+        return executor.submit(
+            self.request_decorator(self._request),
+            prepared_request,
+            context,
+        )
+
+    def request_ahead(
+        self,
+        context: Context | None,
+        tokens: t.Iterable[t.Any],
+        max_in_flight: int,
+        purpose: str,
+        first: Future[requests.Response] | None = None,
+    ) -> t.Generator[requests.Response, None, None]:
+        """Request a page for each token, keeping requests in flight ahead of time.
+
+        Up to ``max_in_flight`` requests are sent in the background, and each one
+        is replaced once its response is consumed. Responses are yielded in token
+        order. Closing the iterator cancels the outstanding requests.
+
+        Args:
+            context: The context object.
+            tokens: The page token of each request, in order.
+            max_in_flight: Maximum number of requests in flight, or 0 to send each
+                request when its response is needed.
+            purpose: What the requests are for, used to name the threads.
+            first: A request already sent, yielded before the others.
+
+        Yields:
+            One response per page.
+        """
+        pending: deque[Future[requests.Response]] = deque()
+        if first is not None:
+            pending.append(first)
+        tokens = iter(tokens)
+
+        if max_in_flight <= 0:
+            decorated_request = self.request_decorator(self._request)
+            while pending:
+                yield pending.popleft().result()
+            for token in tokens:
+                prepared_request = self.prepare_request(context, next_page_token=token)
+                yield decorated_request(prepared_request, context)
+            return
+
+        # Create the session before it is shared with the workers
+        _ = self.requests_session
+        executor = self.create_executor(max_in_flight, purpose)
+
+        def submit(count: int = 1) -> None:
+            for token in itertools.islice(tokens, max(count, 0)):
+                prepared_request = self.prepare_request(context, next_page_token=token)
+                pending.append(self.submit_request(executor, prepared_request, context))
+
+        try:
+            submit(max_in_flight - len(pending))
+            while pending:
+                yield pending.popleft().result()
+                submit()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+            self._close_unread(pending)
+
+    @staticmethod
+    def _close_unread(futures: t.Iterable[Future[requests.Response]]) -> None:
+        # Release the connections held by unread streamed responses
+        for future in futures:
+            if future.done() and not future.cancelled() and future.exception() is None:
+                future.result().close()
+
+    def observe_page(self, response: requests.Response, seconds: float) -> None:
+        """Record the performance metrics of a page once it is parsed.
+
+        Args:
+            response: The response of the page.
+            seconds: Time spent sending the request and receiving the response.
+        """
+        if self.perf_metrics is None:
+            return
+
+        payload = decode_response(response)
+        content = payload.get("content")
+        result_set = payload.get("resultSet") or {}
+        if "count" in result_set:
+            records = int(result_set["count"])
+        elif isinstance(content, (list, dict)):
+            records = len(content)
+        else:
+            records = int(content is not None)
+        limit_left = payload.get("limit-left")
+        self.perf_metrics.observe_page(
+            endpoint=urlparse(str(response.request.url)).path,
+            seconds=seconds,
+            size_bytes=response_size(response),
+            decode_seconds=decode_seconds(response),
+            records=records,
+            from_cache=bool(getattr(response, "from_cache", False)),
+            limit_left=None if limit_left is None else int(limit_left),
+        )
+
+    def backoff_handler(self, details: Details) -> None:
+        """Count a failed request before it is retried.
+
+        Args:
+            details: Backoff invocation details.
+        """
+        super().backoff_handler(details)
+        if self.perf_metrics is not None:
+            self.perf_metrics.add_retry()
+
+    def log_sync_costs(self) -> None:
+        """Log the API requests issued by this stream.
+
+        Costs shared by all streams are logged once for the whole run.
+        """
+        super().log_sync_costs()
+        if requests_count := self.scheduler.requests[self.name]:
             self.logger.info(
-                "Bookmark found %(bookmark)s",
-                extra={"bookmark": starting_value},
+                "Stream '%s' issued %d API requests",
+                self.name,
+                requests_count,
             )
-            params["filter"] = f'{{"{self.replication_key}:gt": "{starting_value}"}}'
 
-        if next_page_token:
-            params["offset"] = next_page_token
+        cache_stats = self.sessions.cache_stats
+        if lookups := cache_stats.hits[self.name] + cache_stats.misses[self.name]:
+            self.logger.info(
+                "Stream '%s' found %d of %d responses in the HTTP cache "
+                "(%d bytes), fetched %d bytes",
+                self.name,
+                cache_stats.hits[self.name],
+                lookups,
+                cache_stats.hit_bytes[self.name],
+                cache_stats.miss_bytes[self.name],
+            )
 
-        return params
+        # The SDK logs the costs of every stream in order after the sync, so the
+        # last one logs the costs of the whole run and closes its connections
+        tap = t.cast("TapJotform", self._tap)
+        if self is list(tap.streams.values())[-1]:
+            tap.log_run_costs()
+            tap.sessions.close()
 
-    def post_process(self, row: Record, context: Context | None = None) -> Record:
-        """Post-process a record.
+    def request_pages(
+        self,
+        context: Context | None,
+        paginator: BaseAPIPaginator,
+    ) -> t.Iterator[requests.Response]:
+        """Request pages one at a time until the paginator is finished.
+
+        The caller is expected to advance the paginator with each response before
+        asking for the next one.
+
+        Args:
+            context: The context object.
+            paginator: The paginator for this sync.
+
+        Yields:
+            One response per page.
+        """
+        decorated_request = self.request_decorator(self._request)
+        if (future := self.pop_prefetched(context)) is not None:
+            yield future.result()
+
+        while not paginator.finished:
+            prepared_request = self.prepare_request(
+                context,
+                next_page_token=paginator.current_value,
+            )
+            yield decorated_request(prepared_request, context)
+
+    @staticmethod
+    def _context_key(context: Context | None) -> tuple[tuple[str, t.Any], ...]:
+        return tuple(sorted((context or {}).items()))
+
+    def _prefetch_key(self, context: Context | None) -> tuple[tuple[str, t.Any], ...]:
+        return self._context_key(context)
+
+    def prefetch(self, context: Context | None, executor: Executor) -> None:
+        """Start requesting the first page for a context in the background.
+
+        The response is picked up by :meth:`request_pages` when the stream is
+        synced with the same context.
+
+        Args:
+            context: The context object.
+            executor: The executor to submit the request to.
+        """
+        if self.is_unchanged(context):
+            return
+
+        # The SDK only seeds the starting bookmark once it syncs the context
+        self._write_starting_replication_value(context)
+        key = self._prefetch_key(context)
+        if key in self._prefetched:
+            return
+
+        # Create the session before it is shared with the workers
+        _ = self.requests_session
+        prepared_request = self.prepare_request(
+            context,
+            next_page_token=self.get_new_paginator().current_value,
+        )
+        self._prefetched[key] = self.submit_request(executor, prepared_request, context)
+
+    def pop_prefetched(
+        self,
+        context: Context | None,
+    ) -> Future[requests.Response] | None:
+        """Return the prefetched first page for a context, if any.
 
         Args:
-            row: The record to post-process.
             context: The context object.
 
         Returns:
-            The post-processed record.
+            A future for the response of the first page, or None.
         """
-        row = super().post_process(row, context)
-        row["updated_at"] = row["updated_at"] or row["created_at"]
-        return row
+        return self._prefetched.pop(self._prefetch_key(context), None)
+
+    @property
+    def max_parallel_windows(self) -> int:
+        """Return the number of backfill windows to fetch concurrently.
+
+        Returns:
+            The maximum number of windows in flight.
+        """
+        return self.config.get("max_parallel_windows") or 1
+
+    @property
+    def max_parallel_children(self) -> int:
+        """Return the number of child contexts to fetch concurrently.
+
+        Returns:
+            The maximum number of child requests in flight.
+        """
+        return self.config.get("max_parallel_children") or 1
+
+    @property
+    def max_parallel_partitions(self) -> int:
+        """Return the number of partitions to fetch concurrently.
+
+        Returns:
+            The maximum number of partition requests in flight.
+        """
+        return self.config.get("max_parallel_partitions") or 1
+
+    def prefetch_partitions(self, context: Context | None) -> None:
+        """Start fetching the first page of the partitions that follow a context.
+
+        The SDK syncs partitions one after the other. This keeps requests for the
+        next ``max_parallel_partitions`` partitions in flight on a thread pool, so
+        their first pages are ready by the time they are synced.
+
+        Args:
+            context: The partition being synced.
+        """
+        partitions = self.partitions
+        if self.max_parallel_partitions <= 1 or not partitions:
+            return
+
+        if self._partition_index is None:
+            self._partition_index = {
+                self._context_key(partition): index
+                for index, partition in enumerate(partitions)
+            }
+
+        index = self._partition_index.get(self._context_key(context))
+        if index is None:
+            return
+
+        if self._partition_executor is None:
+            self._partition_executor = self.create_executor(
+                self.max_parallel_partitions,
+                "partitions",
+            )
+
+        for partition in partitions[index : index + self.max_parallel_partitions]:
+            self.prefetch(partition, self._partition_executor)
+
+        if index == len(partitions) - 1:
+            self._partition_executor.shutdown(wait=False)
+            self._partition_executor = None
+
+    def prefetch_children(
+        self,
+        records: list[dict[str, t.Any]],
+        context: Context | None,
+    ) -> None:
+        """Start fetching the child contexts of a page of records.
+
+        Args:
+            records: The records of a page, before post-processing.
+            context: The context object.
+        """
+        if self._child_executor is None:
+            return
+
+        for record in records:
+            child_context = self.get_child_context(record, context)
+            if child_context is None:
+                continue
+            for child in self.child_streams:
+                if isinstance(child, JotformStream) and (
+                    child.selected or child.has_selected_descendents
+                ):
+                    child.prefetch(child_context, self._child_executor)
+
+    def get_records(self, context: Context | None) -> t.Iterable[dict[str, t.Any]]:
+        """Return a generator of records, prefetching child streams if enabled.
+
+        As each page of records arrives, the first page of each of their child
+        contexts is requested on a pool of ``max_parallel_children`` threads. Child
+        streams are still synced one context at a time, in record order, so their
+        output stays grouped and state is only touched from this thread.
+
+        Args:
+            context: The context object.
+
+        Yields:
+            One item per (possibly processed) record in the API.
+        """
+        self.prefetch_partitions(context)
+        if self.max_parallel_children <= 1 or not any(
+            child.selected or child.has_selected_descendents
+            for child in self.child_streams
+        ):
+            yield from super().get_records(context)
+            return
+
+        self._child_executor = self.create_executor(
+            self.max_parallel_children,
+            "children",
+        )
+        try:
+            yield from super().get_records(context)
+        finally:
+            self._child_executor.shutdown(wait=False, cancel_futures=True)
+            self._child_executor = None
+
+    def iter_pages(
+        self,
+        context: Context | None,
+        paginator: BaseAPIPaginator | None = None,
+    ) -> t.Iterator[requests.Response]:
+        """Yield every page of a context, advancing pagination as it goes.
+
+        The paginator is advanced before each response is yielded, so it already
+        points at the next page while the records of the response are processed.
+        Streamed responses are only paginated once their records were parsed, see
+        :meth:`after_parse`.
+
+        Args:
+            context: The context object.
+            paginator: The paginator to use, or None to start from the first page.
+
+        Yields:
+            One response per page.
+        """
+        if paginator is None:
+            paginator = self.get_new_paginator()
+        for response in self.request_pages(context, paginator):
+            self.after_parse(response, partial(paginator.advance, response))
+            yield response
+
+    def records_from_pages(
+        self,
+        context: Context | None,
+        pages: t.Iterable[requests.Response],
+    ) -> t.Iterator[dict]:
+        """Parse the records of each page.
+
+        Args:
+            context: The context object.
+            pages: The responses to parse.
+
+        Yields:
+            An item for every record in the responses.
+        """
+        with metrics.http_request_counter(self.name, self.path) as request_counter:
+            request_counter.context = context
+
+            for response, parsed in self.parse_pages(pages):
+                request_counter.increment()
+                self.update_sync_costs(response.request, response, context)
+                records = parsed
+                if self._child_executor is not None:
+                    records = list(records)
+                    self.prefetch_children(records, context)
+                yield from records
+                self.finish_page(response)
+                self.checkpoint_page(context, response)
+
+    def parse_pages(
+        self,
+        pages: t.Iterable[requests.Response],
+    ) -> t.Iterator[tuple[requests.Response, t.Iterable[dict]]]:
+        """Pair each page with its records.
+
+        With ``transform_workers``, a worker process decodes and converts each
+        page. The next page is requested and handed to a worker before the records
+        of the current one are returned, so it is converted while they are
+        written.
+
+        Args:
+            pages: The responses to parse.
+
+        Yields:
+            Each response, with an iterable of its records.
+        """
+        pool = self.transform_pool
+        if pool is None:
+            for page in pages:
+                yield page, self.parse_response(page)
+            return
+
+        transformer = self.transformer
+
+        def submit(response: requests.Response) -> Future:
+            # Keep the sort field of each record for keyset pagination
+            query = parse_qs(urlparse(str(response.request.url)).query)
+            return pool.submit(
+                transform_page,
+                transformer,
+                response.content,
+                query.get("orderby", []),
+            )
+
+        pages = iter(pages)
+        response: requests.Response | None = next(pages, None)
+        future: Future | None = None if response is None else submit(response)
+        while response is not None and future is not None:
+            records, payload, seconds = future.result()
+            set_payload(response, payload, seconds)
+            self.logger.info(
+                "Received response",
+                extra={"limit_left": payload.get("limit-left")},
+            )
+            # Advance the paginator, so the next page can be requested
+            self.finish_page(response)
+            try:
+                next_response = next(pages, None)
+            except Exception:
+                # Records already fetched are still emitted and checkpointed
+                yield response, records
+                raise
+            next_future = None if next_response is None else submit(next_response)
+            yield response, records
+            response, future = next_response, next_future
+
+    def checkpoint_page(
+        self,
+        context: Context | None,
+        response: requests.Response,
+    ) -> None:
+        """Save progress once all records of a page have been emitted.
+
+        Args:
+            context: The context object.
+            response: The response of the page.
+        """
+
+    def get_fingerprint(self, context: Context | None) -> str | None:  # noqa: ARG002
+        """Return a value that changes whenever the records of a context change.
+
+        Args:
+            context: The context object.
+
+        Returns:
+            The fingerprint, or None if the context must always be synced.
+        """
+        return None
+
+    def is_unchanged(self, context: Context | None) -> bool:
+        """Return True if a context has not changed since it was last synced.
+
+        Args:
+            context: The context object.
+
+        Returns:
+            True if the fingerprint of the context matches the one saved in state.
+        """
+        fingerprint = self.get_fingerprint(context)
+        if fingerprint is None:
+            return False
+        state = self.get_context_state(context)
+        return state.get(self.FINGERPRINT_STATE_KEY) == fingerprint
+
+    def stop_sync(
+        self,
+        context: Context | None,
+        exc: RequestBudgetExhaustedError,
+    ) -> None:
+        """Stop syncing a context because no more requests may be issued.
+
+        The sync is incomplete, so progress markers are reset and the bookmark
+        does not move past what was fully synced before this run.
+
+        Args:
+            context: The context object.
+            exc: The exception raised by the scheduler.
+        """
+        self.logger.warning("Stopping sync of '%s' early: %s", self.name, exc)
+        self.reset_state_progress_markers(self.get_context_state(context))
+
+    def write_checkpoint(self) -> None:
+        """Write the stream state after progress was saved in it.
+
+        While records are written to batch files, the state is only written after
+        the BATCH message of each file, so it never covers records that have not
+        been handed to the target yet.
+        """
+        self._is_state_flushed = False
+        if not self._batching:
+            self._write_state_message()
+
+    def get_batch_config(self, config: t.Mapping) -> BatchConfig | None:
+        """Return the batch config, for streams that support BATCH messages.
+
+        Args:
+            config: The tap configuration.
+
+        Returns:
+            The batch config, or None to write RECORD messages.
+        """
+        if not self.SUPPORTS_BATCH:
+            return None
+        return super().get_batch_config(config)
+
+    def get_batches(
+        self,
+        batch_config: BatchConfig,
+        context: Context | None = None,
+    ) -> t.Iterable[tuple[BaseBatchFileEncoding, list[str]]]:
+        """Write records to batch files, yielding a manifest for each one.
+
+        JSON Lines files are closed once they reach ``batch_size`` records or
+        ``batch_max_bytes`` bytes. Other formats are written by the SDK.
+
+        Args:
+            batch_config: The batch configuration.
+            context: The context object.
+
+        Yields:
+            The encoding and manifest of each batch.
+        """
+        self._batching = True
+        try:
+            if batch_config.encoding.format != "jsonl":
+                yield from super().get_batches(batch_config, context)
+                return
+
+            writer = JSONLinesBatchWriter(
+                self.tap_name,
+                self.name,
+                batch_config,
+                max_bytes=self.config.get("batch_max_bytes"),
+            )
+            records = self._sync_records(context, write_messages=False)
+            for manifest in writer.get_batches(records):
+                yield batch_config.encoding, manifest
+        finally:
+            self._batching = False
+
+    def request_records(self, context: Context | None) -> t.Iterable[dict]:
+        """Request records from the API, following pagination.
+
+        Args:
+            context: The context object.
+
+        Yields:
+            An item for every record in the response.
+        """
+        if self.is_unchanged(context):
+            self.logger.debug("Skipping unchanged context %s", context)
+            return
+
+        try:
+            yield from self.records_from_pages(context, self.iter_pages(context))
+        except RequestBudgetExhaustedError as exc:
+            self.stop_sync(context, exc)
+            return
+
+        if (fingerprint := self.get_fingerprint(context)) is not None:
+            self.get_context_state(context)[self.FINGERPRINT_STATE_KEY] = fingerprint
+
+    @property
+    def requests_session(self) -> requests.Session:
+        """Return the requests session shared by all streams of the tap.
+
+        Returns:
+            The shared requests session object.
+        """
+        if self._requests_session is None:  # type: ignore[has-type]
+            if self.stream_responses:
+                self._requests_session = self.sessions.get("stream", stream=True)
+            else:
+                self._requests_session = self.sessions.get()
+        return self._requests_session
+
+
+#: Response attribute holding the position of the page after the response.
+_RESUME_ATTR = "_jotform_resume"
+
+
+class _PageChannel:
+    """A bounded hand-over of pages from a worker thread to the consumer."""
+
+    _DONE = object()
+
+    def __init__(self, maxsize: int, stop: threading.Event) -> None:
+        self._queue: queue.Queue[t.Any] = queue.Queue(maxsize=maxsize)
+        self._stop = stop
+
+    def _put(self, item: object) -> bool:
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+            except queue.Full:
+                continue
+            return True
+        return False
+
+    def fill(self, pages: t.Iterator[requests.Response]) -> None:
+        """Hand over every page, then an end marker or the error raised.
+
+        Args:
+            pages: The pages to hand over.
+        """
+        try:
+            for page in pages:
+                if not self._put(page):
+                    return
+        except Exception as exc:  # noqa: BLE001
+            self._put(exc)
+        self._put(self._DONE)
+
+    def __iter__(self) -> t.Iterator[requests.Response]:
+        while (item := self._queue.get()) is not self._DONE:
+            if isinstance(item, Exception):
+                raise item
+            yield item
+
+
+class JotformPaginatedStream(JotformStream):
+    """A Jotform stream with pagination."""
+
+    #: State key for the end of the last backfill window synced.
+    BACKFILL_STATE_KEY = "backfilled_until"
+
+    #: State key for the position of the last page synced.
+    RESUME_STATE_KEY = "resume"
+
+    #: Maximum number of records the API returns per page.
+    MAX_PAGE_SIZE = 1000
+
+    FIELD_FALLBACKS: t.ClassVar[dict[str, str]] = {"updated_at": "created_at"}
+
+    def __init__(self, *args: t.Any, **kwargs: t.Any) -> None:
+        """Initialize the stream object."""
+        super().__init__(*args, **kwargs)
+        self._local = threading.local()
+        self.page_size = self.config.get("page_size") or self.page_size
+
+        self.page_size_tuner: PageSizeTuner | None = None
+        if self.config.get("adaptive_page_size"):
+            if self.prefetch_pages > 0:
+                self.logger.warning(
+                    "Adaptive page size is disabled for stream '%s' while pages "
+                    "are prefetched",
+                    self.name,
+                )
+            else:
+                self.page_size_tuner = PageSizeTuner.from_config(
+                    self.config,
+                    self.page_size,
+                    self.MAX_PAGE_SIZE,
+                )
+
+    @property
+    def _active_sweeps(self) -> dict[tuple[tuple[str, t.Any], ...], Sweep]:
+        # Sweeps of the same context may be paginated on different threads
+        sweeps = getattr(self._local, "sweeps", None)
+        if sweeps is None:
+            sweeps = self._local.sweeps = {}
+        return sweeps
+
+    def _prefetch_key(self, context: Context | None) -> tuple[tuple[str, t.Any], ...]:
+        key = self._context_key(context)
+        sweep = self._active_sweeps.get(key) or next(
+            iter(self.get_sweeps(context)), None
+        )
+        return (*key, ("sweep", sweep))
+
+    @property
+    def backfill_window(self) -> datetime.timedelta | None:
+        """Return the size of the windows an initial load is split into.
+
+        Returns:
+            The window size, or None if initial loads are not split.
+        """
+        if days := self.config.get("backfill_window_days"):
+            return datetime.timedelta(days=days)
+        return None
+
+    @property
+    def prefetch_pages(self) -> int:
+        """Return the number of page requests to keep in flight.
+
+        Returns:
+            The number of pages to prefetch, 0 if prefetching is disabled.
+        """
+        return self.config.get("prefetch_pages") or 0
+
+    @property
+    def pagination_mode(self) -> str:
+        """Return the pagination mode for this stream.
+
+        Returns:
+            Either ``offset`` or ``keyset``.
+        """
+        return self.config.get("pagination_mode") or "offset"
+
+    def get_page_size(self, context: Context | None) -> int:  # noqa: ARG002
+        """Return the number of records to request per page for a context.
+
+        Args:
+            context: The context object.
+
+        Returns:
+            The page size, as tuned so far if ``adaptive_page_size`` is set.
+        """
+        if self.page_size_tuner is not None:
+            return self.page_size_tuner.size
+        return self.page_size
+
+    def handle_response(self, response: requests.Response, seconds: float) -> None:
+        """Account for a successful response, and tune the page size from it.
+
+        Args:
+            response: The response object.
+            seconds: Time spent sending the request and receiving the response.
+        """
+        super().handle_response(response, seconds)
+        if (tuner := self.page_size_tuner) is not None:
+
+            def observe() -> None:
+                result_set = decode_response(response).get("resultSet") or {}
+                tuner.observe(
+                    int(result_set.get("count", 0)),
+                    response.elapsed.total_seconds(),
+                    response_size(response),
+                )
+
+            self.after_parse(response, observe)
+
+    def backoff_handler(self, details: Details) -> None:
+        """Shrink the page size before a failed request is retried.
+
+        Args:
+            details: Backoff invocation details.
+        """
+        super().backoff_handler(details)
+        if self.page_size_tuner is not None:
+            self.page_size_tuner.failed()
+
+    def get_new_paginator(
+        self,
+        page_size: int | None = None,
+    ) -> JotformPaginator | JotformKeysetPaginator:
+        """Return a new instance of a paginator.
+
+        Args:
+            page_size: Number of records per page, defaults to ``page_size``.
+
+        Returns:
+            A new instance of a paginator.
+        """
+        page_size = page_size or self.page_size
+        if self.pagination_mode == "keyset":
+            return JotformKeysetPaginator(page_size)
+        return JotformPaginator(0, page_size)
+
+    def request_pages(
+        self,
+        context: Context | None,
+        paginator: BaseAPIPaginator,
+    ) -> t.Iterator[requests.Response]:
+        """Request pages, prefetching the next offsets if enabled.
+
+        Offsets are predictable, so requests for the next ``prefetch_pages`` pages
+        are issued on a thread pool ahead of time. Responses are still yielded in
+        offset order, and outstanding requests are cancelled once the paginator
+        reports the last page.
+
+        Args:
+            context: The context object.
+            paginator: The paginator for this sync.
+
+        Yields:
+            One response per page.
+        """
+        # Only offsets can be predicted before the previous page arrives
+        if self.prefetch_pages <= 0 or not isinstance(paginator, JotformPaginator):
+            yield from super().request_pages(context, paginator)
+            return
+
+        page_size = self.get_page_size(context)
+        first = self.pop_prefetched(context)
+        offsets = itertools.count(
+            paginator.current_value + (page_size if first is not None else 0),
+            page_size,
+        )
+        with contextlib.closing(
+            self.request_ahead(
+                context,
+                offsets,
+                self.prefetch_pages,
+                "prefetch",
+                first=first,
+            ),
+        ) as responses:
+            for response in responses:
+                yield response
+                if paginator.finished:
+                    return
+
+    def get_url_params(
+        self,
+        context: Context | None,
+        next_page_token: int | SeekToken | None,
+    ) -> dict[str, t.Any]:
+        """Return a dictionary of values to be used in URL parameterization.
+
+        Args:
+            context: The context object.
+            next_page_token: The next page token.
+
+        Returns:
+            A dictionary of values to be used in URL parameterization.
+        """
+        sweep = self._active_sweeps.get(self._context_key(context))
+        if sweep is None:
+            sweep = self.get_sweeps(context)[0]
+
+        if isinstance(next_page_token, SeekToken):
+            if next_page_token.after is not None:
+                sweep = replace(sweep, after=next_page_token.after)
+            next_page_token = next_page_token.offset
+
+        params: dict[str, t.Any] = {
+            "limit": self.get_page_size(context),
+            "orderby": sweep.field,
+            "direction": "ASC",
+        }
+
+        if sweep.filter:
+            params["filter"] = json.dumps(sweep.filter)
+
+        if next_page_token:
+            params["offset"] = next_page_token
+
+        return params
+
+    def get_sweeps(self, context: Context | None) -> list[Sweep]:
+        """Return the sweeps needed to sync a context.
+
+        Jotform leaves ``updated_at`` empty until a record is first edited, so a
+        filter on ``updated_at`` alone would never return new records. Syncing
+        incrementally on ``updated_at`` thus takes two sweeps: one for records
+        created after the bookmark and one for records updated after it.
+
+        If ``backfill_window_days`` is set and there is no bookmark yet, records
+        created since the start date are requested in windows of that size.
+
+        Args:
+            context: The context object.
+
+        Returns:
+            A list of sweeps.
+        """
+        starting_value = self.get_starting_timestamp(context)
+        if not (starting_value and self.replication_key):
+            return [Sweep()]
+
+        after = format_datetime(starting_value)
+        if self.replication_key not in {"created_at", "updated_at"}:
+            return [Sweep(self.replication_key, after)]
+
+        state = self.get_context_state(context)
+        sweeps: list[Sweep]
+        if self.backfill_window and "replication_key_value" not in state:
+            if backfilled_until := state.get(self.BACKFILL_STATE_KEY):
+                starting_value = parse_datetime(backfilled_until)
+            sweeps = self.get_backfill_windows(starting_value, self.backfill_window)
+        else:
+            sweeps = [Sweep("created_at", after)]
+
+        if self.replication_key == "updated_at":
+            sweeps.append(Sweep("updated_at", after))
+        return sweeps
+
+    @staticmethod
+    def get_backfill_windows(
+        start: datetime.datetime,
+        size: datetime.timedelta,
+    ) -> list[Sweep]:
+        """Split the records created since a date into windows.
+
+        Windows are half-open: each one includes its start and excludes its end,
+        which is the start of the next one, so no record is in two windows. Dates
+        have a resolution of one second, so a window starting at ``lower`` takes
+        records created after ``lower`` minus a second. The last one is left open
+        so records created during the sync are not missed.
+
+        Args:
+            start: The start of the first window.
+            size: The size of each window.
+
+        Returns:
+            A list of sweeps, one per window.
+        """
+        one_second = datetime.timedelta(seconds=1)
+        now = utc_now()
+        bounds = [start]
+        while bounds[-1] + size < now:
+            bounds.append(bounds[-1] + size)
+        return [
+            Sweep(
+                "created_at",
+                after=format_datetime(lower - one_second),
+                before=format_datetime(upper) if upper else None,
+            )
+            for lower, upper in itertools.zip_longest(bounds, bounds[1:])
+        ]
+
+    def _iter_sweep(
+        self,
+        context: Context | None,
+        sweep: Sweep,
+        paginator: JotformPaginator | JotformKeysetPaginator | None = None,
+    ) -> t.Iterator[requests.Response]:
+        key = self._context_key(context)
+        self._active_sweeps[key] = sweep
+        if paginator is None:
+            paginator = self.get_new_paginator(self.get_page_size(context))
+        try:
+            for response in self.iter_pages(context, paginator):
+                self.after_parse(
+                    response,
+                    partial(self._save_resume_point, response, sweep, paginator),
+                )
+                yield response
+        finally:
+            self._active_sweeps.pop(key, None)
+
+    @staticmethod
+    def _save_resume_point(
+        response: requests.Response,
+        sweep: Sweep,
+        paginator: JotformPaginator | JotformKeysetPaginator,
+    ) -> None:
+        point: dict[str, t.Any] = {"field": sweep.field, "after": sweep.after}
+        if isinstance(paginator, JotformKeysetPaginator):
+            token = paginator.current_value
+            point["seek"] = {"after": token.after, "offset": token.offset}
+            point["last_value"] = paginator.last_value
+        else:
+            point["offset"] = paginator.current_value
+        setattr(response, _RESUME_ATTR, point)
+
+    def get_resume_paginator(
+        self,
+        context: Context | None,
+        sweeps: list[Sweep],
+    ) -> tuple[int, JotformPaginator | JotformKeysetPaginator | None]:
+        """Find where an interrupted sync of a context left off.
+
+        The maximum replication key value seen before the interruption is restored
+        as well, since the SDK discards progress markers when a new run starts.
+
+        Args:
+            context: The context object.
+            sweeps: The sweeps needed to sync the context.
+
+        Returns:
+            The index of the sweep to resume, and a paginator positioned at the
+            page after the last one synced, or None to start from the first page.
+        """
+        state = self.get_context_state(context)
+        point = state.get(self.RESUME_STATE_KEY)
+        if not point:
+            return 0, None
+
+        index = next(
+            (
+                index
+                for index, sweep in enumerate(sweeps)
+                if (sweep.field, sweep.after) == (point["field"], point["after"])
+            ),
+            None,
+        )
+        if index is None:
+            self.logger.warning("Ignoring resume point %s of a past sync", point)
+            state.pop(self.RESUME_STATE_KEY)
+            return 0, None
+
+        if (watermark := point.get("replication_key_value")) and self.replication_key:
+            self._increment_stream_state(
+                {self.replication_key: watermark},
+                context=context,
+            )
+
+        paginator: JotformPaginator | JotformKeysetPaginator
+        page_size = self.get_page_size(context)
+        if self.pagination_mode == "keyset":
+            seek = point.get("seek") or {"offset": point.get("offset", 0)}
+            paginator = JotformKeysetPaginator(
+                page_size,
+                SeekToken(**seek),
+                last_value=point.get("last_value"),
+            )
+        elif "offset" in point:
+            paginator = JotformPaginator(point["offset"], page_size)
+        else:
+            self.logger.warning(
+                "Cannot resume a keyset pagination with offsets, restarting the "
+                "%s sweep",
+                sweeps[index].field,
+            )
+            return index, None
+
+        self.logger.info("Resuming interrupted sync from %s", point)
+        return index, paginator
+
+    def checkpoint_page(
+        self,
+        context: Context | None,
+        response: requests.Response,
+    ) -> None:
+        """Save the position of the next page in state.
+
+        An interrupted sync of the context resumes from this page, instead of from
+        the bookmark.
+
+        Args:
+            context: The context object.
+            response: The response of the page.
+        """
+        point: dict[str, t.Any] | None = getattr(response, _RESUME_ATTR, None)
+        if point is None:
+            return
+
+        state = self.get_context_state(context)
+        watermark = state.get(PROGRESS_MARKERS, {}).get("replication_key_value")
+        if watermark is not None:
+            point = {**point, "replication_key_value": watermark}
+        state[self.RESUME_STATE_KEY] = point
+        self.write_checkpoint()
+
+    def prefetch(self, context: Context | None, executor: Executor) -> None:
+        """Start requesting the first page for a context in the background.
+
+        Contexts that resume an interrupted sync do not start at the first page,
+        and contexts with nothing to request have no first page, so neither is
+        prefetched.
+
+        Args:
+            context: The context object.
+            executor: The executor to submit the request to.
+        """
+        if self.RESUME_STATE_KEY in self.get_context_state(context):
+            return
+        if not self.get_sweeps(context):
+            return
+        super().prefetch(context, executor)
+
+    def _iter_concurrently(
+        self,
+        sources: list[t.Iterator[requests.Response]],
+    ) -> t.Iterator[t.Iterator[requests.Response]]:
+        """Paginate several sweeps at once, yielding their pages in order.
+
+        Each sweep is paginated on its own worker thread, up to
+        ``max_parallel_windows`` at a time, and hands its responses over through a
+        bounded queue. The caller consumes the sweeps one after the other.
+
+        Args:
+            sources: The pages of each sweep.
+
+        Yields:
+            An iterator over the pages of each sweep, in order.
+        """
+        stop = threading.Event()
+        channels = [_PageChannel(max(self.prefetch_pages, 1), stop) for _ in sources]
+
+        # Create the session before it is shared with the workers
+        _ = self.requests_session
+        executor = ThreadPoolExecutor(
+            max_workers=self.max_parallel_windows,
+            thread_name_prefix=f"{self.name}-windows",
+        )
+        try:
+            for source, channel in zip(sources, channels):
+                executor.submit(channel.fill, source)
+            for channel in channels:
+                yield iter(channel)
+        finally:
+            stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def complete_sweep(self, context: Context | None, sweep: Sweep) -> None:
+        """Checkpoint a fully synced sweep.
+
+        Backfill windows are synced in order, so the end of the last one synced
+        is saved in state. An interrupted initial load resumes from there.
+
+        Args:
+            context: The context object.
+            sweep: The sweep that was synced.
+        """
+        if sweep.before is None:
+            return
+
+        state = self.get_context_state(context)
+        state[self.BACKFILL_STATE_KEY] = sweep.before
+        state.pop(self.RESUME_STATE_KEY, None)
+        self.write_checkpoint()
+
+    def request_records(self, context: Context | None) -> t.Iterable[dict]:
+        """Request records from the API, one sweep at a time.
+
+        Backfill windows do not overlap, and the ``updated_at`` sweep skips
+        records created after the lower bound of the ``created_at`` sweeps, which
+        already returned them, so each record is yielded once. An interrupted sync
+        resumes from the last page it synced.
+
+        Args:
+            context: The context object.
+
+        Yields:
+            An item for every record in the response.
+        """
+        sweeps = self.get_sweeps(context)
+        created_after = next(
+            (sweep.after for sweep in sweeps if sweep.field == "created_at"),
+            None,
+        )
+        start, paginator = self.get_resume_paginator(context, sweeps)
+        sweeps = sweeps[start:]
+
+        sources = [
+            self._iter_sweep(context, sweep, paginator if index == 0 else None)
+            for index, sweep in enumerate(sweeps)
+        ]
+        pages_by_sweep: t.Iterator[t.Iterator[requests.Response]]
+        # Workers paginate ahead of the consumer, which pages do not allow when
+        # they only advance the paginator once their records are consumed
+        if (
+            self.max_parallel_windows > 1
+            and len(sweeps) > 1
+            and not self.stream_responses
+            and not self._transform_in_workers
+        ):
+            pages_by_sweep = self._iter_concurrently(sources)
+        else:
+            pages_by_sweep = iter(sources)
+
+        try:
+            for sweep, pages in zip(sweeps, pages_by_sweep):
+                if sweep.filter:
+                    self.logger.info(
+                        "Requesting records with filter %(filter)s",
+                        extra={"filter": sweep.filter},
+                    )
+                for record in self.records_from_pages(context, pages):
+                    if (
+                        sweep.field == "updated_at"
+                        and created_after is not None
+                        and (record.get("created_at") or "") > created_after
+                    ):
+                        continue
+                    yield record
+                self.complete_sweep(context, sweep)
+        except RequestBudgetExhaustedError as exc:
+            self.stop_sync(context, exc)
+            return
+
+        state = self.get_context_state(context)
+        state.pop(self.BACKFILL_STATE_KEY, None)
+        state.pop(self.RESUME_STATE_KEY, None)
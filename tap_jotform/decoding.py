@@ -0,0 +1,263 @@
+"""JSON decoding of Jotform API responses."""
+
+from __future__ import annotations
+
+import codecs
+import json
+import time
+import typing as t
+
+if t.TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+    import requests
+
+_PAYLOAD_ATTR = "_jotform_payload"
+_SIZE_ATTR = "_jotform_size"
+_DECODE_ATTR = "_jotform_decode_seconds"
+
+#: Number of bytes read from the network at a time when streaming a response.
+STREAM_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\n\r"
+
+
+def _get_loads() -> tuple[str, t.Callable[[bytes | str], t.Any]]:
+    """Pick the fastest JSON decoder available at runtime.
+
+    Returns:
+        The backend name and its decode function.
+    """
+    try:
+        import orjson
+    except ImportError:
+        pass
+    else:
+        return "orjson", orjson.loads
+
+    try:
+        import msgspec  # type: ignore[import-not-found]
+    except ImportError:
+        pass
+    else:
+        return "msgspec", msgspec.json.Decoder().decode
+
+    return "json", json.loads
+
+
+BACKEND, _loads = _get_loads()
+
+
+def loads(data: bytes | str) -> t.Any:  # noqa: ANN401
+    """Decode a JSON document with the selected backend.
+
+    Args:
+        data: The raw JSON document.
+
+    Returns:
+        The decoded document.
+    """
+    return _loads(data)
+
+
+def decode_response(response: requests.Response) -> dict[str, t.Any]:
+    """Return the decoded payload of a response, decoding it at most once.
+
+    The payload is cached on the response object, so the paginator, logging and
+    record extraction can all read from it without parsing the body again.
+
+    Args:
+        response: The response object.
+
+    Returns:
+        The decoded response payload.
+    """
+    payload: dict[str, t.Any] | None = getattr(response, _PAYLOAD_ATTR, None)
+    if payload is None:
+        content = response.content
+        start = time.perf_counter()
+        payload = loads(content)
+        setattr(response, _DECODE_ATTR, time.perf_counter() - start)
+        setattr(response, _PAYLOAD_ATTR, payload)
+    return payload
+
+
+class _StreamReader:
+    """Decode JSON values one at a time from a stream of byte chunks."""
+
+    def __init__(self, chunks: Iterator[bytes]) -> None:
+        self._chunks = chunks
+        self.size = 0
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+
+    def _read(self, min_size: int = 0) -> bool:
+        """Append chunks to the buffer until it holds ``min_size`` characters.
+
+        Returns:
+            False if the end of the stream was reached before reading anything.
+        """
+        text = self._buffer[self._pos :]
+        size = len(text)
+        for chunk in self._chunks:
+            self.size += len(chunk)
+            text += self._text.decode(chunk)
+            if len(text) > max(size, min_size):
+                break
+        else:
+            text += self._text.decode(b"", final=True)
+
+        self._buffer, self._pos = text, 0
+        return len(text) > size
+
+    def peek(self) -> str:
+        """Return the next character that is not whitespace, without consuming it.
+
+        Raises:
+            ValueError: If the stream ends.
+        """
+        while True:
+            while (
+                self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE
+            ):
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._read():
+                msg = "Unexpected end of JSON document"
+                raise ValueError(msg)
+
+    def expect(self, *chars: str) -> str:
+        """Consume the next character, which must be one of ``chars``.
+
+        Raises:
+            ValueError: If the next character is not expected.
+        """
+        char = self.peek()
+        if char not in chars:
+            msg = f"Expected one of {chars!r} at position {self._pos}, got {char!r}"
+            raise ValueError(msg)
+        self._pos += 1
+        return char
+
+    def value(self) -> t.Any:  # noqa: ANN401
+        """Decode the next value, reading more of the stream as needed."""
+        self.peek()
+        while True:
+            remaining = len(self._buffer) - self._pos
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                # The value is cut at the end of the buffer, so read at least as
+                # much again. Growing the buffer geometrically bounds re-parsing.
+                if self._read(2 * remaining):
+                    continue
+                raise
+            # A number at the very end of the buffer may continue in the next chunk
+            if end == len(self._buffer) and self._read(2 * remaining):
+                continue
+            self._pos = end
+            return value
+
+
+def stream_content(
+    response: requests.Response,
+    keep: Sequence[str] = (),
+) -> Iterator[t.Any]:
+    """Yield the records of a response as its body is downloaded.
+
+    Items of the ``content`` array are decoded and yielded one at a time, so a
+    page is never held in memory as a whole. A ``content`` object is yielded as a
+    single record. Once the body has been read, the rest of the payload, such as
+    ``resultSet`` and ``limit-left``, is cached on the response for
+    :func:`decode_response`, with ``content`` reduced to the ``keep`` fields of
+    each record.
+
+    Args:
+        response: A response, ideally sent with ``stream=True``.
+        keep: Record fields to keep in the cached payload.
+
+    Yields:
+        The records of the response.
+    """
+    reader = _StreamReader(response.iter_content(STREAM_CHUNK_SIZE))
+    payload: dict[str, t.Any] = {}
+    # Time spent by the consumer on each record is not decoding time
+    elapsed = 0.0
+    start = time.perf_counter()
+
+    reader.expect("{")
+    separator = "}" if reader.peek() == "}" else ","
+    while separator == ",":
+        key = reader.value()
+        reader.expect(":")
+        if key == "content" and reader.peek() == "[":
+            reader.expect("[")
+            kept: list[dict[str, t.Any]] = []
+            item_separator = reader.expect("]") if reader.peek() == "]" else ","
+            while item_separator == ",":
+                record = reader.value()
+                if keep:
+                    kept.append({field: record.get(field) for field in keep})
+                elapsed += time.perf_counter() - start
+                yield record
+                start = time.perf_counter()
+                item_separator = reader.expect(",", "]")
+            payload[key] = kept
+        else:
+            payload[key] = reader.value()
+            if key == "content":
+                elapsed += time.perf_counter() - start
+                yield payload[key]
+                start = time.perf_counter()
+        separator = reader.expect(",", "}")
+
+    setattr(response, _DECODE_ATTR, elapsed + time.perf_counter() - start)
+    setattr(response, _PAYLOAD_ATTR, payload)
+    setattr(response, _SIZE_ATTR, reader.size)
+
+
+def set_payload(
+    response: requests.Response,
+    payload: dict[str, t.Any],
+    seconds: float = 0.0,
+) -> None:
+    """Cache a payload decoded elsewhere, for :func:`decode_response`.
+
+    Args:
+        response: The response object.
+        payload: The decoded payload.
+        seconds: Time spent decoding the body.
+    """
+    setattr(response, _PAYLOAD_ATTR, payload)
+    setattr(response, _DECODE_ATTR, seconds)
+
+
+def response_size(response: requests.Response) -> int:
+    """Return the size of a response body in bytes.
+
+    Args:
+        response: A response, read in full or with :func:`stream_content`.
+
+    Returns:
+        The number of bytes in the body.
+    """
+    size: int | None = getattr(response, _SIZE_ATTR, None)
+    return len(response.content) if size is None else size
+
+
+def decode_seconds(response: requests.Response) -> float:
+    """Return the time spent decoding a response body.
+
+    For streamed responses, this includes reading the body from the network.
+
+    Args:
+        response: A response, decoded with :func:`decode_response` or
+            :func:`stream_content`.
+
+    Returns:
+        The number of seconds, or 0 if the body was not decoded.
+    """
+    return getattr(response, _DECODE_ATTR, 0.0)
@@ -0,0 +1,364 @@
+"""Asynchronous HTTP engine, sending requests as coroutines on one event loop."""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import datetime
+import threading
+import time
+import typing as t
+from concurrent.futures import Executor, Future
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+if t.TYPE_CHECKING:
+    from collections.abc import Awaitable, Coroutine
+
+    import aiohttp
+
+    from tap_jotform.session import ConnectionStats
+
+_T = t.TypeVar("_T")
+
+#: Timeout accepted by requests: seconds, or a (connect, read) pair.
+Timeout = t.Union[float, tuple[float, float], tuple[float, None], None]
+
+
+class AsyncEngine:
+    """Send HTTP requests as coroutines over a single connection pool.
+
+    An event loop runs on a background thread, with an aiohttp session that keeps
+    at most ``pool_size`` connections open. Requests are awaited from coroutines
+    submitted to that loop, or sent from any thread through
+    :class:`AsyncHTTPAdapter`. Responses are read in full and returned as
+    ``requests`` responses, so they are validated, decoded and paginated the same
+    way whichever engine sent them.
+    """
+
+    def __init__(
+        self,
+        *,
+        stats: ConnectionStats,
+        pool_size: int = 10,
+        keep_alive: bool = True,
+        retries: int = 0,
+    ) -> None:
+        """Start the event loop and create the HTTP session.
+
+        Args:
+            stats: Counters of requests and connections to update.
+            pool_size: Maximum number of connections open at once.
+            keep_alive: Whether to reuse connections between requests.
+            retries: Number of times to retry a request that failed to connect.
+
+        Raises:
+            RuntimeError: If aiohttp is not installed.
+        """
+        try:
+            import aiohttp
+            import yarl
+        except ImportError as exc:
+            msg = (
+                "The aiohttp HTTP engine requires the aiohttp package, installed "
+                "with the tap-jotform[aiohttp] extra"
+            )
+            raise RuntimeError(msg) from exc
+
+        self._aiohttp = aiohttp
+        self._yarl = yarl
+        self.stats = stats
+        self.pool_size = pool_size
+        self.keep_alive = keep_alive
+        self.retries = retries
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever,
+            name="jotform-http",
+            daemon=True,
+        )
+        self._thread.start()
+        # The session must be created on the loop it runs on
+        self._session = self.run(self._create_session())
+
+    async def _create_session(self) -> aiohttp.ClientSession:
+        aiohttp = self._aiohttp
+
+        async def on_connection_create_end(*_: t.Any) -> None:
+            self.stats.add_connection()
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=self.pool_size,
+                force_close=not self.keep_alive,
+            ),
+            trace_configs=[trace_config],
+            # Requests are sent with the headers prepared by requests
+            skip_auto_headers=("User-Agent",),
+        )
+
+    def submit(self, coroutine: Coroutine[t.Any, t.Any, _T]) -> Future[_T]:
+        """Schedule a coroutine on the event loop.
+
+        Args:
+            coroutine: The coroutine to run.
+
+        Returns:
+            A future for its result, which may be awaited from any thread.
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+
+    def run(self, coroutine: Coroutine[t.Any, t.Any, _T]) -> _T:
+        """Run a coroutine on the event loop and wait for its result.
+
+        Args:
+            coroutine: The coroutine to run.
+
+        Returns:
+            The result of the coroutine.
+
+        Raises:
+            RuntimeError: If called from the event loop, which would deadlock.
+        """
+        if threading.current_thread() is self._thread:
+            coroutine.close()
+            msg = "Cannot wait for a request from the event loop of the engine"
+            raise RuntimeError(msg)
+        return self.submit(coroutine).result()
+
+    async def send(
+        self,
+        request: requests.PreparedRequest,
+        *,
+        timeout: Timeout = None,
+        allow_redirects: bool = True,
+    ) -> requests.Response:
+        """Send a request, retrying it if it failed to connect.
+
+        Transport errors are raised as their ``requests`` equivalents, so the
+        streams retry them the same way as with the default engine.
+
+        Args:
+            request: The request to send.
+            timeout: The request timeout, as accepted by ``requests``.
+            allow_redirects: Whether to follow redirects.
+
+        Returns:
+            The response, with its body read.
+
+        Raises:
+            ConnectTimeout: If connecting timed out.
+            ReadTimeout: If reading the response timed out.
+            ChunkedEncodingError: If the response body is malformed.
+            ConnectionError: On any other transport error.
+        """
+        aiohttp = self._aiohttp
+        connect, read = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+        client_timeout = aiohttp.ClientTimeout(sock_connect=connect, sock_read=read)
+        # The URL is already quoted by requests
+        url = self._yarl.URL(request.url or "", encoded=True)
+
+        for attempt in range(self.retries + 1):
+            try:
+                start = time.perf_counter()
+                async with self._session.request(
+                    request.method or "GET",
+                    url,
+                    headers=dict(request.headers),
+                    data=request.body,
+                    timeout=client_timeout,
+                    allow_redirects=allow_redirects,
+                ) as response:
+                    content = await response.read()
+                break
+            except aiohttp.ClientConnectorError as exc:
+                if attempt < self.retries:
+                    continue
+                raise requests.exceptions.ConnectionError(exc, request=request) from exc
+            except aiohttp.ConnectionTimeoutError as exc:
+                raise requests.exceptions.ConnectTimeout(exc, request=request) from exc
+            except asyncio.TimeoutError as exc:
+                raise requests.exceptions.ReadTimeout(exc, request=request) from exc
+            except aiohttp.ClientPayloadError as exc:
+                raise requests.exceptions.ChunkedEncodingError(
+                    exc,
+                    request=request,
+                ) from exc
+            except aiohttp.ClientError as exc:
+                raise requests.exceptions.ConnectionError(exc, request=request) from exc
+
+        self.stats.add_request()
+        return _to_requests_response(
+            request,
+            response,
+            content,
+            datetime.timedelta(seconds=time.perf_counter() - start),
+        )
+
+    def close(self) -> None:
+        """Close all connections and stop the event loop."""
+        if not self._thread.is_alive():
+            return
+        self.run(self._session.close())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+
+def _to_requests_response(
+    request: requests.PreparedRequest,
+    response: aiohttp.ClientResponse,
+    content: bytes,
+    elapsed: datetime.timedelta,
+) -> requests.Response:
+    result = requests.Response()
+    result.status_code = response.status
+    result.reason = response.reason or ""
+    result.headers = CaseInsensitiveDict(
+        {key: ", ".join(response.headers.getall(key)) for key in response.headers}
+    )
+    result.encoding = get_encoding_from_headers(result.headers)
+    result.url = str(response.url)
+    result.request = request
+    result.elapsed = elapsed
+    result._content = content  # noqa: SLF001
+    result._content_consumed = True  # type: ignore[attr-defined]  # noqa: SLF001
+    return result
+
+
+class AsyncHTTPAdapter(BaseAdapter):
+    """Send the requests of a ``requests`` session through an async engine.
+
+    Requests made from a thread wait for their response, while sharing the
+    connections of the engine with the requests it sends as coroutines.
+    """
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        """Create a new adapter.
+
+        Args:
+            engine: The engine to send requests with.
+        """
+        super().__init__()
+        self.engine = engine
+
+    def send(  # noqa: PLR0913
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,  # noqa: ARG002, FBT001, FBT002
+        timeout: Timeout = None,
+        verify: bool | str = True,  # noqa: ARG002, FBT002
+        cert: t.Any = None,  # noqa: ANN401, ARG002
+        proxies: t.Mapping[str, str] | None = None,  # noqa: ARG002
+    ) -> requests.Response:
+        """Send a request and wait for the response.
+
+        Redirects are followed by the session, as with the default adapter.
+
+        Args:
+            request: The request to send.
+            stream: Ignored, response bodies are always read in full.
+            timeout: The request timeout.
+            verify: Ignored, certificates are always verified.
+            cert: Ignored.
+            proxies: Ignored.
+
+        Returns:
+            The response.
+        """
+        return self.engine.run(
+            self.engine.send(request, timeout=timeout, allow_redirects=False),
+        )
+
+    def close(self) -> None:
+        """Leave the connections open, they are owned by the engine."""
+
+
+class AsyncRequestExecutor(Executor):
+    """Run coroutine functions on the event loop of an engine, a few at a time.
+
+    This takes the place of the thread pools that streams use to request pages
+    ahead of time. :meth:`submit` takes a coroutine function rather than a
+    function, and at most ``max_in_flight`` of its coroutines run at once. No
+    thread is held while a request is in flight.
+    """
+
+    def __init__(self, engine: AsyncEngine, max_in_flight: int) -> None:
+        """Create a new executor.
+
+        Args:
+            engine: The engine whose event loop runs the coroutines.
+            max_in_flight: Maximum number of coroutines running at once.
+        """
+        self.engine = engine
+        self.max_in_flight = max_in_flight
+        self._futures: set[Future[t.Any]] = set()
+        self._semaphore: asyncio.Semaphore | None = None
+        self._shutdown = False
+        self._lock = threading.Lock()
+
+    def submit(  # type: ignore[override]
+        self,
+        fn: t.Callable[..., Awaitable[_T]],
+        /,
+        *args: t.Any,
+        **kwargs: t.Any,
+    ) -> Future[_T]:
+        """Schedule a call of a coroutine function.
+
+        Args:
+            fn: The coroutine function.
+            args: Positional arguments for the function.
+            kwargs: Keyword arguments for the function.
+
+        Returns:
+            A future for the result of the call.
+
+        Raises:
+            RuntimeError: If the executor was shut down.
+        """
+        with self._lock:
+            if self._shutdown:
+                msg = "Cannot schedule new futures after shutdown"
+                raise RuntimeError(msg)
+            future = self.engine.submit(self._run(fn, *args, **kwargs))
+            self._futures.add(future)
+        future.add_done_callback(self._discard)
+        return future
+
+    async def _run(
+        self,
+        fn: t.Callable[..., Awaitable[_T]],
+        *args: t.Any,
+        **kwargs: t.Any,
+    ) -> _T:
+        # Coroutines all run on the event loop thread, so this cannot race
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_in_flight)
+        async with self._semaphore:
+            return await fn(*args, **kwargs)
+
+    def _discard(self, future: Future[t.Any]) -> None:
+        with self._lock:
+            self._futures.discard(future)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:  # noqa: FBT001, FBT002
+        """Stop accepting calls, and cancel or wait for the pending ones.
+
+        Args:
+            wait: Whether to wait for the pending calls to finish.
+            cancel_futures: Whether to cancel the pending calls.
+        """
+        with self._lock:
+            self._shutdown = True
+            futures = list(self._futures)
+        if cancel_futures:
+            for future in futures:
+                future.cancel()
+        if wait:
+            concurrent.futures.wait(futures)
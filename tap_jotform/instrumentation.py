@@ -0,0 +1,220 @@
+"""Performance metrics of API requests and record processing."""
+
+from __future__ import annotations
+
+import json
+import math
+import threading
+import typing as t
+from bisect import bisect_left
+
+if t.TYPE_CHECKING:
+    import logging
+    from collections.abc import Iterable, Sequence
+
+#: Upper bounds, in seconds, of the buckets of request latency histograms.
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, math.inf)
+
+
+def log_point(
+    logger: logging.Logger,
+    metric_type: str,
+    metric: str,
+    value: t.Any,  # noqa: ANN401
+    tags: dict[str, t.Any],
+) -> None:
+    """Log a measurement in the same format as the SDK metrics.
+
+    Args:
+        logger: The metrics logger.
+        metric_type: The kind of measurement, such as ``timer`` or ``gauge``.
+        metric: The name of the metric.
+        value: The measured value.
+        tags: Attributes of the measurement.
+    """
+    point = {"type": metric_type, "metric": metric, "value": value, "tags": tags}
+    logger.info("METRIC: %s", json.dumps(point, default=str))
+
+
+class Histogram:
+    """Count observations in fixed buckets."""
+
+    def __init__(self, bounds: Sequence[float] = LATENCY_BUCKETS) -> None:
+        """Create an empty histogram.
+
+        Args:
+            bounds: Increasing upper bounds of the buckets. The last one should be
+                infinite, so every observation falls in a bucket.
+        """
+        self.bounds = tuple(bounds)
+        self.counts = [0] * len(self.bounds)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        """Add an observation.
+
+        Args:
+            value: The observed value.
+        """
+        self.counts[min(bisect_left(self.bounds, value), len(self.counts) - 1)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile, as the upper bound of the bucket it falls in.
+
+        Args:
+            q: The quantile, between 0 and 1.
+
+        Returns:
+            The estimated value, at most the largest observation.
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+
+class StreamMetrics:
+    """Performance metrics of one stream.
+
+    Every page is logged to the metrics logger as it is received, and totals are
+    kept for the summary logged at the end of the run. Requests and retries may be
+    counted from any thread. Post-processing time is only added from the thread
+    syncing the stream.
+    """
+
+    def __init__(self, stream_name: str, logger: logging.Logger) -> None:
+        """Create empty metrics for a stream.
+
+        Args:
+            stream_name: The name of the stream.
+            logger: The metrics logger.
+        """
+        self.stream_name = stream_name
+        self.logger = logger
+        self.latency = Histogram()
+        self.requests = 0
+        self.response_bytes = 0
+        self.decode_seconds = 0.0
+        self.post_process_seconds = 0.0
+        self.records = 0
+        self.cache_hits = 0
+        self.retries = 0
+        self.limit_left: int | None = None
+        self._lock = threading.Lock()
+
+    def observe_page(  # noqa: PLR0913
+        self,
+        *,
+        endpoint: str,
+        seconds: float,
+        size_bytes: int,
+        decode_seconds: float,
+        records: int,
+        from_cache: bool,
+        limit_left: int | None,
+    ) -> None:
+        """Record and log a page received from the API.
+
+        Args:
+            endpoint: The path of the request.
+            seconds: Time until the response headers were received.
+            size_bytes: Size of the response body.
+            decode_seconds: Time spent decoding the body.
+            records: Number of records in the page.
+            from_cache: Whether the response came from the HTTP cache.
+            limit_left: The remaining daily API quota, if reported.
+        """
+        with self._lock:
+            self.latency.observe(seconds)
+            self.requests += 1
+            self.response_bytes += size_bytes
+            self.decode_seconds += decode_seconds
+            self.records += records
+            self.cache_hits += from_cache
+            if limit_left is not None:
+                self.limit_left = limit_left
+
+        tags = {"stream": self.stream_name, "endpoint": endpoint}
+        log_point(
+            self.logger,
+            "timer",
+            "jotform_page",
+            seconds,
+            {
+                **tags,
+                "response_bytes": size_bytes,
+                "decode_seconds": decode_seconds,
+                "records": records,
+                "from_cache": from_cache,
+            },
+        )
+        if limit_left is not None:
+            log_point(self.logger, "gauge", "jotform_limit_left", limit_left, tags)
+
+    def add_retry(self) -> None:
+        """Count a request that is retried."""
+        with self._lock:
+            self.retries += 1
+
+    def summary(self) -> dict[str, t.Any]:
+        """Return the totals of the stream.
+
+        Returns:
+            A row of the summary table.
+        """
+        with self._lock:
+            return {
+                "stream": self.stream_name,
+                "requests": self.requests,
+                "request_s": self.latency.total,
+                "p50_s": self.latency.quantile(0.5),
+                "p95_s": self.latency.quantile(0.95),
+                "max_s": self.latency.max,
+                "decode_s": self.decode_seconds,
+                "post_process_s": self.post_process_seconds,
+                "records": self.records,
+                "records_per_page": self.records / self.requests
+                if self.requests
+                else 0,
+                "mb": self.response_bytes / 1024 / 1024,
+                "cache_hits": self.cache_hits,
+                "retries": self.retries,
+            }
+
+
+def format_summary(rows: Iterable[dict[str, t.Any]]) -> str:
+    """Format stream summaries as a table.
+
+    Args:
+        rows: The summary of each stream.
+
+    Returns:
+        The table, one line per stream.
+    """
+    lines: list[list[str]] = []
+    for row in rows:
+        cells = {
+            key: f"{value:.3f}" if isinstance(value, float) else str(value)
+            for key, value in row.items()
+        }
+        if not lines:
+            lines.append(list(cells))
+        lines.append(list(cells.values()))
+    if not lines:
+        return ""
+
+    widths = [max(len(line[index]) for line in lines) for index in range(len(lines[0]))]
+    return "\n".join(
+        "  ".join(cell.rjust(width) for cell, width in zip(line, widths))
+        for line in lines
+    )
@@ -0,0 +1,142 @@
+"""Buffered writing of Singer messages to stdout."""
+
+from __future__ import annotations
+
+import sys
+import threading
+import typing as t
+from decimal import Decimal
+
+from singer_sdk._singerlib import SingerMessageType
+from singer_sdk._singerlib.json import serialize_json
+
+if t.TYPE_CHECKING:
+    from singer_sdk._singerlib import Message
+
+#: Default number of bytes buffered before they are written to stdout.
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+
+
+def _default(obj: t.Any) -> str:  # noqa: ANN401
+    # Decimals must be written as numbers, which only the SDK serializer does
+    if isinstance(obj, Decimal):
+        raise TypeError
+    return str(obj)
+
+
+def _get_dumps() -> tuple[str, t.Callable[[t.Any], bytes]]:
+    """Pick the fastest JSON encoder available at runtime.
+
+    Returns:
+        The backend name and its encode function.
+    """
+    try:
+        import orjson
+    except ImportError:
+        pass
+    else:
+
+        def dumps(obj: t.Any) -> bytes:  # noqa: ANN401
+            return orjson.dumps(obj, default=_default)
+
+        return "orjson", dumps
+
+    try:
+        import msgspec  # type: ignore[import-not-found]
+    except ImportError:
+        pass
+    else:
+        return "msgspec", msgspec.json.Encoder(enc_hook=_default).encode
+
+    return "json", lambda obj: serialize_json(obj).encode()
+
+
+BACKEND, _dumps = _get_dumps()
+
+
+def dumps(obj: t.Any) -> bytes:  # noqa: ANN401
+    """Serialize an object into a line of JSON, without the line break.
+
+    Objects the selected encoder cannot serialize, such as records holding
+    decimals, are serialized by the SDK instead.
+
+    Args:
+        obj: A JSON-compatible object.
+
+    Returns:
+        The encoded object.
+    """
+    try:
+        return _dumps(obj)
+    except TypeError:
+        return serialize_json(obj).encode()
+
+
+def serialize_message(message: Message) -> bytes:
+    """Serialize a message into a line of JSON, without the line break.
+
+    Args:
+        message: A Singer message.
+
+    Returns:
+        The encoded message.
+    """
+    return dumps(message.to_dict())
+
+
+class BufferedSingerWriter:
+    """Write Singer messages to stdout in large chunks.
+
+    Messages are serialized with the fastest JSON encoder available and appended
+    to a buffer, which is written to stdout once it holds ``buffer_size`` bytes,
+    after every STATE message, and when :meth:`flush` is called. Messages are
+    written in the order they were received, and a STATE message is never
+    written before the records that precede it.
+    """
+
+    def __init__(self, buffer_size: int = DEFAULT_BUFFER_SIZE) -> None:
+        """Create a new writer.
+
+        Args:
+            buffer_size: Number of bytes to buffer before writing to stdout.
+        """
+        self.buffer_size = buffer_size
+        self._buffer = bytearray()
+        self._lock = threading.Lock()
+
+    def write_message(self, message: Message) -> None:
+        """Buffer a message, and write the buffer if it is full.
+
+        Args:
+            message: The message to write.
+        """
+        data = serialize_message(message)
+        with self._lock:
+            self._buffer += data
+            self._buffer += b"\n"
+            if (
+                message.type == SingerMessageType.STATE
+                or len(self._buffer) >= self.buffer_size
+            ):
+                self._write()
+
+    def flush(self) -> None:
+        """Write all buffered messages to stdout."""
+        with self._lock:
+            self._write()
+
+    def _write(self) -> None:
+        if not self._buffer:
+            return
+
+        stdout = sys.stdout
+        binary: t.BinaryIO | None = getattr(stdout, "buffer", None)
+        if binary is None:
+            stdout.write(self._buffer.decode())
+            stdout.flush()
+        else:
+            # Text written to stdout before must come out first
+            stdout.flush()
+            binary.write(self._buffer)
+            binary.flush()
+        self._buffer.clear()
@@ -0,0 +1,146 @@
+"""Tap-wide scheduling of Jotform API requests."""
+
+from __future__ import annotations
+
+import threading
+import time
+import typing as t
+from collections import Counter
+
+if t.TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+class RequestBudgetExhaustedError(Exception):
+    """Raised when no more requests may be issued in this run."""
+
+
+class RequestScheduler:
+    """Schedule requests from all streams against the Jotform API quota.
+
+    Every request must call :meth:`acquire` before it is sent. Requests are paced
+    to at most ``max_requests_per_second`` and are granted in arrival order, so
+    concurrent streams share the rate evenly. The remaining daily quota is
+    tracked from the ``limit-left`` field of each response. Once it drops to
+    ``min_limit_left``, or the ``request_budget`` for the run is used up, no more
+    requests are granted. The quota is only a hard stop: requests are not slowed
+    down as it runs low, since the API does not report when it resets.
+    """
+
+    def __init__(
+        self,
+        *,
+        request_budget: int | None = None,
+        min_limit_left: int = 0,
+        max_requests_per_second: float | None = None,
+        clock: t.Callable[[], float] = time.monotonic,
+        sleep: t.Callable[[float], None] = time.sleep,
+    ) -> None:
+        """Create a new scheduler.
+
+        Args:
+            request_budget: Maximum number of requests to issue in this run.
+            min_limit_left: Daily quota to leave untouched.
+            max_requests_per_second: Maximum request rate across all streams.
+            clock: Monotonic clock function.
+            sleep: Sleep function.
+        """
+        self.request_budget = request_budget
+        self.min_limit_left = min_limit_left
+        self.interval = 1 / max_requests_per_second if max_requests_per_second else 0
+        self.limit_left: int | None = None
+        self.requests: Counter[str] = Counter()
+
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, t.Any]) -> RequestScheduler:
+        """Create a scheduler from the tap configuration.
+
+        Args:
+            config: The tap configuration.
+
+        Returns:
+            A new scheduler.
+        """
+        return cls(
+            request_budget=config.get("request_budget"),
+            min_limit_left=config.get("min_limit_left") or 0,
+            max_requests_per_second=config.get("max_requests_per_second"),
+        )
+
+    @property
+    def total_requests(self) -> int:
+        """Return the number of requests granted so far.
+
+        Returns:
+            The number of requests granted.
+        """
+        return sum(self.requests.values())
+
+    def acquire(self, stream_name: str) -> None:
+        """Wait for a slot to send a request.
+
+        Args:
+            stream_name: The name of the stream sending the request.
+        """
+        if (delay := self.reserve(stream_name)) > 0:
+            self._sleep(delay)
+
+    def reserve(self, stream_name: str) -> float:
+        """Reserve a slot to send a request, without waiting for it.
+
+        Coroutines use this to wait for their slot without blocking the event loop.
+
+        Args:
+            stream_name: The name of the stream sending the request.
+
+        Returns:
+            The number of seconds to wait before sending the request.
+
+        Raises:
+            RequestBudgetExhaustedError: If no more requests may be sent.
+        """
+        with self._lock:
+            if (
+                self.request_budget is not None
+                and self.total_requests >= self.request_budget
+            ):
+                msg = f"Request budget of {self.request_budget} requests exhausted"
+                raise RequestBudgetExhaustedError(msg)
+
+            if self.limit_left is not None and self.limit_left <= self.min_limit_left:
+                msg = (
+                    f"Only {self.limit_left} requests left in the daily quota, "
+                    f"keeping {self.min_limit_left} in reserve"
+                )
+                raise RequestBudgetExhaustedError(msg)
+
+            now = self._clock()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+            self.requests[stream_name] += 1
+            if self.limit_left is not None:
+                self.limit_left -= 1
+
+        return slot - now
+
+    def update(self, limit_left: int | str | None) -> None:
+        """Record the remaining daily quota reported by the API.
+
+        Responses may arrive out of order when requests run concurrently, so the
+        lowest value seen is kept.
+
+        Args:
+            limit_left: The ``limit-left`` value of a response.
+        """
+        if limit_left is None:
+            return
+
+        with self._lock:
+            value = int(limit_left)
+            if self.limit_left is None or value < self.limit_left:
+                self.limit_left = value
@@ -0,0 +1,389 @@
+"""HTTP sessions shared by all streams of the tap."""
+
+from __future__ import annotations
+
+import threading
+import typing as t
+from collections import Counter, OrderedDict
+
+import requests
+import requests_cache
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests_cache.backends.base import BaseCache, DictStorage
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+
+from tap_jotform.engine import AsyncEngine, AsyncHTTPAdapter
+
+if t.TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from requests_cache import ExpirationPatterns
+
+#: Request parameters and headers left out of cache keys and stored responses.
+CACHE_IGNORED_PARAMETERS = ("APIKEY", "apiKey", "User-Agent")
+
+
+class LRUDict(DictStorage):
+    """In-memory storage that evicts the least recently used items."""
+
+    def __init__(
+        self,
+        *args: t.Any,
+        max_entries: int | None = None,
+        **kwargs: t.Any,
+    ) -> None:
+        """Create a new storage.
+
+        Args:
+            args: Positional arguments for the parent class.
+            max_entries: Maximum number of items to keep, or None for no limit.
+            kwargs: Keyword arguments for the parent class.
+        """
+        super().__init__(*args, **kwargs)
+        self.data: OrderedDict[t.Any, t.Any] = OrderedDict(self.data)
+        self.max_entries = max_entries
+        self._lock = threading.RLock()
+
+    def __getitem__(self, key: t.Any) -> t.Any:  # noqa: ANN401
+        """Return an item and mark it as recently used."""
+        with self._lock:
+            value = super().__getitem__(key)
+            self.data.move_to_end(key)
+            return value
+
+    def __setitem__(self, key: t.Any, value: t.Any) -> None:  # noqa: ANN401
+        """Store an item, evicting the least recently used ones past the limit."""
+        with self._lock:
+            super().__setitem__(key, value)
+            self.data.move_to_end(key)
+            while self.max_entries is not None and len(self.data) > self.max_entries:
+                self.data.popitem(last=False)
+
+    def __delitem__(self, key: t.Any) -> None:  # noqa: ANN401
+        """Remove an item."""
+        with self._lock:
+            super().__delitem__(key)
+
+
+class LRUCache(BaseCache):
+    """An in-memory cache backend holding at most ``max_entries`` responses."""
+
+    def __init__(self, max_entries: int | None = None, **kwargs: t.Any) -> None:
+        """Create a new cache backend.
+
+        Args:
+            max_entries: Maximum number of responses to keep, or None for no limit.
+            kwargs: Keyword arguments for the parent class.
+        """
+        super().__init__(**kwargs)
+        self.responses = LRUDict(max_entries=max_entries)
+        self.redirects = LRUDict(max_entries=max_entries)
+
+
+def create_cache_backend(config: Mapping[str, t.Any]) -> BaseCache:
+    """Create the cache backend selected in the cache configuration.
+
+    Args:
+        config: The ``config`` object of the ``requests_cache`` setting.
+
+    Returns:
+        A cache backend.
+    """
+    backend = config.get("backend") or "sqlite"
+    cache_name = config.get("cache_name") or "http_cache"
+    if backend == "memory":
+        return LRUCache(max_entries=config.get("max_entries"))
+    if backend == "filesystem":
+        return requests_cache.FileCache(cache_name)
+    # Write-ahead logging lets concurrent requests read while a response is saved
+    return requests_cache.SQLiteCache(cache_name, wal=True)
+
+
+class CacheStats:
+    """Count cache hits, misses and response bytes per stream."""
+
+    def __init__(self) -> None:
+        """Create a new set of counters."""
+        self.hits: Counter[str] = Counter()
+        self.misses: Counter[str] = Counter()
+        self.hit_bytes: Counter[str] = Counter()
+        self.miss_bytes: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    def add(self, stream_name: str, response: requests.Response) -> None:
+        """Count a response received by a stream.
+
+        Args:
+            stream_name: The name of the stream.
+            response: The response.
+        """
+        size = len(response.content)
+        with self._lock:
+            if getattr(response, "from_cache", False):
+                self.hits[stream_name] += 1
+                self.hit_bytes[stream_name] += size
+            else:
+                self.misses[stream_name] += 1
+                self.miss_bytes[stream_name] += size
+
+
+class ConnectionStats:
+    """Count requests sent and connections opened, to measure connection reuse."""
+
+    def __init__(self) -> None:
+        """Create a new set of counters."""
+        self.requests = 0
+        self.connections = 0
+        self._lock = threading.Lock()
+
+    @property
+    def reused(self) -> int:
+        """Return the number of requests sent over an already open connection.
+
+        Returns:
+            The number of requests that did not open a connection.
+        """
+        return max(self.requests - self.connections, 0)
+
+    def add_request(self) -> None:
+        """Count a request."""
+        with self._lock:
+            self.requests += 1
+
+    def add_connection(self) -> None:
+        """Count a new connection."""
+        with self._lock:
+            self.connections += 1
+
+
+class CountingHTTPAdapter(HTTPAdapter):
+    """An HTTP adapter that counts requests and the connections they open."""
+
+    def __init__(self, stats: ConnectionStats, **kwargs: t.Any) -> None:
+        """Create a new adapter.
+
+        Args:
+            stats: The counters to update.
+            kwargs: Keyword arguments for :class:`requests.adapters.HTTPAdapter`.
+        """
+        self.stats = stats
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args: t.Any, **kwargs: t.Any) -> None:
+        """Create the pool manager, with pools that count new connections.
+
+        Args:
+            args: Positional arguments for the pool manager.
+            kwargs: Keyword arguments for the pool manager.
+        """
+        super().init_poolmanager(*args, **kwargs)
+        stats = self.stats
+
+        # Connections dropped by the server are reopened by the same object, so
+        # count calls to connect() rather than new connection objects
+        class CountingHTTPConnection(HTTPConnection):
+            def connect(self) -> None:
+                stats.add_connection()
+                super().connect()
+
+        class CountingHTTPSConnection(HTTPSConnection):
+            def connect(self) -> None:
+                stats.add_connection()
+                super().connect()
+
+        class CountingHTTPConnectionPool(HTTPConnectionPool):
+            ConnectionCls = CountingHTTPConnection
+
+        class CountingHTTPSConnectionPool(HTTPSConnectionPool):
+            ConnectionCls = CountingHTTPSConnection
+
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": CountingHTTPConnectionPool,
+            "https": CountingHTTPSConnectionPool,
+        }
+
+    def send(  # type: ignore[override]
+        self,
+        request: requests.PreparedRequest,
+        *args: t.Any,
+        **kwargs: t.Any,
+    ) -> requests.Response:
+        """Send a request and count it.
+
+        Args:
+            request: The request to send.
+            args: Positional arguments for the parent method.
+            kwargs: Keyword arguments for the parent method.
+
+        Returns:
+            The response.
+        """
+        self.stats.add_request()
+        return super().send(request, *args, **kwargs)
+
+
+class SessionRegistry:
+    """Create HTTP sessions once and share them between streams and threads.
+
+    Every stream sends its requests through the same session, so connections
+    and the HTTP cache, if enabled, are shared by the whole tap. Sessions are
+    created on first use. Sending requests with one session from several threads
+    is safe as long as its settings are not changed afterwards.
+
+    With the ``aiohttp`` engine, sessions send their requests through an
+    :class:`~tap_jotform.engine.AsyncEngine`, whose connections are also used by
+    requests sent as coroutines. The HTTP cache only works with ``requests``, so
+    the engine is not used when the cache is enabled.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        pool_size: int = 10,
+        keep_alive: bool = True,
+        retries: int = 0,
+        cache_config: Mapping[str, t.Any] | None = None,
+        urls_expire_after: Mapping[str, int] | None = None,
+        engine: str = "requests",
+    ) -> None:
+        """Create a new registry.
+
+        Args:
+            pool_size: Maximum number of connections kept open per host.
+            keep_alive: Whether to reuse connections between requests.
+            retries: Number of times to retry a request that failed to connect.
+            cache_config: The ``config`` object of the ``requests_cache`` setting,
+                or None to not cache responses.
+            urls_expire_after: Cache expiration in seconds by URL pattern.
+            engine: The HTTP engine, ``requests`` or ``aiohttp``.
+        """
+        self.pool_size = pool_size
+        self.keep_alive = keep_alive
+        self.retries = retries
+        self.cache_config = cache_config
+        self.urls_expire_after: ExpirationPatterns = {}
+        self.urls_expire_after.update(urls_expire_after or {})
+        self.stats = ConnectionStats()
+        self.cache_stats = CacheStats()
+        self.use_async_engine = engine == "aiohttp" and cache_config is None
+
+        self._sessions: dict[str, requests.Session] = {}
+        self._engine: AsyncEngine | None = None
+        # Creating a session may start the engine, which takes the lock again
+        self._lock = threading.RLock()
+
+    @classmethod
+    def from_config(
+        cls,
+        config: Mapping[str, t.Any],
+        *,
+        urls_expire_after: Mapping[str, int] | None = None,
+    ) -> SessionRegistry:
+        """Create a registry from the tap configuration.
+
+        Args:
+            config: The tap configuration.
+            urls_expire_after: Cache expiration in seconds by URL pattern.
+
+        Returns:
+            A new registry.
+        """
+        cache = config.get("requests_cache") or {}
+        return cls(
+            pool_size=config.get("http_pool_size") or 10,
+            keep_alive=config.get("http_keep_alive", True),
+            retries=config.get("http_retries") or 0,
+            cache_config=cache.get("config", {}) if cache.get("enabled") else None,
+            urls_expire_after=urls_expire_after,
+            engine=config.get("http_engine") or "requests",
+        )
+
+    @property
+    def engine(self) -> AsyncEngine | None:
+        """Return the async HTTP engine, starting it on first use.
+
+        Returns:
+            The engine, or None if requests are sent with ``requests``.
+        """
+        if not self.use_async_engine:
+            return None
+        with self._lock:
+            if self._engine is None:
+                self._engine = AsyncEngine(
+                    stats=self.stats,
+                    pool_size=self.pool_size,
+                    keep_alive=self.keep_alive,
+                    retries=self.retries,
+                )
+            return self._engine
+
+    def get(self, name: str = "default", *, stream: bool = False) -> requests.Session:
+        """Return the session with the given name, creating it if needed.
+
+        Args:
+            name: The name of the session.
+            stream: Whether a new session defers downloading response bodies until
+                they are read.
+
+        Returns:
+            The session.
+        """
+        with self._lock:
+            session = self._sessions.get(name)
+            if session is None:
+                session = self._sessions[name] = self.create_session(stream=stream)
+            return session
+
+    def create_session(self, *, stream: bool = False) -> requests.Session:
+        """Create a new session with the registry settings.
+
+        Args:
+            stream: Whether to defer downloading response bodies until they are
+                read.
+
+        Returns:
+            A new session.
+        """
+        session: requests.Session
+        if self.cache_config is not None:
+            kwargs: dict[str, t.Any] = {}
+            if (expire_after := self.cache_config.get("expire_after")) is not None:
+                kwargs["expire_after"] = expire_after
+            session = requests_cache.CachedSession(
+                backend=create_cache_backend(self.cache_config),
+                urls_expire_after=self.urls_expire_after,
+                ignored_parameters=CACHE_IGNORED_PARAMETERS,
+                **kwargs,
+            )
+        else:
+            session = requests.Session()
+
+        adapter: BaseAdapter
+        if (engine := self.engine) is not None:
+            adapter = AsyncHTTPAdapter(engine)
+        else:
+            adapter = CountingHTTPAdapter(
+                self.stats,
+                pool_connections=self.pool_size,
+                pool_maxsize=self.pool_size,
+                # Only retry connection errors, the request was never received
+                max_retries=Retry(total=self.retries, connect=self.retries, read=False),
+            )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if not self.keep_alive:
+            session.headers["Connection"] = "close"
+        session.stream = stream
+        return session
+
+    def close(self) -> None:
+        """Close all sessions and their connections."""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+            if self._engine is not None:
+                self._engine.close()
+                self._engine = None
@@ -2,27 +2,151 @@
 
 from __future__ import annotations
 
+import datetime
 import json
 import typing as t
+from json.encoder import encode_basestring_ascii
 
 from singer_sdk import typing as th  # JSON Schema typing helpers
+from singer_sdk.helpers._compat import datetime_fromisoformat
 from singer_sdk.helpers._typing import TypeConformanceLevel
-
-from tap_jotform.client import JotformPaginatedStream, JotformStream
+from singer_sdk.helpers._util import utc_now
+
+from tap_jotform.client import (
+    JotformPaginatedStream,
+    JotformStream,
+    Sweep,
+    format_datetime,
+    parse_datetime,
+)
+from tap_jotform.decoding import decode_response
+from tap_jotform.scheduler import RequestBudgetExhaustedError
+from tap_jotform.transform import (
+    EachValue,
+    RecordTransformer,
+    split_commas,
+)
 
 if t.TYPE_CHECKING:
     import requests
     from singer_sdk.helpers.types import Context, Record
 
+    from tap_jotform.transform import Converter
+
 CREATED_AT = th.Property("created_at", th.DateTimeType)
 UPDATED_AT = th.Property("updated_at", th.DateTimeType)
 
+#: Any JSON value, as returned for the answer to a question.
+ANSWER_TYPE = th.CustomType(
+    {"type": ["string", "number", "boolean", "object", "array", "null"]},
+)
+
+#: Schema of the ``answers`` property for each ``answers_format``.
+ANSWERS_SCHEMAS: dict[str, th.Property] = {
+    "json_list": th.Property(
+        "answers",
+        th.ArrayType(
+            th.ObjectType(
+                th.Property("qid", th.StringType, required=True),
+                th.Property("answer", th.StringType),
+            ),
+        ),
+        description="Answers by question, each one encoded as a JSON string",
+    ),
+    "objects": th.Property(
+        "answers",
+        th.ArrayType(
+            th.ObjectType(
+                th.Property("qid", th.StringType, required=True),
+                th.Property("answer", ANSWER_TYPE),
+            ),
+        ),
+        description="Answers by question",
+    ),
+    "map": th.Property(
+        "answers",
+        th.CustomType({"type": ["object", "null"], "additionalProperties": True}),
+        description="Answers keyed by question ID",
+    ),
+}
+
+_encode_json = json.JSONEncoder().encode
+
+
+def encode_answer(answer: t.Any) -> str | None:  # noqa: ANN401
+    """Encode an answer as a JSON string, the same way :func:`json.dumps` does.
+
+    Args:
+        answer: The answer to a question.
+
+    Returns:
+        The JSON-encoded answer, or None if there is no answer.
+    """
+    if answer is None:
+        return None
+    # Most answers are plain text
+    if type(answer) is str:
+        return encode_basestring_ascii(answer)
+    return _encode_json(answer)
+
+
+# Only the answer of each entry is in the schema, the rest is not copied
+def answers_as_json_list(answers: dict[str, dict] | None) -> list[dict[str, t.Any]]:
+    """Convert answers to a list of JSON-encoded answers.
+
+    Args:
+        answers: The answers of a submission, by question ID.
+
+    Returns:
+        The answers in the ``json_list`` format.
+    """
+    return [
+        {"qid": qid, "answer": encode_answer(entry.get("answer"))}
+        for qid, entry in (answers or {}).items()
+    ]
+
+
+def answers_as_objects(answers: dict[str, dict] | None) -> list[dict[str, t.Any]]:
+    """Convert answers to a list of answer objects.
+
+    Args:
+        answers: The answers of a submission, by question ID.
+
+    Returns:
+        The answers in the ``objects`` format.
+    """
+    return [
+        {"qid": qid, "answer": entry.get("answer")}
+        for qid, entry in (answers or {}).items()
+    ]
+
+
+def answers_as_map(answers: dict[str, dict] | None) -> dict[str, t.Any]:
+    """Convert answers to a map of question IDs to answers.
+
+    Args:
+        answers: The answers of a submission, by question ID.
+
+    Returns:
+        The answers in the ``map`` format.
+    """
+    return {qid: entry.get("answer") for qid, entry in (answers or {}).items()}
+
+
+#: Converter of the ``answers`` property for each ``answers_format``.
+ANSWERS_CONVERTERS: dict[str, Converter] = {
+    "json_list": answers_as_json_list,
+    "objects": answers_as_objects,
+    "map": answers_as_map,
+}
+
 
 class FormsStream(JotformPaginatedStream):
     """Forms stream."""
 
     name = "forms"
     path = "/user/forms"
+    replication_key = "updated_at"
 
     INTEGER_FIELDS = (
         "height",
@@ -31,6 +155,9 @@ class FormsStream(JotformPaginatedStream):
         "favorite",
         "archived",
     )
+    # Records are built from the schema by the stream transformer
+    TYPE_CONFORMANCE_LEVEL = TypeConformanceLevel.NONE
+    SUPPORTS_BATCH = True
 
     schema = th.PropertiesList(
         th.Property("id", th.StringType, description="The Form ID"),
@@ -61,6 +188,43 @@ class FormsStream(JotformPaginatedStream):
         th.Property("archived", th.IntegerType),
     ).to_dict()
 
+    _all_forms: list[Record] | None = None
+
+    def get_all_forms(self) -> list[Record]:
+        """Return every form in the account, regardless of bookmarks.
+
+        The list is requested once and cached on the stream. Forms keep all of
+        their fields, whichever are selected in the catalog.
+
+        Returns:
+            A list of form records.
+        """
+        if self._all_forms is None:
+            transformer = self.build_transformer(self.schema["properties"])
+            paginator = self.get_new_paginator()
+            decorated_request = self.request_decorator(self._request)
+            forms: list[Record] = []
+
+            while not paginator.finished:
+                params: dict[str, t.Any] = {"limit": self.page_size}
+                if paginator.current_value:
+                    params["offset"] = paginator.current_value
+                prepared_request = self.build_prepared_request(
+                    method="GET",
+                    url=self.get_url(None),
+                    params=params,
+                    headers=self.http_headers,
+                )
+                response = decorated_request(prepared_request, None)
+                forms.extend(
+                    transformer(record) for record in self.parse_response(response)
+                )
+                self.finish_page(response)
+                paginator.advance(response)
+
+            self._all_forms = forms
+        return self._all_forms
+
     def get_child_context(
         self,
         record: Record,
@@ -75,11 +239,22 @@ class FormsStream(JotformPaginatedStream):
         Returns:
             A context dictionary for child streams.
         """
-        return {"form_id": record["id"]}
+        return {
+            "form_id": record["id"],
+            # Records may not be post-processed yet
+            "form_updated_at": record["updated_at"] or record.get("created_at"),
+        }
 
 
 class QuestionsStream(JotformStream):
-    """Questions stream."""
+    """Questions stream.
+
+    Questions only change when their form is edited, so the ``updated_at`` value
+    of each form is saved in its state partition and the questions of forms that
+    have not been edited since are not requested again. The form's submission
+    ``count`` is left out of the fingerprint, since new submissions do not change
+    the questions.
+    """
 
     INTEGER_FIELDS = ("order",)
 
@@ -88,6 +263,7 @@ class QuestionsStream(JotformStream):
     primary_keys = ("form_id", "qid")
     replication_key = None
     parent_stream_type = FormsStream
+    state_partitioning_keys: t.ClassVar[list[str]] = ["form_id"]
 
     schema = th.PropertiesList(
         th.Property("qid", th.StringType, required=True, description="Question ID"),
@@ -112,6 +288,17 @@ class QuestionsStream(JotformStream):
         ),
     ).to_dict()
 
+    def get_fingerprint(self, context: Context | None) -> str | None:
+        """Return the last update time of the form.
+
+        Args:
+            context: The context object.
+
+        Returns:
+            The ``updated_at`` value of the form.
+        """
+        return (context or {}).get("form_updated_at")
+
     def parse_response(
         self,
         response: requests.Response,
@@ -124,7 +311,7 @@ class QuestionsStream(JotformStream):
         Yields:
             An iterator of parsed records.
         """
-        for qid, question in response.json()["content"].items():
+        for qid, question in decode_response(response)["content"].items():
             yield {
                 "qid": qid,
                 "type": question["type"],
@@ -134,15 +321,29 @@ class QuestionsStream(JotformStream):
 
 
 class SubmissionsStream(JotformPaginatedStream):
-    """Submissions stream."""
+    """Submissions stream.
+
+    By default, submissions are requested from the account-wide
+    ``/user/submissions`` endpoint. With the ``submissions_by_form`` setting, the
+    stream is partitioned by form and each partition is requested from
+    ``/form/{form_id}/submissions`` and keeps its own bookmark.
+
+    Partitions are planned from the ``count`` and ``last_submission`` fields of
+    each form: forms without submissions are skipped, the largest forms are
+    synced first, and pages are sized to fetch most forms in one request.
+    """
 
     name = "submissions"
-    path = "/user/submissions"
+    replication_key = "updated_at"
 
     INTEGER_FIELDS = (
         "flag",
         "new",
     )
+    # Records are built from the schema by the stream transformer
+    TYPE_CONFORMANCE_LEVEL = TypeConformanceLevel.NONE
+    SUPPORTS_BATCH = True
+    TRANSFORM_IN_WORKERS = True
 
     schema = th.PropertiesList(
         th.Property("id", th.StringType, description="The Submission ID"),
@@ -162,39 +363,168 @@ class SubmissionsStream(JotformPaginatedStream):
             th.IntegerType,
             description="Total number of unread submissions",
         ),
-        th.Property(
-            "answers",
-            th.ArrayType(
-                th.ObjectType(
-                    th.Property("qid", th.StringType, required=True),
-                    th.Property("answer", th.StringType),
-                ),
-            ),
-        ),
+        ANSWERS_SCHEMAS["json_list"],
     ).to_dict()
 
-    def post_process(self, row: Record, context: Context | None = None) -> Record:
-        """Post-process a row.
+    _form_partitions: list[dict] | None = None
+    _forms_by_id: dict[str, Record] | None = None
+
+    def __init__(self, *args: t.Any, **kwargs: t.Any) -> None:
+        """Initialize the stream, with the schema of the selected answers format."""
+        super().__init__(*args, **kwargs)
+        if self.answers_format != "json_list":
+            answers = ANSWERS_SCHEMAS[self.answers_format].to_dict()
+            self.schema = {
+                **self.schema,
+                "properties": {**self.schema["properties"], **answers},
+            }
+
+    @property
+    def answers_format(self) -> str:
+        """Return how answers are represented in submission records.
+
+        Returns:
+            One of ``json_list``, ``objects`` or ``map``.
+        """
+        return self.config.get("answers_format") or "json_list"
+
+    @property
+    def partition_by_form(self) -> bool:
+        """Return whether submissions are partitioned by form.
+
+        Returns:
+            True if submissions are requested form by form.
+        """
+        return bool(self.config.get("submissions_by_form"))
+
+    @property
+    def path(self) -> str:  # type: ignore[override]
+        """Return the API path for submissions.
+
+        Returns:
+            The per-form path if partitioning by form, else the account-wide one.
+        """
+        if self.partition_by_form:
+            return "/form/{form_id}/submissions"
+        return "/user/submissions"
+
+    @property
+    def partitions(self) -> list[dict] | None:
+        """Return one partition per form if partitioning by form.
+
+        If the request budget runs out while listing forms, there are no
+        partitions and no submissions are synced.
+
+        Returns:
+            A list of partition contexts, or the partitions found in state.
+        """
+        if not self.partition_by_form:
+            return super().partitions
+
+        if self._form_partitions is None:
+            forms_stream = t.cast("FormsStream", self._tap.streams["forms"])
+            try:
+                all_forms = forms_stream.get_all_forms()
+            except RequestBudgetExhaustedError as exc:
+                self.logger.warning(
+                    "Skipping '%s', forms could not be listed: %s",
+                    self.name,
+                    exc,
+                )
+                self._forms_by_id = {}
+                self._form_partitions = []
+                return self._form_partitions
+            forms = sorted(
+                (form for form in all_forms if form["count"]),
+                key=lambda form: form["count"],
+                reverse=True,
+            )
+            self.logger.info(
+                "Skipping %d of %d forms without submissions",
+                len(all_forms) - len(forms),
+                len(all_forms),
+            )
+            self._forms_by_id = {form["id"]: form for form in forms}
+            self._form_partitions = [{"form_id": form["id"]} for form in forms]
+        return self._form_partitions
+
+    def _get_form(self, context: Context | None) -> Record | None:
+        if not (context and self._forms_by_id):
+            return None
+        return self._forms_by_id.get(context["form_id"])
+
+    def get_records(self, context: Context | None) -> t.Iterable[dict[str, t.Any]]:
+        """Return a generator of records, or none if no form could be listed.
+
+        Args:
+            context: The context object.
+
+        Yields:
+            One item per (possibly processed) record in the API.
+        """
+        if self.partition_by_form and context is None:
+            # Without partitions, the SDK syncs the stream without a form
+            return
+        yield from super().get_records(context)
+
+    def get_page_size(self, context: Context | None) -> int:
+        """Return a page size large enough to fetch most forms in one request.
 
         Args:
-            row: The row of data.
             context: The context object.
 
         Returns:
-            The processed row of data.
+            The page size.
         """
-        row = super().post_process(row, context)
+        size = super().get_page_size(context)
+        form = self._get_form(context)
+        if form is None:
+            return size
+        # One more than the count, so a full page does not trigger another request
+        if self.page_size_tuner is not None:
+            # The tuned size already caps how large pages of this stream can be
+            return min(form["count"] + 1, size)
+        return max(min(form["count"] + 1, self.MAX_PAGE_SIZE), size)
+
+    def get_sweeps(self, context: Context | None) -> list[Sweep]:
+        """Return the sweeps needed to sync a context.
+
+        Sweeps over submissions created after the last submission to a form are
+        left out. Edits do not change ``last_submission``, so sweeps over
+        ``updated_at`` are always kept.
 
-        answers_list = []
-        answers: dict[str, dict[str, str | None]] = row.pop("answers", {})
-        for qid, entry in answers.items():
-            answer = entry.get("answer")
-            entry["answer"] = json.dumps(answer) if answer is not None else None
-            value: dict[str, str | None] = {"qid": qid, **entry}
-            answers_list.append(value)
-        row["answers"] = answers_list
+        Args:
+            context: The context object.
+
+        Returns:
+            A list of sweeps.
+        """
+        sweeps = super().get_sweeps(context)
+        form = self._get_form(context)
+        last_submission = form and form.get("last_submission")
+        if not last_submission:
+            return sweeps
+
+        return [
+            sweep
+            for sweep in sweeps
+            if not (
+                sweep.field == "created_at"
+                and sweep.after is not None
+                and sweep.after >= last_submission
+            )
+        ]
+
+    def get_field_converters(self) -> dict[str, Converter]:
+        """Return the functions converting the value of each field.
 
-        return row
+        Returns:
+            A mapping of field names to converters.
+        """
+        return {
+            **super().get_field_converters(),
+            "answers": ANSWERS_CONVERTERS[self.answers_format],
+        }
 
 
 class ReportsStream(JotformStream):
@@ -233,28 +563,59 @@ class ReportsStream(JotformStream):
         th.Property("last_submission", th.DateTimeType),
     ).to_dict()
 
-    def post_process(self, row: Record, context: Context | None = None) -> Record:
-        """Post-process a row of data.
-
-        Args:
-            row: The row of data.
-            context: The context object.
+    def get_field_converters(self) -> dict[str, Converter]:
+        """Return the functions converting the value of each field.
 
         Returns:
-            The processed row of data.
+            A mapping of field names to converters.
         """
-        row = super().post_process(row, context)
-        fields = row.get("fields") or ""
-        row["fields"] = fields.split(",")
-        return row
+        return {**super().get_field_converters(), "fields": split_commas}
+
+
+#: Format of the ``startDate`` and ``endDate`` parameters of the history endpoint.
+HISTORY_DATE_FORMAT = "%m/%d/%Y"
+
+#: A range of days to request history for, as ``startDate`` and ``endDate``.
+DateWindow = tuple[datetime.date, datetime.date]
+
+#: Response attribute holding the time up to which history is synced.
+_SYNCED_UNTIL_ATTR = "_jotform_synced_until"
+
+
+def _unix_time(value: str) -> int:
+    """Convert a date-time setting to a Unix time.
+
+    Args:
+        value: An ISO 8601 date-time, in UTC unless it has an offset.
+
+    Returns:
+        The number of seconds since the epoch.
+    """
+    result = datetime_fromisoformat(value)
+    if result.tzinfo is None:
+        result = result.replace(tzinfo=datetime.timezone.utc)
+    return int(result.timestamp())
 
 
 class UserHistory(JotformStream):
-    """User History stream."""
+    """User History stream.
+
+    The endpoint is not paginated, and only filters events by day. Events since
+    the bookmark or ``start_date`` are requested in windows of days, several at a
+    time during backfills, and events before the bookmark are dropped. The time up
+    to which every event was synced is saved in state after each window, so the
+    next run starts from there even if no event happened since.
+    """
 
     name = "user_history"
     path = "/user/history"
     primary_keys = ("username", "timestamp", "type")
+    replication_key = "timestamp"
+
+    INTEGER_FIELDS = ("timestamp",)
+
+    #: State key for the time up to which every event was synced.
+    SYNCED_UNTIL_STATE_KEY = "synced_until"
 
     schema = th.PropertiesList(
         th.Property(
@@ -286,25 +647,197 @@ class UserHistory(JotformStream):
         th.Property("subuser", th.StringType),
     ).to_dict()
 
+    @property
+    def window(self) -> datetime.timedelta:
+        """Return the size of the date windows history is requested in.
+
+        Returns:
+            The window size, at least one day.
+        """
+        return datetime.timedelta(
+            days=max(self.config.get("history_window_days") or 30, 1)
+        )
+
+    def compare_start_date(self, value: t.Any, start_date_value: str) -> t.Any:  # noqa: ANN401
+        """Return the most recent of the bookmark and the start date.
+
+        Args:
+            value: The bookmark, as a Unix time.
+            start_date_value: The start date from the config.
+
+        Returns:
+            The most recent value, as a Unix time.
+        """
+        return max(int(value), _unix_time(start_date_value))
+
+    def get_start_time(self, context: Context | None) -> datetime.datetime | None:
+        """Return the time to sync history from.
+
+        This is the most recent of the bookmark, the start date and the time up to
+        which a past run synced every event.
+
+        Args:
+            context: The context object.
+
+        Returns:
+            The time to sync from, or None to sync all history.
+        """
+        candidates = []
+        if (value := self.get_starting_replication_key_value(context)) is not None:
+            if isinstance(value, str):
+                value = _unix_time(value)
+            candidates.append(
+                datetime.datetime.fromtimestamp(int(value), tz=datetime.timezone.utc),
+            )
+        state = self.get_context_state(context)
+        if synced_until := state.get(self.SYNCED_UNTIL_STATE_KEY):
+            candidates.append(parse_datetime(synced_until))
+        return max(candidates, default=None)
+
+    def get_windows(
+        self,
+        start: datetime.datetime,
+        until: datetime.datetime,
+    ) -> list[DateWindow]:
+        """Split the days between two times into windows.
+
+        The API may treat ``startDate`` and ``endDate`` as inclusive or exclusive,
+        and in the time zone of the account, so each window starts the day before
+        the previous one ends, and the first one the day before ``start``. The last
+        one ends the day after ``until``, so events of the day are not missed.
+
+        Args:
+            start: The time to sync history from.
+            until: The time the sync started.
+
+        Returns:
+            A list of windows, oldest first.
+        """
+        one_day = datetime.timedelta(days=1)
+        last = until.date() + one_day
+        windows: list[DateWindow] = []
+        lower = start.date()
+        while True:
+            upper = lower + self.window
+            windows.append((lower - one_day, min(upper, last)))
+            if upper >= last:
+                return windows
+            lower = upper
+
     def get_url_params(
         self,
         context: Context | None,  # noqa: ARG002
-        next_page_token: t.Any | None,  # noqa: ANN401, ARG002
+        next_page_token: DateWindow | None,
     ) -> dict[str, t.Any] | str:
         """Get the URL parameters.
 
         Args:
             context: The context object.
-            next_page_token: The next page token.
+            next_page_token: The date window to request, or None for all history.
 
         Returns:
             The URL parameters.
         """
-        return {
-            "action": "all",
-            "date": "lastWeek",
-            "sortBy": "ASC",
-        }
+        params = {"action": "all", "sortBy": "ASC"}
+        if next_page_token is None:
+            params["date"] = "all"
+        else:
+            start, end = next_page_token
+            params["startDate"] = start.strftime(HISTORY_DATE_FORMAT)
+            params["endDate"] = end.strftime(HISTORY_DATE_FORMAT)
+        return params
+
+    def request_windows(
+        self,
+        context: Context | None,
+        windows: list[DateWindow],
+        until: datetime.datetime,
+    ) -> t.Iterator[requests.Response]:
+        """Request each window, keeping up to ``max_parallel_windows`` in flight.
+
+        Args:
+            context: The context object.
+            windows: The windows to request, oldest first.
+            until: The time the sync started.
+
+        Yields:
+            The response of each window, in order, holding the time up to which
+            every event is synced once its events are emitted.
+        """
+        max_in_flight = self.max_parallel_windows
+        if max_in_flight <= 1 or len(windows) <= 1:
+            max_in_flight = 0
+        responses = self.request_ahead(context, windows, max_in_flight, "windows")
+        for index, response in enumerate(responses):
+            if index < len(windows) - 1:
+                # The next window starts there
+                start = windows[index + 1][0]
+                synced_until = datetime.datetime.combine(
+                    start,
+                    datetime.time(),
+                    tzinfo=datetime.timezone.utc,
+                )
+            else:
+                synced_until = until
+            setattr(response, _SYNCED_UNTIL_ATTR, format_datetime(synced_until))
+            yield response
+
+    def checkpoint_page(
+        self,
+        context: Context | None,
+        response: requests.Response,
+    ) -> None:
+        """Save the time up to which every event is synced.
+
+        Args:
+            context: The context object.
+            response: The response of a window.
+        """
+        if (synced_until := getattr(response, _SYNCED_UNTIL_ATTR, None)) is None:
+            return
+        self.get_context_state(context)[self.SYNCED_UNTIL_STATE_KEY] = synced_until
+        self.write_checkpoint()
+
+    def request_records(self, context: Context | None) -> t.Iterable[dict]:
+        """Request the events since the bookmark or the start date.
+
+        Events at the edges of windows may be returned twice, and are only
+        yielded once.
+
+        Args:
+            context: The context object.
+
+        Yields:
+            An item for every event.
+        """
+        until = utc_now()
+        start = self.get_start_time(context)
+        pages: t.Iterator[requests.Response]
+        if start is None:
+            # All history, in one request
+            since = 0
+            pages = self.iter_pages(context)
+        else:
+            since = int(start.timestamp())
+            windows = self.get_windows(start, until)
+            pages = self.request_windows(context, windows, until)
+
+        seen: set[tuple[t.Any, int, t.Any]] = set()
+        try:
+            for record in self.records_from_pages(context, pages):
+                timestamp = int(record["timestamp"])
+                key = (record.get("username"), timestamp, record.get("type"))
+                if timestamp < since or key in seen:
+                    continue
+                seen.add(key)
+                yield record
+        except RequestBudgetExhaustedError as exc:
+            self.stop_sync(context, exc)
+            return
+
+        if start is None:
+            state = self.get_context_state(context)
+            state[self.SYNCED_UNTIL_STATE_KEY] = format_datetime(until)
 
 
 class FoldersStream(JotformStream):
@@ -321,7 +854,10 @@ class FoldersStream(JotformStream):
         "archived",
         "height",
     )
-    TYPE_CONFORMANCE_LEVEL = TypeConformanceLevel.ROOT_ONLY
+    TRANSFORM_IN_WORKERS = True
+    # Records are built from the schema by the stream transformer, and forms keep
+    # all of their fields
+    TYPE_CONFORMANCE_LEVEL = TypeConformanceLevel.NONE
 
     schema = th.PropertiesList(
         th.Property("id", th.StringType),
@@ -354,11 +890,14 @@ class FoldersStream(JotformStream):
         th.Property("subfolders", th.ArrayType(th.ObjectType())),
     ).to_dict()
 
-    def post_process(self, row: Record, context: Context | None = None) -> Record:
-        """Post-process a row of data."""
-        forms = {
-            form_id: JotformStream.post_process(self, form, context)
-            for form_id, form in row.pop("forms", {}).items()
-        }
-        row["forms"] = forms
-        return row
+    def get_field_converters(self) -> dict[str, Converter]:
+        """Return the functions converting the value of each field.
+
+        The integer fields are those of the forms in the folder, which keep all of
+        their fields.
+
+        Returns:
+            A mapping of field names to converters.
+        """
+        forms = RecordTransformer(converters=super().get_field_converters())
+        return {"forms": EachValue(forms)}
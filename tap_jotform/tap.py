@@ -2,12 +2,23 @@
 
 from __future__ import annotations
 
+import atexit
+import multiprocessing
+import typing as t
+from concurrent.futures import ProcessPoolExecutor
 from importlib import metadata
 
 from singer_sdk import Stream, Tap
 from singer_sdk import typing as th
 
 from tap_jotform import streams
+from tap_jotform.instrumentation import format_summary
+from tap_jotform.output import DEFAULT_BUFFER_SIZE, BufferedSingerWriter
+from tap_jotform.scheduler import RequestScheduler
+from tap_jotform.session import SessionRegistry
+
+if t.TYPE_CHECKING:
+    from singer_sdk._singerlib import Message
 
 
 def get_package_version() -> str:
@@ -73,6 +84,41 @@ class TapJotform(Tap):
                             th.IntegerType,
                             description="Cache expiration time in seconds",
                         ),
+                        th.Property(
+                            "backend",
+                            th.StringType,
+                            default="sqlite",
+                            allowed_values=["sqlite", "filesystem", "memory"],
+                            description=(
+                                "Cache backend. SQLite databases are opened in "
+                                "write-ahead logging mode."
+                            ),
+                        ),
+                        th.Property(
+                            "cache_name",
+                            th.StringType,
+                            default="http_cache",
+                            description=(
+                                "Path of the SQLite database or of the cache "
+                                "directory"
+                            ),
+                        ),
+                        th.Property(
+                            "max_entries",
+                            th.IntegerType,
+                            description=(
+                                "Maximum number of responses kept by the memory "
+                                "backend. The least recently used are evicted."
+                            ),
+                        ),
+                        th.Property(
+                            "stream_expire_after",
+                            th.ObjectType(additional_properties=th.IntegerType),
+                            description=(
+                                "Cache expiration time in seconds by stream name, "
+                                "overriding `expire_after`"
+                            ),
+                        ),
                     ),
                     description="Requests cache configuration",
                     default={},
@@ -80,8 +126,355 @@ class TapJotform(Tap):
             ),
             description="Cache configuration for HTTP requests",
         ),
+        th.Property(
+            "page_size",
+            th.IntegerType,
+            default=100,
+            description="Number of records to request per page for paginated streams",
+        ),
+        th.Property(
+            "adaptive_page_size",
+            th.BooleanType,
+            default=False,
+            description=(
+                "Adjust the page size of paginated streams between pages, starting "
+                "from `page_size`, based on response times, response sizes and "
+                "errors. Not applied while pages are prefetched."
+            ),
+        ),
+        th.Property(
+            "min_page_size",
+            th.IntegerType,
+            default=10,
+            description="Smallest page size used by `adaptive_page_size`",
+        ),
+        th.Property(
+            "max_page_size",
+            th.IntegerType,
+            default=1000,
+            description="Largest page size used by `adaptive_page_size`",
+        ),
+        th.Property(
+            "target_page_seconds",
+            th.NumberType,
+            default=2.0,
+            description="Response time per page aimed for by `adaptive_page_size`",
+        ),
+        th.Property(
+            "max_page_bytes",
+            th.IntegerType,
+            default=5_000_000,
+            description="Response size per page aimed for by `adaptive_page_size`",
+        ),
+        th.Property(
+            "prefetch_pages",
+            th.IntegerType,
+            default=0,
+            description=(
+                "Number of page requests to keep in flight for paginated streams. "
+                "Set to 0 to fetch pages one at a time."
+            ),
+        ),
+        th.Property(
+            "pagination_mode",
+            th.StringType,
+            default="offset",
+            allowed_values=["offset", "keyset"],
+            description=(
+                "How paginated streams request the next page. `keyset` filters on "
+                "the last value seen instead of using deep offsets."
+            ),
+        ),
+        th.Property(
+            "max_parallel_children",
+            th.IntegerType,
+            default=1,
+            description=(
+                "Number of child stream contexts, e.g. the questions of each form, "
+                "to fetch concurrently."
+            ),
+        ),
+        th.Property(
+            "submissions_by_form",
+            th.BooleanType,
+            default=False,
+            description=(
+                "Request submissions form by form instead of from the account-wide "
+                "endpoint. Each form keeps its own bookmark."
+            ),
+        ),
+        th.Property(
+            "answers_format",
+            th.StringType,
+            default="json_list",
+            allowed_values=["json_list", "objects", "map"],
+            description=(
+                "How submission answers are represented: a list of question IDs "
+                "and JSON-encoded answers, a list of question IDs and answers as "
+                "JSON values, or an object of answers keyed by question ID."
+            ),
+        ),
+        th.Property(
+            "max_parallel_partitions",
+            th.IntegerType,
+            default=1,
+            description=(
+                "Number of stream partitions, e.g. forms, to fetch concurrently"
+            ),
+        ),
+        th.Property(
+            "backfill_window_days",
+            th.IntegerType,
+            description=(
+                "Split the initial load of incremental streams into windows of "
+                "this many days by creation date. Progress is saved after each "
+                "window."
+            ),
+        ),
+        th.Property(
+            "history_window_days",
+            th.IntegerType,
+            default=30,
+            description=(
+                "Number of days of user history to request at once. History is "
+                "requested in windows of this many days since the bookmark or "
+                "`start_date`."
+            ),
+        ),
+        th.Property(
+            "max_parallel_windows",
+            th.IntegerType,
+            default=1,
+            description=(
+                "Number of backfill or user history windows to fetch concurrently"
+            ),
+        ),
+        th.Property(
+            "request_budget",
+            th.IntegerType,
+            description=(
+                "Maximum number of API requests to issue in a single run. Streams "
+                "stop syncing once it is used up."
+            ),
+        ),
+        th.Property(
+            "min_limit_left",
+            th.IntegerType,
+            default=0,
+            description=(
+                "Number of requests to leave in the daily API quota. Streams stop "
+                "syncing once the `limit-left` reported by the API reaches it. This "
+                "is a hard stop: requests are not slowed down as the quota runs "
+                "low, use `max_requests_per_second` to pace them."
+            ),
+        ),
+        th.Property(
+            "max_requests_per_second",
+            th.NumberType,
+            description="Maximum rate of API requests across all streams",
+        ),
+        th.Property(
+            "http_pool_size",
+            th.IntegerType,
+            default=10,
+            description=(
+                "Maximum number of HTTP connections to keep open, shared by all "
+                "streams"
+            ),
+        ),
+        th.Property(
+            "http_keep_alive",
+            th.BooleanType,
+            default=True,
+            description="Reuse HTTP connections between requests",
+        ),
+        th.Property(
+            "http_retries",
+            th.IntegerType,
+            default=2,
+            description="Number of times to retry a request that failed to connect",
+        ),
+        th.Property(
+            "http_engine",
+            th.StringType,
+            default="requests",
+            allowed_values=["requests", "aiohttp"],
+            description=(
+                "Library used to send HTTP requests. With `aiohttp`, requests sent "
+                "ahead of time run as coroutines on a single event loop instead of "
+                "one thread each. Requires the `aiohttp` extra. Ignored when the HTTP "
+                "cache is enabled."
+            ),
+        ),
+        th.Property(
+            "stream_responses",
+            th.BooleanType,
+            default=False,
+            description=(
+                "Parse records as response bodies are downloaded, instead of "
+                "decoding whole pages at once. Keeps memory usage flat with large "
+                "pages. Ignored when the HTTP cache or the aiohttp engine is enabled."
+            ),
+        ),
+        th.Property(
+            "batch_max_bytes",
+            th.IntegerType,
+            description=(
+                "Maximum size in bytes of the uncompressed JSON in each batch file, "
+                "with `batch_config`. Files are also limited to `batch_size` records."
+            ),
+        ),
+        th.Property(
+            "buffered_output",
+            th.BooleanType,
+            default=False,
+            description=(
+                "Serialize Singer messages with the fastest JSON library available, "
+                "such as orjson from the `orjson` extra, and write them to stdout in "
+                "large chunks, instead of flushing every message"
+            ),
+        ),
+        th.Property(
+            "output_buffer_size",
+            th.IntegerType,
+            default=DEFAULT_BUFFER_SIZE,
+            description=(
+                "Number of bytes of messages to buffer before writing them to "
+                "stdout, with `buffered_output`"
+            ),
+        ),
+        th.Property(
+            "performance_metrics",
+            th.BooleanType,
+            default=True,
+            description=(
+                "Log the latency, size, decoding time and record count of every "
+                "API response to the metrics logger, and a summary per stream at "
+                "the end of the sync"
+            ),
+        ),
+        th.Property(
+            "transform_workers",
+            th.IntegerType,
+            default=0,
+            description=(
+                "Number of worker processes decoding and converting the pages of "
+                "the `submissions` and `folders` streams, while the main process "
+                "requests the next page and writes records. `0` converts records "
+                "in the main process."
+            ),
+        ),
     ).to_dict()
 
+    def __init__(self, *args: t.Any, **kwargs: t.Any) -> None:
+        """Initialize the tap."""
+        super().__init__(*args, **kwargs)
+        self.scheduler = RequestScheduler.from_config(self.config)
+        self.sessions = SessionRegistry.from_config(
+            self.config,
+            urls_expire_after=self.get_cache_expiration(),
+        )
+        # Sessions are closed after the sync, and still closed if it fails
+        atexit.register(self.sessions.close)
+        if self.config.get("http_engine") == "aiohttp" and not (
+            self.sessions.use_async_engine
+        ):
+            self.logger.warning(
+                "Sending requests with requests instead of aiohttp, which does not "
+                "support the HTTP cache"
+            )
+        self.output_writer: BufferedSingerWriter | None = None
+        if self.config.get("buffered_output"):
+            self.output_writer = BufferedSingerWriter(
+                self.config.get("output_buffer_size") or DEFAULT_BUFFER_SIZE,
+            )
+            # The SDK has no hook after the last message, and messages since the
+            # last STATE must still be written if the sync fails
+            atexit.register(self.output_writer.flush)
+        self._transform_pool: ProcessPoolExecutor | None = None
+
+    @property
+    def transform_pool(self) -> ProcessPoolExecutor | None:
+        """Return the pool of processes converting records, if enabled.
+
+        Workers are started on first use, so syncs that only run other streams do
+        not pay for them.
+
+        Returns:
+            The process pool, or None if ``transform_workers`` is not set.
+        """
+        workers = self.config.get("transform_workers") or 0
+        if workers > 0 and self._transform_pool is None:
+            self._transform_pool = ProcessPoolExecutor(
+                workers,
+                # Forking would copy the threads and locks of the HTTP clients
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            atexit.register(self._transform_pool.shutdown, cancel_futures=True)
+        return self._transform_pool
+
+    def write_message(self, message: Message) -> None:
+        """Write a message to stdout, through the buffered writer if enabled.
+
+        Args:
+            message: The message to write.
+        """
+        if self.output_writer is None:
+            super().write_message(message)
+        else:
+            self.output_writer.write_message(message)
+
+    def log_run_costs(self) -> None:
+        """Log the API quota and the connections used by all streams."""
+        if requests_count := self.scheduler.total_requests:
+            self.logger.info(
+                "Issued %d API requests, %s left in the daily quota",
+                requests_count,
+                self.scheduler.limit_left,
+            )
+
+        stats = self.sessions.stats
+        if stats.requests:
+            self.logger.info(
+                "%d of %d HTTP requests reused an open connection, "
+                "%d connections opened",
+                stats.reused,
+                stats.requests,
+                stats.connections,
+            )
+
+        self.log_performance_summary()
+
+    def log_performance_summary(self) -> None:
+        """Log a table of the performance metrics of the streams that ran."""
+        rows = [
+            metrics.summary()
+            for stream in self.streams.values()
+            if (metrics := t.cast("streams.JotformStream", stream).perf_metrics)
+            and metrics.requests
+        ]
+        if rows:
+            self.metrics_logger.info("Performance summary:\n%s", format_summary(rows))
+
+    def get_cache_expiration(self) -> dict[str, int]:
+        """Return the cache expiration of each stream, by URL pattern.
+
+        Returns:
+            A mapping of URL patterns to expiration times in seconds.
+        """
+        cache_config = (self.config.get("requests_cache") or {}).get("config") or {}
+        expiration = {}
+        for name, seconds in (cache_config.get("stream_expire_after") or {}).items():
+            stream = self.streams.get(name)
+            if stream is None:
+                self.logger.warning(
+                    "Ignoring cache expiration of unknown stream %s", name
+                )
+                continue
+            pattern = t.cast("streams.JotformStream", stream).cache_url_pattern
+            expiration[pattern] = seconds
+        return expiration
+
     def discover_streams(self) -> list[Stream]:
         """Return a list of discovered streams.
 
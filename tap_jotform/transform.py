@@ -0,0 +1,162 @@
+"""Conversion of Jotform API rows into stream records."""
+
+from __future__ import annotations
+
+import time
+import typing as t
+
+from tap_jotform.decoding import loads
+
+if t.TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence
+
+#: A function converting the raw value of a field.
+Converter = t.Callable[[t.Any], t.Any]
+
+
+def to_integer(value: t.Any) -> int | None:  # noqa: ANN401
+    """Convert a numeric string to an integer.
+
+    Args:
+        value: The raw value.
+
+    Returns:
+        The integer, or None for empty values.
+    """
+    return int(value) if value else None
+
+
+def split_commas(value: str | None) -> list[str]:
+    """Split a comma-separated string into a list.
+
+    Args:
+        value: The raw value.
+
+    Returns:
+        The items of the string.
+    """
+    return (value or "").split(",")
+
+
+class RecordTransformer:
+    """Convert raw rows into records in a single pass over their fields.
+
+    The steps for each field are worked out once, when the transformer is
+    created. Fields with a converter are always set, from None if they are
+    missing in the row. Other fields are copied as they are. When ``properties``
+    is given, fields that are not listed are left out without being converted,
+    so records match the stream schema and catalog selection without the SDK
+    walking them again.
+
+    Transformers only hold plain data and module-level functions, so they can be
+    pickled and sent to other processes.
+    """
+
+    def __init__(
+        self,
+        properties: Iterable[str] | None = None,
+        *,
+        converters: Mapping[str, Converter] | None = None,
+        fallbacks: Mapping[str, str] | None = None,
+    ) -> None:
+        """Create a new transformer.
+
+        Args:
+            properties: The fields to keep, or None to keep every field.
+            converters: Functions converting the value of some fields.
+            fallbacks: Fields to fill in from another field of the row when they are
+                empty.
+        """
+        converters = converters or {}
+        self.properties = None if properties is None else tuple(properties)
+        self.steps: tuple[tuple[str, Converter | None], ...]
+        if self.properties is None:
+            self.steps = tuple(converters.items())
+        else:
+            self.steps = tuple((key, converters.get(key)) for key in self.properties)
+        self.fallbacks = tuple(
+            (key, source)
+            for key, source in (fallbacks or {}).items()
+            if self.properties is None or key in self.properties
+        )
+
+    def __call__(self, row: dict[str, t.Any]) -> dict[str, t.Any]:
+        """Convert a row.
+
+        Args:
+            row: The row, as returned by the API.
+
+        Returns:
+            The record.
+        """
+        if self.properties is None:
+            record = row
+            for key, convert in self.steps:
+                if convert is not None:
+                    record[key] = convert(row.get(key))
+        else:
+            record = {}
+            for key, convert in self.steps:
+                if convert is not None:
+                    record[key] = convert(row.get(key))
+                elif key in row:
+                    record[key] = row[key]
+
+        for key, source in self.fallbacks:
+            if not record.get(key):
+                record[key] = row.get(source)
+        return record
+
+
+class EachValue:
+    """Convert every value of an object with a transformer."""
+
+    def __init__(self, transformer: RecordTransformer) -> None:
+        """Create a new converter.
+
+        Args:
+            transformer: The transformer to apply to each value.
+        """
+        self.transformer = transformer
+
+    def __call__(self, value: dict[str, t.Any] | None) -> dict[str, t.Any]:
+        """Convert the values of an object.
+
+        Args:
+            value: The raw object.
+
+        Returns:
+            An object with the converted values.
+        """
+        return {key: self.transformer(item) for key, item in (value or {}).items()}
+
+
+def transform_page(
+    transformer: RecordTransformer,
+    body: bytes,
+    keep: Sequence[str] = (),
+) -> tuple[list[dict[str, t.Any]], dict[str, t.Any], float]:
+    """Decode a page of rows and convert them into records.
+
+    This runs on worker processes, which receive the raw response body rather than
+    decoded rows, so only bytes are copied on the way in.
+
+    Args:
+        transformer: The transformer of the stream.
+        body: The response body.
+        keep: Row fields to keep in the returned payload, as in
+            :func:`~tap_jotform.decoding.stream_content`.
+
+    Returns:
+        The records, the rest of the payload, with ``content`` reduced to the
+        ``keep`` fields of each row, and the time spent decoding the body.
+    """
+    start = time.perf_counter()
+    payload = loads(body)
+    seconds = time.perf_counter() - start
+
+    content = payload.get("content")
+    # Like ``$.content[*]``, a content object is a single row
+    rows = [content] if isinstance(content, dict) else content or []
+    payload["content"] = [{field: row.get(field) for field in keep} for row in rows]
+    return [transformer(row) for row in rows], payload, seconds
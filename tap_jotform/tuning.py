@@ -0,0 +1,106 @@
+"""Adaptive sizing of the pages requested from the Jotform API."""
+
+from __future__ import annotations
+
+import threading
+import typing as t
+
+if t.TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+class PageSizeTuner:
+    """Adjust the number of records requested per page from observed pages.
+
+    After every page, the size is moved towards the largest page that would take
+    at most ``target_seconds`` to respond and weigh at most ``max_bytes``,
+    assuming both grow linearly with the number of records. The size changes by
+    at most a factor of two per page, and is halved whenever a request has to be
+    retried. It always stays between ``min_size`` and ``max_size``.
+    """
+
+    def __init__(
+        self,
+        initial_size: int,
+        *,
+        min_size: int = 10,
+        max_size: int = 1000,
+        target_seconds: float = 2.0,
+        max_bytes: int = 5_000_000,
+    ) -> None:
+        """Create a new tuner.
+
+        Args:
+            initial_size: Page size to start from.
+            min_size: Smallest page size to request.
+            max_size: Largest page size to request.
+            target_seconds: Response time to aim for.
+            max_bytes: Largest response body to aim for.
+        """
+        self.min_size = min_size
+        self.max_size = max(max_size, min_size)
+        self.target_seconds = target_seconds
+        self.max_bytes = max_bytes
+        self._size = self._clamp(initial_size)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(
+        cls,
+        config: Mapping[str, t.Any],
+        initial_size: int,
+        max_size: int,
+    ) -> PageSizeTuner:
+        """Create a tuner from the tap configuration.
+
+        Args:
+            config: The tap configuration.
+            initial_size: Page size to start from.
+            max_size: Largest page size the API accepts.
+
+        Returns:
+            A new tuner.
+        """
+        return cls(
+            initial_size,
+            min_size=config.get("min_page_size") or 10,
+            max_size=min(config.get("max_page_size") or max_size, max_size),
+            target_seconds=config.get("target_page_seconds") or 2.0,
+            max_bytes=config.get("max_page_bytes") or 5_000_000,
+        )
+
+    @property
+    def size(self) -> int:
+        """Return the page size to request next.
+
+        Returns:
+            The number of records per page.
+        """
+        return self._size
+
+    def _clamp(self, size: float) -> int:
+        return min(max(int(size), self.min_size), self.max_size)
+
+    def observe(self, records: int, seconds: float, size_bytes: int) -> None:
+        """Adjust the page size after a page was received.
+
+        Args:
+            records: Number of records in the page.
+            seconds: Time the API took to respond.
+            size_bytes: Size of the response body.
+        """
+        if records <= 0:
+            return
+
+        with self._lock:
+            limits: list[float] = [2 * self._size]
+            if seconds > 0:
+                limits.append(records * self.target_seconds / seconds)
+            if size_bytes > 0:
+                limits.append(records * self.max_bytes / size_bytes)
+            self._size = self._clamp(max(min(limits), self._size / 2))
+
+    def failed(self) -> None:
+        """Halve the page size after a request failed."""
+        with self._lock:
+            self._size = self._clamp(self._size / 2)
@@ -0,0 +1,210 @@
+"""Measure the throughput of each stream against the mock Jotform API.
+
+Each stream is synced in its own subprocess, so peak memory usage is measured
+per stream. Singer messages are counted and discarded. For every stream, the
+benchmark reports records per second, API requests per record, time spent
+decoding JSON responses and peak resident memory.
+
+Run it with ``python -m tests.benchmark --help``, or ``nox -s benchmark``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import resource
+import subprocess
+import sys
+import time
+import typing as t
+from contextlib import redirect_stdout
+
+from singer_sdk._singerlib import Catalog
+
+from tap_jotform import decoding
+from tap_jotform.tap import TapJotform
+from tests.mock_server import (
+    MockJotformServer,
+    add_dataset_arguments,
+    dataset_from_arguments,
+)
+
+STREAMS = (
+    "forms",
+    "questions",
+    "submissions",
+    "reports",
+    "folders",
+    "user_history",
+)
+
+
+class _MessageCounter(io.TextIOBase):
+    """A stdout replacement that counts Singer messages and discards them.
+
+    Each write may hold one message or, with ``buffered_output``, many lines.
+    """
+
+    def __init__(self) -> None:
+        self.records = 0
+        self.messages = 0
+        self.bytes = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        lines = text.count("\n")
+        self.messages += lines
+        self.records += text.startswith('{"type":"RECORD"')
+        self.records += text.count('\n{"type":"RECORD"')
+        self.bytes += len(text)
+        return len(text)
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def _select(tap: TapJotform, stream_name: str) -> dict[str, t.Any]:
+    catalog = Catalog.from_dict(tap.catalog_dict)
+    for entry in catalog.streams:
+        entry.metadata.root.selected = entry.tap_stream_id == stream_name
+    return catalog.to_dict()
+
+
+def run_stream(stream_name: str, config: dict[str, t.Any]) -> dict[str, t.Any]:
+    """Sync one stream and measure it.
+
+    Args:
+        stream_name: The stream to sync.
+        config: The tap configuration.
+
+    Returns:
+        The measurements.
+    """
+    decode_time = 0.0
+    loads = decoding._loads
+
+    def timed_loads(data: bytes | str) -> t.Any:
+        nonlocal decode_time
+        start = time.perf_counter()
+        try:
+            return loads(data)
+        finally:
+            decode_time += time.perf_counter() - start
+
+    decoding._loads = timed_loads
+
+    discovery = TapJotform(config=config, validate_config=False)
+    tap = TapJotform(
+        config=config,
+        catalog=_select(discovery, stream_name),
+        validate_config=False,
+    )
+    counter = _MessageCounter()
+    start = time.perf_counter()
+    with redirect_stdout(counter):  # type: ignore[type-var]
+        tap.sync_all()
+        if tap.output_writer is not None:
+            tap.output_writer.flush()
+    elapsed = time.perf_counter() - start
+
+    requests = tap.scheduler.total_requests
+    return {
+        "stream": stream_name,
+        "records": counter.records,
+        "requests": requests,
+        "seconds": elapsed,
+        "records_per_second": counter.records / elapsed if elapsed else 0,
+        "requests_per_record": requests / counter.records if counter.records else 0,
+        "decode_seconds": decode_time,
+        "output_mb": counter.bytes / 1024 / 1024,
+        "peak_rss_mb": _peak_rss_mb(),
+        "json_backend": decoding.BACKEND,
+    }
+
+
+def _format_table(results: list[dict[str, t.Any]]) -> str:
+    columns = (
+        ("stream", "{}"),
+        ("records", "{:d}"),
+        ("requests", "{:d}"),
+        ("seconds", "{:.2f}"),
+        ("records_per_second", "{:.0f}"),
+        ("requests_per_record", "{:.4f}"),
+        ("decode_seconds", "{:.3f}"),
+        ("peak_rss_mb", "{:.1f}"),
+    )
+    rows = [[name for name, _ in columns]]
+    rows.extend(
+        [spec.format(result[name]) for name, spec in columns] for result in results
+    )
+    widths = [max(len(row[index]) for row in rows) for index in range(len(columns))]
+    return "\n".join(
+        "  ".join(cell.rjust(width) for cell, width in zip(row, widths)) for row in rows
+    )
+
+
+def main() -> None:
+    """Run the benchmark suite."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_dataset_arguments(parser)
+    parser.add_argument(
+        "--streams",
+        nargs="+",
+        choices=STREAMS,
+        default=list(STREAMS),
+        help="streams to benchmark",
+    )
+    parser.add_argument(
+        "--tap-config",
+        type=json.loads,
+        default={},
+        help="extra tap settings, as a JSON object",
+    )
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        result = run_stream(args.child, args.tap_config)
+        sys.stdout.write(json.dumps(result) + "\n")
+        return
+
+    server = MockJotformServer(
+        dataset_from_arguments(args),
+        latency=args.latency,
+        limit_left=args.limit_left,
+    )
+    results = []
+    with server:
+        config = {"api_key": "benchmark", "api_url": server.url, **args.tap_config}
+        for stream_name in args.streams:
+            process = subprocess.run(  # noqa: S603
+                [
+                    sys.executable,
+                    "-m",
+                    "tests.benchmark",
+                    "--child",
+                    stream_name,
+                    "--tap-config",
+                    json.dumps(config),
+                ],
+                capture_output=True,
+                check=True,
+                text=True,
+            )
+            results.append(json.loads(process.stdout.splitlines()[-1]))
+
+    if args.json:
+        sys.stdout.write(json.dumps(results, indent=2) + "\n")
+    else:
+        sys.stdout.write(_format_table(results) + "\n")
+
+
+if __name__ == "__main__":
+    main()
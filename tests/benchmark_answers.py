@@ -0,0 +1,155 @@
+"""Measure the cost of post-processing submission answers in each format.
+
+Synthetic submissions from the mock Jotform API are post-processed by the
+submissions stream with every ``answers_format``, and then conformed to the
+stream schema the way the SDK does before writing records, at the conformance
+level of the stream. The ``baseline`` row is the implementation that converted
+rows in place, copied every answer entry and encoded it with :func:`json.dumps`,
+and left the SDK to conform every record, for comparison.
+
+Run it with ``python -m tests.benchmark_answers --help``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import sys
+import time
+import typing as t
+
+from singer_sdk.helpers._typing import TypeConformanceLevel, conform_record_data_types
+
+from tap_jotform.streams import SubmissionsStream
+from tests.conftest import build_tap
+from tests.mock_server import MockDataset
+
+FORMATS = ("json_list", "objects", "map")
+
+
+def _baseline(row: dict[str, t.Any]) -> dict[str, t.Any]:
+    for field in SubmissionsStream.INTEGER_FIELDS:
+        value = row.get(field)
+        row[field] = int(value) if value else None
+    row["updated_at"] = row["updated_at"] or row["created_at"]
+
+    answers_list = []
+    for qid, entry in row.pop("answers", {}).items():
+        answer = entry.get("answer")
+        entry["answer"] = json.dumps(answer) if answer is not None else None
+        answers_list.append({"qid": qid, **entry})
+    row["answers"] = answers_list
+    return row
+
+
+def _time_per_record(
+    func: t.Callable[[dict[str, t.Any]], t.Any],
+    rows: list[dict[str, t.Any]],
+) -> float:
+    start = time.perf_counter()
+    for row in rows:
+        func(row)
+    return (time.perf_counter() - start) / len(rows) * 1e6
+
+
+def run_format(
+    answers_format: str,
+    submissions: list[dict[str, t.Any]],
+) -> dict[str, t.Any]:
+    """Post-process and conform submissions with one answers format.
+
+    Args:
+        answers_format: An ``answers_format`` value, or ``baseline``.
+        submissions: Raw submissions, as returned by the API.
+
+    Returns:
+        The measurements, in microseconds per record.
+    """
+    config_format = "json_list" if answers_format == "baseline" else answers_format
+    stream = SubmissionsStream(build_tap(answers_format=config_format))
+    stream.logger.disabled = True
+
+    rows = copy.deepcopy(submissions)
+    if answers_format == "baseline":
+        level = TypeConformanceLevel.RECURSIVE
+        post_process_us = _time_per_record(_baseline, rows)
+    else:
+        level = stream.TYPE_CONFORMANCE_LEVEL
+        processed: list[dict[str, t.Any]] = []
+        post_process_us = _time_per_record(
+            lambda row: processed.append(stream.post_process(row)),
+            rows,
+        )
+        rows = processed
+
+    records: list[dict[str, t.Any]] = []
+    conform_us = _time_per_record(
+        lambda row: records.append(
+            conform_record_data_types(
+                stream.name,
+                row,
+                stream.schema,
+                level,
+                stream.logger,
+            ),
+        ),
+        rows,
+    )
+    output = sum(len(json.dumps(record["answers"])) for record in records)
+    return {
+        "answers_format": answers_format,
+        "post_process_us": post_process_us,
+        "conform_us": conform_us,
+        "total_us": post_process_us + conform_us,
+        "answers_bytes": output / len(records),
+    }
+
+
+def _format_table(results: list[dict[str, t.Any]]) -> str:
+    columns = (
+        ("answers_format", "{}"),
+        ("post_process_us", "{:.1f}"),
+        ("conform_us", "{:.1f}"),
+        ("total_us", "{:.1f}"),
+        ("answers_bytes", "{:.0f}"),
+    )
+    rows = [[name for name, _ in columns]]
+    rows.extend(
+        [spec.format(result[name]) for name, spec in columns] for result in results
+    )
+    widths = [max(len(row[index]) for row in rows) for index in range(len(columns))]
+    return "\n".join(
+        "  ".join(cell.rjust(width) for cell, width in zip(row, widths)) for row in rows
+    )
+
+
+def main() -> None:
+    """Run the microbenchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--submissions", type=int, default=5000)
+    parser.add_argument("--questions", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    dataset = MockDataset(
+        forms=1,
+        submissions_per_form=args.submissions,
+        questions_per_form=args.questions,
+        reports=0,
+        folders=0,
+        history=0,
+        seed=args.seed,
+    )
+    submissions = dataset.all_submissions
+    results = [run_format(name, submissions) for name in ("baseline", *FORMATS)]
+
+    if args.json:
+        sys.stdout.write(json.dumps(results, indent=2) + "\n")
+    else:
+        sys.stdout.write(_format_table(results) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,140 @@
 """Pytest configuration for tests in this directory."""
 
 from __future__ import annotations
+
+import datetime
+import json
+import logging
+import re
+import threading
+import typing as t
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import requests
+
+from tap_jotform.tap import TapJotform
+
+if t.TYPE_CHECKING:
+    from tests.mock_server import MockJotformServer
+
+
+def build_tap(**config: t.Any) -> TapJotform:
+    """Build a tap instance with the given settings."""
+    return TapJotform(config={"api_key": "test", **config}, validate_config=False)
+
+
+def sync_tap(
+    server: MockJotformServer,
+    *,
+    caplog: pytest.LogCaptureFixture | None = None,
+    **config: t.Any,
+) -> TapJotform:
+    """Sync all streams from the mock server, capturing the logs with ``caplog``."""
+    tap = build_tap(api_url=server.url, **config)
+    # The tap replaces the logging configuration when it starts
+    handler = caplog.handler if caplog is not None else logging.NullHandler()
+    loggers = (logging.getLogger("singer_sdk.metrics"), tap.logger)
+    for logger in loggers:
+        logger.addHandler(handler)
+    try:
+        tap.sync_all()
+    finally:
+        for logger in loggers:
+            logger.removeHandler(handler)
+    if tap.output_writer is not None:
+        tap.output_writer.flush()
+    return tap
+
+
+def read_messages(output: str) -> list[dict[str, t.Any]]:
+    """Parse Singer messages, without the values that differ between runs."""
+    output = re.sub(
+        r'"(replication_key_signpost|synced_until)":"[^"]*"',
+        r'"\1":null',
+        output,
+    )
+    messages = [json.loads(line) for line in output.splitlines()]
+    for message in messages:
+        message.pop("time_extracted", None)
+    return messages
+
+
+@pytest.fixture
+def tap() -> TapJotform:
+    """Return a tap instance that does not talk to the network."""
+    return build_tap()
+
+
+class FakeSession(requests.Session):
+    """A requests session that answers from a handler instead of the network."""
+
+    def __init__(
+        self,
+        handler: t.Callable[[str, dict[str, str]], dict[str, t.Any]],
+    ) -> None:
+        """Create a session that serves payloads built by ``handler``."""
+        super().__init__()
+        self.handler = handler
+        self.requests: list[tuple[str, dict[str, str]]] = []
+        self._lock = threading.Lock()
+
+    def send(  # type: ignore[override]
+        self,
+        request: requests.PreparedRequest,
+        **kwargs: t.Any,  # noqa: ARG002
+    ) -> requests.Response:
+        """Serve the request from the handler."""
+        url = urlparse(str(request.url))
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+        with self._lock:
+            self.requests.append((url.path, params))
+        response = make_response(self.handler(url.path, params), str(request.url))
+        response.request = request
+        return response
+
+
+def offset_handler(
+    rows: list[dict[str, t.Any]],
+) -> t.Callable[[str, dict[str, str]], dict[str, t.Any]]:
+    """Return a handler that pages through ``rows`` with offset and limit."""
+
+    def handler(path: str, params: dict[str, str]) -> dict[str, t.Any]:  # noqa: ARG001
+        offset = int(params.get("offset", 0))
+        limit = int(params.get("limit", 100))
+        return make_page(rows[offset : offset + limit], offset=offset, limit=limit)
+
+    return handler
+
+
+def make_response(
+    payload: dict[str, t.Any],
+    url: str = "https://api.jotform.com/user/forms",
+) -> requests.Response:
+    """Build a response object with the given JSON payload."""
+    response = requests.Response()
+    response.status_code = 200
+    response._content = json.dumps(payload).encode()
+    response._content_consumed = True  # type: ignore[attr-defined]
+    response.url = url
+    response.request = requests.Request("GET", url).prepare()
+    response.elapsed = datetime.timedelta(0)
+    return response
+
+
+def make_page(
+    content: list[dict[str, t.Any]] | dict[str, t.Any],
+    *,
+    offset: int = 0,
+    limit: int = 100,
+    limit_left: int = 1000,
+) -> dict[str, t.Any]:
+    """Build a Jotform API response payload."""
+    return {
+        "responseCode": 200,
+        "message": "success",
+        "content": content,
+        "duration": "10ms",
+        "resultSet": {"offset": offset, "limit": limit, "count": len(content)},
+        "limit-left": limit_left,
+    }
@@ -0,0 +1,544 @@
+"""A local stand-in for the Jotform API, serving generated data.
+
+The server implements the endpoints used by the tap, including pagination with
+``limit`` and ``offset``, sorting with ``orderby`` and ``direction``, and the
+``filter`` parameter with ``:gt`` and ``:lt`` conditions. As in the API,
+``/user/folders`` returns the root folder as a single object, and
+``/user/history`` filters events by day with ``startDate`` and ``endDate``. Every
+response reports a ``limit-left`` value that goes down with each request.
+
+Run it standalone with ``python -m tests.mock_server --help``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import bisect
+import contextlib
+import dataclasses
+import datetime
+import json
+import random
+import threading
+import time
+import typing as t
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+if t.TYPE_CHECKING:
+    from types import TracebackType
+
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+EPOCH = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+
+QUESTION_TYPES = (
+    "control_textbox",
+    "control_textarea",
+    "control_dropdown",
+    "control_checkbox",
+    "control_email",
+    "control_fullname",
+    "control_datetime",
+)
+HISTORY_TYPES = ("userLogin", "formCreation", "formUpdate", "reportCreated")
+HISTORY_DATE_FORMAT = "%m/%d/%Y"
+
+
+@dataclasses.dataclass
+class MockDataset:
+    """Generated Jotform account data.
+
+    Records are generated deterministically from ``seed``, with creation dates
+    spread over the years since 2020.
+    """
+
+    forms: int = 10
+    submissions_per_form: int = 100
+    questions_per_form: int = 20
+    reports: int = 10
+    folders: int = 5
+    history: int = 100
+    history_interval: int = 6 * 3600
+    seed: int = 0
+
+    def __post_init__(self) -> None:
+        """Generate the records."""
+        rng = random.Random(self.seed)  # noqa: S311
+        self.form_rows = [self._form(rng, index) for index in range(self.forms)]
+        self.questions = {
+            form["id"]: self._questions(rng, form["id"]) for form in self.form_rows
+        }
+        self.submission_rows: dict[str, list[dict[str, t.Any]]] = {
+            form["id"]: [
+                self._submission(rng, form, index)
+                for index in range(self.submissions_per_form)
+            ]
+            for form in self.form_rows
+        }
+        # As in the API, the counters of a form describe its submissions
+        for form in self.form_rows:
+            rows = self.submission_rows[form["id"]]
+            form["count"] = str(len(rows))
+            form["last_submission"] = max(
+                (row["created_at"] for row in rows),
+                default=None,
+            )
+        self.report_rows = [
+            self._report(rng, index, self.form_rows[index % self.forms])
+            for index in range(self.reports if self.forms else 0)
+        ]
+        self.folder_rows = [self._folder(index) for index in range(self.folders)]
+        self.history_rows = [self._history(rng, index) for index in range(self.history)]
+
+    @staticmethod
+    def _date(rng: random.Random) -> str:
+        offset = datetime.timedelta(seconds=rng.randrange(4 * 365 * 24 * 3600))
+        return (EPOCH + offset).strftime(DATETIME_FORMAT)
+
+    def _form(self, rng: random.Random, index: int) -> dict[str, t.Any]:
+        form_id = str(240000000000000 + index)
+        created_at = self._date(rng)
+        updated_at = self._date(rng) if rng.random() < 0.5 else None
+        if updated_at is not None and updated_at < created_at:
+            created_at, updated_at = updated_at, created_at
+        return {
+            "id": form_id,
+            "username": "benchmark",
+            "title": f"Form {index}",
+            "height": str(rng.randrange(400, 2000)),
+            "url": f"https://form.jotform.com/{form_id}",
+            "status": "ENABLED",
+            "created_at": created_at,
+            "updated_at": updated_at,
+            "last_submission": None,
+            "new": str(rng.randrange(10)),
+            "count": "0",
+            "type": "LEGACY",
+            "favorite": "0",
+            "archived": "0",
+        }
+
+    def _questions(self, rng: random.Random, form_id: str) -> dict[str, t.Any]:
+        return {
+            str(qid): {
+                "qid": str(qid),
+                "name": f"question{qid}",
+                "order": str(qid),
+                "text": f"Question {qid}?",
+                "type": rng.choice(QUESTION_TYPES),
+                "required": "No",
+                "form": form_id,
+            }
+            for qid in range(1, self.questions_per_form + 1)
+        }
+
+    def _submission(
+        self,
+        rng: random.Random,
+        form: dict[str, t.Any],
+        index: int,
+    ) -> dict[str, t.Any]:
+        created_at = self._date(rng)
+        updated_at = None
+        if rng.random() < 0.2:
+            updated_at = max(created_at, self._date(rng))
+        answers = {}
+        for qid, question in self.questions[form["id"]].items():
+            answer: t.Any
+            if question["type"] == "control_fullname":
+                answer = {"first": f"First{index}", "last": f"Last{index}"}
+            elif question["type"] == "control_checkbox":
+                answer = [f"Option {n}" for n in range(rng.randrange(1, 4))]
+            else:
+                answer = f"Answer {index} to question {qid}"
+            answers[qid] = {
+                "name": question["name"],
+                "order": question["order"],
+                "text": question["text"],
+                "type": question["type"],
+                "answer": answer,
+            }
+        return {
+            "id": f"{form['id']}{index:06d}",
+            "form_id": form["id"],
+            "ip": f"10.0.{index // 256 % 256}.{index % 256}",
+            "created_at": created_at,
+            "updated_at": updated_at,
+            "status": "ACTIVE",
+            "new": str(rng.randrange(2)),
+            "flag": "0",
+            "notes": "",
+            "answers": answers,
+        }
+
+    def _report(
+        self,
+        rng: random.Random,
+        index: int,
+        form: dict[str, t.Any],
+    ) -> dict[str, t.Any]:
+        return {
+            "id": str(250000000000000 + index),
+            "form_id": form["id"],
+            "title": f"Report {index}",
+            "created_at": self._date(rng),
+            "updated_at": None,
+            "fields": "ip,dt,1,2,3",
+            "list_type": "grid",
+            "status": "ENABLED",
+            "url": f"https://www.jotform.com/report/{index}",
+            "isProtected": False,
+        }
+
+    def _folder(self, index: int) -> dict[str, t.Any]:
+        forms = {
+            form["id"]: form for form in self.form_rows[index :: max(self.folders, 1)]
+        }
+        return {
+            "id": f"folder{index}",
+            "path": f"folder{index}",
+            "owner": "benchmark",
+            "name": f"Folder {index}",
+            "parent": "root",
+            "color": "#ffffff",
+            "forms": forms,
+            "subfolders": [],
+        }
+
+    @property
+    def root_folder(self) -> dict[str, t.Any]:
+        """Return the root folder, holding every other folder.
+
+        Returns:
+            The root folder object.
+        """
+        return {
+            "id": "root",
+            "path": "root",
+            "owner": "benchmark",
+            "name": "benchmark",
+            "parent": "0",
+            "color": "#ffffff",
+            "forms": {},
+            "subfolders": self.folder_rows,
+        }
+
+    def _history(self, rng: random.Random, index: int) -> dict[str, t.Any]:
+        return {
+            "type": rng.choice(HISTORY_TYPES),
+            "username": "benchmark",
+            "ip": "10.0.0.1",
+            "server": "benchmark",
+            "timestamp": int(EPOCH.timestamp()) + index * self.history_interval,
+            "email": "benchmark@example.com",
+        }
+
+    @property
+    def all_submissions(self) -> list[dict[str, t.Any]]:
+        """Return the submissions of every form.
+
+        Returns:
+            A list of submissions.
+        """
+        return [row for rows in self.submission_rows.values() for row in rows]
+
+
+class _SortedView:
+    """Rows sorted by one field, for fast range filters."""
+
+    def __init__(self, rows: list[dict[str, t.Any]], field: str) -> None:
+        self.rows = sorted(rows, key=lambda row: row[field] or "")
+        self.keys = [row[field] or "" for row in self.rows]
+
+    def select(self, after: str | None, before: str | None) -> list[dict[str, t.Any]]:
+        start = bisect.bisect_right(self.keys, after) if after is not None else 0
+        end = (
+            bisect.bisect_left(self.keys, before)
+            if before is not None
+            else len(self.keys)
+        )
+        return self.rows[start:end]
+
+
+class _Server(ThreadingHTTPServer):
+    # Accept bursts of concurrent connections instead of dropping them
+    request_queue_size = 128
+
+
+class MockJotformServer:
+    """Serve a :class:`MockDataset` over HTTP on a background thread.
+
+    Use it as a context manager, and point the tap's ``api_url`` setting at
+    :attr:`url`.
+    """
+
+    def __init__(
+        self,
+        dataset: MockDataset | None = None,
+        *,
+        latency: float = 0,
+        limit_left: int = 100_000,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        """Create a new server.
+
+        Args:
+            dataset: The data to serve.
+            latency: Seconds to wait before answering each request.
+            limit_left: Daily quota reported in the first response.
+            host: Host to listen on.
+            port: Port to listen on, 0 for any free port.
+        """
+        self.dataset = dataset or MockDataset()
+        self.latency = latency
+        self.limit_left = limit_left
+        self.requests: list[str] = []
+
+        self._lock = threading.Lock()
+        self._views: dict[tuple[str, str], _SortedView] = {}
+        self._httpd = _Server((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """Return the base URL of the server.
+
+        Returns:
+            The base URL.
+        """
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def start(self) -> None:
+        """Start serving requests on a background thread."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop serving requests."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> MockJotformServer:  # noqa: PYI034
+        """Start the server.
+
+        Returns:
+            The server.
+        """
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Stop the server."""
+        self.stop()
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_GET(self) -> None:  # noqa: N802
+                url = urlparse(self.path)
+                params = {key: values[0] for key, values in parse_qs(url.query).items()}
+                status, payload = server.handle(url.path, params)
+                body = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: t.Any) -> None:  # noqa: A002
+                pass
+
+        return Handler
+
+    def handle(self, path: str, params: dict[str, str]) -> tuple[int, dict[str, t.Any]]:
+        """Answer a request.
+
+        Args:
+            path: The request path.
+            params: The query parameters.
+
+        Returns:
+            The HTTP status code and the response payload.
+        """
+        if self.latency:
+            time.sleep(self.latency)
+
+        with self._lock:
+            self.requests.append(path)
+            self.limit_left -= 1
+            limit_left = self.limit_left
+
+        parts = path.strip("/").split("/")
+        dataset = self.dataset
+        content: t.Any
+        if parts == ["user", "forms"]:
+            return 200, self._page("forms", dataset.form_rows, params, limit_left)
+        if parts == ["user", "submissions"]:
+            rows = dataset.all_submissions
+            return 200, self._page("submissions", rows, params, limit_left)
+        if parts == ["user", "reports"]:
+            content = dataset.report_rows
+        elif parts == ["user", "folders"]:
+            content = dataset.root_folder
+        elif parts == ["user", "history"]:
+            content = _filter_history(dataset.history_rows, params)
+        elif len(parts) == 3 and parts[0] == "form":
+            form_id, resource = parts[1:]
+            if resource == "questions" and form_id in dataset.questions:
+                content = dataset.questions[form_id]
+            elif resource == "submissions" and form_id in dataset.submission_rows:
+                rows = dataset.submission_rows[form_id]
+                return 200, self._page(path, rows, params, limit_left)
+            else:
+                return 404, _payload(404, "Not found", None, limit_left)
+        else:
+            return 404, _payload(404, "Not found", None, limit_left)
+
+        return 200, _payload(200, "success", content, limit_left)
+
+    def _page(
+        self,
+        key: str,
+        rows: list[dict[str, t.Any]],
+        params: dict[str, str],
+        limit_left: int,
+    ) -> dict[str, t.Any]:
+        field = params.get("orderby", "created_at")
+        conditions: dict[str, str] = json.loads(params.get("filter") or "{}")
+
+        view = self._views.get((key, field))
+        if view is None:
+            view = self._views[key, field] = _SortedView(rows, field)
+
+        selected = view.select(
+            conditions.pop(f"{field}:gt", None),
+            conditions.pop(f"{field}:lt", None),
+        )
+        for condition, value in conditions.items():
+            name, _, operator = condition.partition(":")
+            selected = [
+                row
+                for row in selected
+                if ((row[name] or "") > value if operator == "gt" else True)
+                and ((row[name] or "") < value if operator == "lt" else True)
+            ]
+        if params.get("direction", "DESC").upper() != "ASC":
+            selected = selected[::-1]
+
+        offset = int(params.get("offset", 0))
+        limit = int(params.get("limit", 20))
+        content = selected[offset : offset + limit]
+        payload = _payload(200, "success", content, limit_left)
+        payload["resultSet"] = {"offset": offset, "limit": limit, "count": len(content)}
+        return payload
+
+
+def _filter_history(
+    rows: list[dict[str, t.Any]],
+    params: dict[str, str],
+) -> list[dict[str, t.Any]]:
+    """Keep the events between ``startDate`` and ``endDate``, both included."""
+    days = [
+        datetime.datetime.strptime(params[key], HISTORY_DATE_FORMAT)
+        .replace(tzinfo=datetime.timezone.utc)
+        .date()
+        if key in params
+        else None
+        for key in ("startDate", "endDate")
+    ]
+    start, end = days
+    result = []
+    for row in rows:
+        day = datetime.datetime.fromtimestamp(
+            row["timestamp"],
+            tz=datetime.timezone.utc,
+        ).date()
+        if (start is None or day >= start) and (end is None or day <= end):
+            result.append(row)
+    return result
+
+
+def _payload(
+    code: int,
+    message: str,
+    content: t.Any,
+    limit_left: int,
+) -> dict[str, t.Any]:
+    return {
+        "responseCode": code,
+        "message": message,
+        "content": content,
+        "duration": "1ms",
+        "limit-left": limit_left,
+    }
+
+
+def add_dataset_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the options that size the generated data to a parser.
+
+    Args:
+        parser: The argument parser.
+    """
+    fields = {field.name: field.default for field in dataclasses.fields(MockDataset)}
+    for name, default in fields.items():
+        parser.add_argument(
+            f"--{name.replace('_', '-')}",
+            type=int,
+            default=default,
+            help=f"default: {default}",
+        )
+    parser.add_argument("--latency", type=float, default=0, help="seconds per request")
+    parser.add_argument("--limit-left", type=int, default=100_000)
+
+
+def dataset_from_arguments(args: argparse.Namespace) -> MockDataset:
+    """Build a dataset from parsed command line options.
+
+    Args:
+        args: The parsed options.
+
+    Returns:
+        A new dataset.
+    """
+    return MockDataset(
+        **{
+            field.name: getattr(args, field.name)
+            for field in dataclasses.fields(MockDataset)
+        },
+    )
+
+
+def main() -> None:
+    """Serve generated data until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_dataset_arguments(parser)
+    parser.add_argument("--port", type=int, default=8080)
+    args = parser.parse_args()
+
+    server = MockJotformServer(
+        dataset_from_arguments(args),
+        latency=args.latency,
+        limit_left=args.limit_left,
+        port=args.port,
+    )
+    print(f"Serving on {server.url}")  # noqa: T201
+    with server, contextlib.suppress(KeyboardInterrupt):
+        threading.Event().wait()
+
+
+if __name__ == "__main__":
+    main()
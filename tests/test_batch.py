@@ -0,0 +1,72 @@
+"""Tests for the BATCH message mode."""
+
+from __future__ import annotations
+
+import gzip
+import json
+import typing as t
+from urllib.parse import urlparse
+
+from tests.conftest import read_messages, sync_tap
+from tests.mock_server import MockDataset, MockJotformServer
+
+if t.TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+
+def _read_batch(url: str) -> list[dict[str, t.Any]]:
+    with gzip.open(urlparse(url).path, "rt") as file:
+        return [json.loads(line) for line in file]
+
+
+def test_batch_messages(capsys: pytest.CaptureFixture[str], tmp_path: Path):
+    dataset = MockDataset(forms=3, submissions_per_form=150, history=5)
+    with MockJotformServer(dataset) as server:
+        sync_tap(
+            server,
+            batch_config={
+                "encoding": {"format": "jsonl", "compression": "gzip"},
+                "storage": {"root": f"file://{tmp_path}", "prefix": "jotform-"},
+                "batch_size": 200,
+            },
+            batch_max_bytes=200_000,
+        )
+
+    messages = read_messages(capsys.readouterr().out)
+    record_streams = {
+        message["stream"] for message in messages if message["type"] == "RECORD"
+    }
+    assert record_streams == {"questions", "reports", "folders", "user_history"}
+
+    batches: dict[str, list[list[dict[str, t.Any]]]] = {}
+    for message in messages:
+        if message["type"] == "BATCH":
+            assert message["encoding"] == {"format": "jsonl", "compression": "gzip"}
+            (url,) = message["manifest"]
+            assert url.startswith(f"file://{tmp_path}/jotform-tap-jotform--")
+            batches.setdefault(message["stream"], []).append(_read_batch(url))
+
+    assert [len(batch) for batch in batches["forms"]] == [3]
+    submissions = [record for batch in batches["submissions"] for record in batch]
+    assert sorted(record["id"] for record in submissions) == sorted(
+        row["id"] for row in dataset.all_submissions
+    )
+    # Files are cut at the size limit before reaching the record limit
+    sizes = [len(batch) for batch in batches["submissions"]]
+    assert len(sizes) >= 3
+    assert all(size < 200 for size in sizes)
+
+    # Progress is only written once the records it covers are in a batch file
+    start = next(
+        index
+        for index, message in enumerate(messages)
+        if message["type"] == "SCHEMA" and message["stream"] == "submissions"
+    )
+    first_state = next(
+        message["type"]
+        for message in messages[start:]
+        if message["type"] in {"STATE", "BATCH"}
+    )
+    assert first_state == "BATCH"
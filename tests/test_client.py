@@ -0,0 +1,170 @@
+"""Tests for the Jotform REST client."""
+
+from __future__ import annotations
+
+import io
+import json
+import tracemalloc
+import typing as t
+
+import pytest
+import requests
+
+from tap_jotform import decoding
+from tap_jotform.client import JotformPaginator
+from tap_jotform.streams import FormsStream, QuestionsStream
+from tests.conftest import (
+    FakeSession,
+    build_tap,
+    make_page,
+    make_response,
+    offset_handler,
+)
+
+if t.TYPE_CHECKING:
+    from tap_jotform.tap import TapJotform
+
+
+def test_response_decoded_once_per_page(
+    tap: TapJotform,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    calls = []
+
+    def counting_loads(data: bytes) -> t.Any:
+        calls.append(data)
+        return decoding.json.loads(data)
+
+    monkeypatch.setattr(decoding, "_loads", counting_loads)
+
+    stream = FormsStream(tap)
+    paginator = JotformPaginator(0, 2)
+    rows = [{"id": str(i)} for i in range(2)]
+    response = make_response(make_page(rows, limit=2))
+
+    records = list(stream.parse_response(response))
+    paginator.advance(response)
+
+    assert records == rows
+    assert paginator.current_value == 2
+    assert len(calls) == 1
+
+
+def test_questions_decoded_once(tap: TapJotform, monkeypatch: pytest.MonkeyPatch):
+    calls = []
+
+    def counting_loads(data: bytes) -> t.Any:
+        calls.append(data)
+        return decoding.json.loads(data)
+
+    monkeypatch.setattr(decoding, "_loads", counting_loads)
+
+    stream = QuestionsStream(tap)
+    content = {"1": {"type": "control_head", "order": "1", "text": "Title"}}
+    response = make_response(make_page(content))
+
+    records = list(stream.parse_response(response))
+    decoding.decode_response(response)
+
+    assert [record["qid"] for record in records] == ["1"]
+    assert len(calls) == 1
+
+
+def test_prefetch_pages_in_order(monkeypatch: pytest.MonkeyPatch):
+    tap = build_tap(prefetch_pages=3)
+    stream = FormsStream(tap)
+    monkeypatch.setattr(stream, "page_size", 2)
+
+    rows = [
+        {"id": str(i), "created_at": "2024-01-01 00:00:00", "updated_at": None}
+        for i in range(11)
+    ]
+    session = FakeSession(offset_handler(rows))
+    stream._requests_session = session
+
+    records = list(stream.request_records(None))
+
+    assert [record["id"] for record in records] == [row["id"] for row in rows]
+    # 6 pages plus at most 3 prefetched requests past the short page
+    assert 6 <= len(session.requests) <= 9
+
+
+def test_prefetch_stops_on_empty_page(monkeypatch: pytest.MonkeyPatch):
+    tap = build_tap(prefetch_pages=2)
+    stream = FormsStream(tap)
+    monkeypatch.setattr(stream, "page_size", 2)
+
+    rows = [{"id": str(i)} for i in range(4)]
+    stream._requests_session = FakeSession(offset_handler(rows))
+
+    records = list(stream.request_records(None))
+
+    assert [record["id"] for record in records] == ["0", "1", "2", "3"]
+
+
+@pytest.mark.parametrize("stream_responses", [False, True])
+def test_keyset_pagination_with_ties(stream_responses: bool):  # noqa: FBT001
+    tap = build_tap(pagination_mode="keyset", stream_responses=stream_responses)
+    stream = FormsStream(tap)
+    stream.page_size = 2
+
+    values = ["a", "a", "b", "b", "b", "b", "c", "d", "d"]
+    rows = [
+        {"id": str(i), "created_at": value, "updated_at": None}
+        for i, value in enumerate(values)
+    ]
+
+    def handler(path: str, params: dict[str, str]) -> dict[str, t.Any]:  # noqa: ARG001
+        assert params["orderby"] == "created_at"
+        after = json.loads(params.get("filter", "{}")).get("created_at:gt", "")
+        offset = int(params.get("offset", 0))
+        limit = int(params["limit"])
+        matching = [row for row in rows if row["created_at"] > after]
+        return make_page(matching[offset : offset + limit], limit=limit)
+
+    session = FakeSession(handler)
+    stream._requests_session = session
+
+    records = list(stream.request_records(None))
+
+    assert [record["id"] for record in records] == [row["id"] for row in rows]
+    # Offsets never grow past the longest run of ties
+    assert max(int(params.get("offset", 0)) for _, params in session.requests) == 4
+
+
+def test_stream_content(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(decoding, "STREAM_CHUNK_SIZE", 3)
+    rows: list[dict[str, t.Any]] = [
+        {"id": "1", "title": "Café"},
+        {"id": "2", "title": "漢字", "n": 1.5},
+    ]
+    response = make_response(make_page(rows, limit=2, limit_left=12345))
+
+    records = list(decoding.stream_content(response, keep=("id",)))
+
+    assert records == rows
+    payload = decoding.decode_response(response)
+    assert payload["content"] == [{"id": "1"}, {"id": "2"}]
+    assert payload["resultSet"]["count"] == 2
+    assert payload["limit-left"] == 12345
+
+
+def test_stream_content_memory():
+    answers = {str(qid): {"answer": "x" * 50} for qid in range(50)}
+    rows = [{"id": str(i), "answers": answers} for i in range(1000)]
+    body = json.dumps(make_page(rows)).encode()
+
+    def peak_memory(parse: t.Callable[[requests.Response], t.Any]) -> int:
+        response = requests.Response()
+        response.raw = io.BytesIO(body)
+        tracemalloc.start()
+        try:
+            for _ in parse(response):
+                pass
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    streamed = peak_memory(decoding.stream_content)
+    loaded = peak_memory(lambda response: response.json()["content"])
+    assert streamed < len(body) / 5 < loaded
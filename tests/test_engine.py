@@ -0,0 +1,98 @@
+"""Tests for the async HTTP engine."""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+import threading
+import typing as t
+
+import pytest
+import requests
+
+from tap_jotform.engine import AsyncEngine, AsyncRequestExecutor
+from tap_jotform.session import ConnectionStats
+from tests.conftest import build_tap, read_messages, sync_tap
+from tests.mock_server import MockDataset, MockJotformServer
+
+pytest.importorskip("aiohttp")
+
+
+@pytest.fixture
+def engine() -> t.Iterator[AsyncEngine]:
+    engine = AsyncEngine(stats=ConnectionStats(), pool_size=4)
+    yield engine
+    engine.close()
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        pytest.param({"prefetch_pages": 3, "page_size": 50}, id="prefetch"),
+        pytest.param({"max_parallel_children": 4}, id="children"),
+        pytest.param(
+            {"submissions_by_form": True, "max_parallel_partitions": 3},
+            id="partitions",
+        ),
+    ],
+)
+def test_same_output_as_requests(
+    capsys: pytest.CaptureFixture[str],
+    config: dict[str, t.Any],
+):
+    dataset = MockDataset(forms=4, submissions_per_form=130, history=5)
+    outputs = []
+    with MockJotformServer(dataset) as server:
+        for engine in ("requests", "aiohttp"):
+            tap = sync_tap(server, http_engine=engine, **config)
+            outputs.append(read_messages(capsys.readouterr().out))
+
+    assert tap.sessions.stats.requests > 0
+    requests_messages, aiohttp_messages = outputs
+    assert aiohttp_messages == requests_messages
+
+
+def test_sessions_closed_after_sync():
+    with MockJotformServer(MockDataset(forms=1, submissions_per_form=10)) as server:
+        tap = build_tap(api_url=server.url, http_engine="aiohttp")
+        engine = tap.sessions.engine
+        tap.sync_all()
+
+    assert engine is not None
+    assert engine._session.closed
+    assert not engine._thread.is_alive()
+    assert tap.sessions._sessions == {}
+    assert tap.sessions._engine is None
+
+
+def test_executor_limits_coroutines_in_flight(engine: AsyncEngine):
+    executor = AsyncRequestExecutor(engine, max_in_flight=5)
+    running = peak = 0
+
+    async def work(value: int) -> int:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return value
+
+    threads = threading.active_count()
+    futures = [executor.submit(work, value) for value in range(20)]
+    assert threading.active_count() == threads
+    assert [future.result() for future in futures] == list(range(20))
+    assert peak == 5
+
+    executor.shutdown()
+    with pytest.raises(RuntimeError):
+        executor.submit(work, 0)
+
+
+def test_transport_errors_are_retriable(engine: AsyncEngine):
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    request = requests.Request("GET", f"http://127.0.0.1:{port}/user").prepare()
+    with pytest.raises(requests.exceptions.ConnectionError):
+        engine.run(engine.send(request, timeout=5))
@@ -0,0 +1,98 @@
+"""Tests for the performance metrics."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from tap_jotform.instrumentation import Histogram, format_summary
+from tests.conftest import sync_tap
+from tests.mock_server import MockDataset, MockJotformServer
+
+
+def test_histogram_quantiles():
+    histogram = Histogram((0.1, 1.0, float("inf")))
+    for value in (0.01, 0.02, 0.5, 0.7, 12.0):
+        histogram.observe(value)
+
+    assert histogram.counts == [2, 2, 1]
+    assert histogram.quantile(0.4) == 0.1
+    assert histogram.quantile(0.5) == 1.0
+    assert histogram.quantile(1) == 12.0
+    assert Histogram().quantile(0.5) == 0.0
+
+
+def test_format_summary():
+    table = format_summary(
+        [
+            {"stream": "forms", "requests": 1, "p50_s": 0.25},
+            {"stream": "submissions", "requests": 12, "p50_s": 1.5},
+        ],
+    ).splitlines()
+    assert table == [
+        "     stream  requests  p50_s",
+        "      forms         1  0.250",
+        "submissions        12  1.500",
+    ]
+
+
+@pytest.mark.parametrize("stream_responses", [False, True])
+def test_page_metrics(
+    caplog: pytest.LogCaptureFixture,
+    stream_responses: bool,  # noqa: FBT001
+):
+    dataset = MockDataset(forms=2, submissions_per_form=120, history=5)
+    with MockJotformServer(dataset) as server:
+        tap = sync_tap(
+            server, caplog=caplog, page_size=50, stream_responses=stream_responses
+        )
+
+    points = [
+        json.loads(record.getMessage().removeprefix("METRIC: "))
+        for record in caplog.records
+        if record.name == "singer_sdk.metrics"
+        and record.getMessage().startswith("METRIC: {")
+    ]
+    pages = [
+        point
+        for point in points
+        if point["metric"] == "jotform_page"
+        and point["tags"]["stream"] == "submissions"
+    ]
+    assert sum(page["tags"]["records"] for page in pages) == 240
+    assert all(page["tags"]["response_bytes"] > 0 for page in pages)
+    assert all(page["value"] > 0 for page in pages)
+    assert any(point["metric"] == "jotform_limit_left" for point in points)
+
+    metrics = tap.streams["submissions"].perf_metrics  # type: ignore[attr-defined]
+    assert metrics.requests == len(pages)
+    assert metrics.records == 240
+    assert metrics.post_process_seconds > 0
+    assert metrics.retries == 0
+    assert "Performance summary" in caplog.text
+
+
+def test_page_metrics_disabled(caplog: pytest.LogCaptureFixture):
+    dataset = MockDataset(forms=1, submissions_per_form=10, history=1)
+    with MockJotformServer(dataset) as server:
+        tap = sync_tap(server, caplog=caplog, performance_metrics=False)
+
+    assert all(
+        stream.perf_metrics is None  # type: ignore[attr-defined]
+        for stream in tap.streams.values()
+    )
+    assert "jotform_page" not in caplog.text
+    assert "Performance summary" not in caplog.text
+
+
+def test_run_costs_logged_once(caplog: pytest.LogCaptureFixture):
+    dataset = MockDataset(forms=2, submissions_per_form=10, history=1)
+    with MockJotformServer(dataset) as server:
+        sync_tap(server, caplog=caplog)
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert sum("reused an open connection" in message for message in messages) == 1
+    assert sum("left in the daily quota" in message for message in messages) == 1
+    assert sum("Performance summary" in message for message in messages) == 1
+    assert any("Stream 'submissions' issued" in message for message in messages)
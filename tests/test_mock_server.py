@@ -0,0 +1,121 @@
+"""End-to-end tests against the mock Jotform API."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from tap_jotform.tap import TapJotform
+from tests.conftest import read_messages, sync_tap
+from tests.mock_server import MockDataset, MockJotformServer
+
+
+@pytest.mark.parametrize("stream_responses", [False, True])
+def test_sync_all_streams(
+    capsys: pytest.CaptureFixture[str],
+    stream_responses: bool,  # noqa: FBT001
+):
+    dataset = MockDataset(forms=3, submissions_per_form=150, history=5)
+    with MockJotformServer(dataset, limit_left=500) as server:
+        tap = sync_tap(server, prefetch_pages=2, stream_responses=stream_responses)
+
+    messages = read_messages(capsys.readouterr().out)
+    counts: dict[str, int] = {}
+    for message in messages:
+        if message["type"] == "RECORD":
+            counts[message["stream"]] = counts.get(message["stream"], 0) + 1
+
+    assert counts == {
+        "forms": 3,
+        "questions": 3 * dataset.questions_per_form,
+        "submissions": 3 * 150,
+        "reports": dataset.reports,
+        # The root folder, holding the others
+        "folders": 1,
+        "user_history": 5,
+    }
+    assert tap.scheduler.limit_left == 500 - len(server.requests)
+
+
+def test_form_counters_match_submissions():
+    dataset = MockDataset(forms=3, submissions_per_form=20)
+    for form in dataset.form_rows:
+        rows = dataset.submission_rows[form["id"]]
+        assert form["count"] == str(len(rows))
+        assert form["last_submission"] == max(row["created_at"] for row in rows)
+
+
+def test_sync_form_partitions_in_windows(capsys: pytest.CaptureFixture[str]):
+    dataset = MockDataset(forms=4, submissions_per_form=130, history=0)
+    with MockJotformServer(dataset) as server:
+        sync_tap(
+            server,
+            submissions_by_form=True,
+            start_date="2020-01-01T00:00:00Z",
+            backfill_window_days=365,
+        )
+
+    ids = [
+        message["record"]["id"]
+        for message in read_messages(capsys.readouterr().out)
+        if message["type"] == "RECORD" and message["stream"] == "submissions"
+    ]
+    assert sorted(ids) == sorted(row["id"] for row in dataset.all_submissions)
+
+
+def test_filters_and_sorting():
+    dataset = MockDataset(forms=1, submissions_per_form=50)
+    server = MockJotformServer(dataset)
+    rows = dataset.all_submissions
+    after = sorted(row["created_at"] for row in rows)[9]
+
+    status, payload = server.handle(
+        "/user/submissions",
+        {
+            "orderby": "created_at",
+            "direction": "ASC",
+            "filter": json.dumps({"created_at:gt": after}),
+            "limit": "100",
+        },
+    )
+
+    assert status == 200
+    values = [row["created_at"] for row in payload["content"]]
+    assert values == sorted(values)
+    assert len(values) == 40
+    assert payload["resultSet"]["count"] == 40
+
+
+def test_history_date_filters():
+    dataset = MockDataset(forms=0, history=10, history_interval=24 * 3600)
+    server = MockJotformServer(dataset)
+
+    _, payload = server.handle(
+        "/user/history",
+        {"startDate": "01/03/2020", "endDate": "01/05/2020"},
+    )
+
+    assert payload["content"] == dataset.history_rows[2:5]
+
+
+def test_sync_history_windows(capsys: pytest.CaptureFixture[str]):
+    dataset = MockDataset(forms=0, history=60, history_interval=24 * 3600)
+    with MockJotformServer(dataset) as server:
+        TapJotform(
+            config={
+                "api_key": "test",
+                "api_url": server.url,
+                "start_date": "2020-01-10T00:00:00Z",
+                "max_parallel_windows": 3,
+            },
+            validate_config=False,
+        ).streams["user_history"].sync()
+
+    timestamps = [
+        json.loads(line)["record"]["timestamp"]
+        for line in capsys.readouterr().out.splitlines()
+        if line.startswith('{"type":"RECORD"')
+    ]
+    assert timestamps == [row["timestamp"] for row in dataset.history_rows[9:]]
+    assert server.requests.count("/user/history") > 2
@@ -0,0 +1,56 @@
+"""Tests for the buffered Singer message writer."""
+
+from __future__ import annotations
+
+import json
+import typing as t
+from decimal import Decimal
+
+from singer_sdk._singerlib import RecordMessage, StateMessage
+
+from tap_jotform.output import BufferedSingerWriter
+from tests.conftest import read_messages, sync_tap
+from tests.mock_server import MockDataset, MockJotformServer
+
+if t.TYPE_CHECKING:
+    import pytest
+
+
+def test_buffered_output_matches_sdk_writer(capsys: pytest.CaptureFixture[str]):
+    dataset = MockDataset(forms=2, submissions_per_form=120, history=5)
+    configs: list[dict[str, t.Any]] = [
+        {},
+        {"buffered_output": True, "output_buffer_size": 4096},
+    ]
+    outputs = []
+    with MockJotformServer(dataset) as server:
+        for config in configs:
+            sync_tap(server, **config)
+            outputs.append(read_messages(capsys.readouterr().out))
+
+    sdk_messages, buffered_messages = outputs
+    assert len(sdk_messages) > 300
+    assert buffered_messages == sdk_messages
+
+
+def test_state_messages_are_written_immediately(
+    capsys: pytest.CaptureFixture[str],
+):
+    writer = BufferedSingerWriter()
+    writer.write_message(RecordMessage(stream="forms", record={"id": "Café"}))
+    assert capsys.readouterr().out == ""
+
+    writer.write_message(StateMessage(value={"bookmarks": {}}))
+    writer.write_message(RecordMessage(stream="forms", record={"id": Decimal("1.5")}))
+    lines = capsys.readouterr().out.splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {"type": "RECORD", "stream": "forms", "record": {"id": "Café"}},
+        {"type": "STATE", "value": {"bookmarks": {}}},
+    ]
+
+    writer.flush()
+    assert json.loads(capsys.readouterr().out) == {
+        "type": "RECORD",
+        "stream": "forms",
+        "record": {"id": 1.5},
+    }
@@ -0,0 +1,94 @@
+"""Tests for the request scheduler."""
+
+from __future__ import annotations
+
+import pytest
+
+from tap_jotform.scheduler import RequestBudgetExhaustedError, RequestScheduler
+from tap_jotform.streams import FormsStream
+from tests.conftest import (
+    FakeSession,
+    build_tap,
+    offset_handler,
+    read_messages,
+    sync_tap,
+)
+from tests.mock_server import MockDataset, MockJotformServer
+
+
+def test_request_budget():
+    scheduler = RequestScheduler(request_budget=2)
+    scheduler.acquire("forms")
+    scheduler.acquire("submissions")
+
+    with pytest.raises(RequestBudgetExhaustedError):
+        scheduler.acquire("forms")
+
+    assert scheduler.requests == {"forms": 1, "submissions": 1}
+
+
+def test_min_limit_left():
+    scheduler = RequestScheduler(min_limit_left=10)
+    scheduler.update(12)
+    scheduler.acquire("forms")
+    scheduler.acquire("forms")
+
+    with pytest.raises(RequestBudgetExhaustedError):
+        scheduler.acquire("forms")
+
+
+def test_limit_left_keeps_lowest_value():
+    scheduler = RequestScheduler()
+    scheduler.update("100")
+    scheduler.update(105)
+    assert scheduler.limit_left == 100
+
+
+def test_pacing():
+    now = 0.0
+    sleeps: list[float] = []
+
+    def sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+
+    scheduler = RequestScheduler(
+        max_requests_per_second=2,
+        clock=lambda: now,
+        sleep=sleep,
+    )
+    for _ in range(3):
+        scheduler.acquire("forms")
+
+    assert sleeps == [0.5, 1.0]
+
+
+def test_stream_stops_when_budget_exhausted():
+    tap = build_tap(request_budget=2)
+    stream = FormsStream(tap)
+    stream.page_size = 2
+    rows = [{"id": str(i)} for i in range(10)]
+    stream._requests_session = FakeSession(offset_handler(rows))
+
+    records = list(stream.request_records(None))
+
+    assert [record["id"] for record in records] == ["0", "1", "2", "3"]
+
+
+def test_submissions_by_form_stop_when_budget_exhausted(
+    capsys: pytest.CaptureFixture[str],
+):
+    with MockJotformServer(MockDataset(forms=5)) as server:
+        tap = sync_tap(
+            server,
+            page_size=2,
+            request_budget=3,
+            submissions_by_form=True,
+        )
+
+    assert tap.streams["submissions"].partitions == []
+    messages = read_messages(capsys.readouterr().out)
+    assert not [
+        message
+        for message in messages
+        if message["type"] == "RECORD" and message["stream"] == "submissions"
+    ]
@@ -0,0 +1,73 @@
+"""Tests for the shared HTTP sessions."""
+
+from __future__ import annotations
+
+from tap_jotform.session import LRUDict, SessionRegistry
+from tests.conftest import build_tap
+from tests.mock_server import MockDataset, MockJotformServer
+
+
+def test_streams_share_one_session():
+    tap = build_tap()
+    sessions = {id(stream.requests_session) for stream in tap.streams.values()}
+    assert len(sessions) == 1
+
+
+def test_connections_are_reused():
+    registry = SessionRegistry()
+    with MockJotformServer(MockDataset(forms=1)) as server:
+        session = registry.get()
+        for _ in range(5):
+            session.get(f"{server.url}/user/forms").raise_for_status()
+
+    assert registry.stats.requests == 5
+    assert registry.stats.connections == 1
+    assert registry.stats.reused == 4
+
+
+def test_keep_alive_disabled():
+    registry = SessionRegistry(keep_alive=False)
+    with MockJotformServer(MockDataset(forms=1)) as server:
+        session = registry.get()
+        for _ in range(3):
+            session.get(f"{server.url}/user/forms").raise_for_status()
+
+    assert registry.stats.connections == 3
+
+
+def test_lru_cache_evicts_least_recently_used():
+    storage = LRUDict(max_entries=2)
+    storage["a"] = 1
+    storage["b"] = 2
+    assert storage["a"] == 1
+    storage["c"] = 3
+    assert set(storage) == {"a", "c"}
+
+
+def test_stream_cache_expiration():
+    tap = build_tap(
+        requests_cache={
+            "enabled": True,
+            "config": {"stream_expire_after": {"questions": 86400, "submissions": 60}},
+        },
+    )
+    assert tap.get_cache_expiration() == {
+        "api.jotform.com/form/*/questions": 86400,
+        "api.jotform.com/user/submissions": 60,
+    }
+
+
+def test_cache_keys_ignore_api_key():
+    registry = SessionRegistry(cache_config={"backend": "memory", "max_entries": 10})
+    session = registry.get()
+    with MockJotformServer(MockDataset(forms=3)) as server:
+        for api_key in ("old-key", "new-key"):
+            response = session.get(
+                f"{server.url}/user/forms",
+                headers={"APIKEY": api_key, "User-Agent": api_key},
+            )
+            registry.cache_stats.add("forms", response)
+
+    assert len(server.requests) == 1
+    assert registry.cache_stats.hits["forms"] == 1
+    assert registry.cache_stats.misses["forms"] == 1
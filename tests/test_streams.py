@@ -0,0 +1,598 @@
+"""Tests for the Jotform stream classes."""
+
+from __future__ import annotations
+
+import datetime
+import json
+import typing as t
+
+import pytest
+from singer_sdk._singerlib import Catalog
+
+from tap_jotform import streams
+from tap_jotform.tap import TapJotform
+from tests.conftest import FakeSession, build_tap, make_page
+
+
+def _forms(count: int) -> list[dict[str, t.Any]]:
+    return [
+        {
+            "id": str(form_id),
+            "created_at": "2024-01-01 00:00:00",
+            "updated_at": None,
+            "count": "1",
+        }
+        for form_id in range(count)
+    ]
+
+
+def _handler(forms: list[dict[str, t.Any]]) -> t.Callable[..., dict[str, t.Any]]:
+    def handler(path: str, params: dict[str, str]) -> dict[str, t.Any]:
+        if path == "/user/forms":
+            offset = int(params.get("offset", 0))
+            limit = int(params.get("limit", 100))
+            return make_page(forms[offset : offset + limit], offset=offset, limit=limit)
+
+        form_id = path.split("/")[2]
+        if path.endswith("/submissions"):
+            submissions = [
+                {
+                    "id": f"{form_id}-{index}",
+                    "form_id": form_id,
+                    "created_at": f"2024-01-0{index + 1} 00:00:00",
+                    "updated_at": None,
+                    "answers": {"1": {"answer": index}},
+                }
+                for index in range(2)
+            ]
+            return make_page(submissions)
+
+        questions = {
+            str(qid): {"type": "control_textbox", "order": str(qid), "form": form_id}
+            for qid in range(1, 3)
+        }
+        return make_page(questions)
+
+    return handler
+
+
+def _read_messages(capsys: pytest.CaptureFixture[str]) -> list[dict[str, t.Any]]:
+    return [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+
+def _use_session(tap: TapJotform, session: FakeSession) -> None:
+    for stream in tap.streams.values():
+        stream._requests_session = session  # type: ignore[attr-defined]
+
+
+def test_questions_fan_out(capsys: pytest.CaptureFixture[str]):
+    tap = build_tap(max_parallel_children=4)
+    session = FakeSession(_handler(_forms(10)))
+    _use_session(tap, session)
+
+    tap.streams["forms"].sync()
+
+    records = [
+        message["record"]
+        for message in _read_messages(capsys)
+        if message["type"] == "RECORD" and message["stream"] == "questions"
+    ]
+    assert [(record["form_id"], record["qid"]) for record in records] == [
+        (str(form_id), qid) for form_id in range(10) for qid in ("1", "2")
+    ]
+    question_requests = [path for path, _ in session.requests if "questions" in path]
+    assert len(question_requests) == 10
+
+
+def test_submissions_by_form(capsys: pytest.CaptureFixture[str]):
+    tap = build_tap(submissions_by_form=True, max_parallel_partitions=2)
+    session = FakeSession(_handler(_forms(3)))
+    _use_session(tap, session)
+
+    tap.streams["submissions"].sync()
+
+    messages = _read_messages(capsys)
+    records = [message["record"] for message in messages if message["type"] == "RECORD"]
+    assert [record["id"] for record in records] == [
+        f"{form_id}-{index}" for form_id in range(3) for index in range(2)
+    ]
+    assert {path for path, _ in session.requests} == {
+        "/user/forms",
+        "/form/0/submissions",
+        "/form/1/submissions",
+        "/form/2/submissions",
+    }
+
+    state = messages[-1]["value"]["bookmarks"]["submissions"]
+    assert [partition["context"] for partition in state["partitions"]] == [
+        {"form_id": str(form_id)} for form_id in range(3)
+    ]
+
+
+def test_incremental_submissions(capsys: pytest.CaptureFixture[str]):
+    submissions: list[dict[str, t.Any]] = [
+        # Created before the bookmark, never updated
+        {"id": "1", "created_at": "2024-01-01 00:00:00", "updated_at": None},
+        # Created before the bookmark, updated after it
+        {"id": "2", "created_at": "2024-01-01 00:00:00", "updated_at": "2024-03-01"},
+        # Created after the bookmark, never updated
+        {"id": "3", "created_at": "2024-02-15 00:00:00", "updated_at": None},
+        # Created and updated after the bookmark
+        {"id": "4", "created_at": "2024-02-15 00:00:00", "updated_at": "2024-03-02"},
+    ]
+
+    def handler(path: str, params: dict[str, str]) -> dict[str, t.Any]:  # noqa: ARG001
+        ((key, value),) = json.loads(params["filter"]).items()
+        field = key.split(":")[0]
+        assert params["orderby"] == field
+        rows = [row for row in submissions if (row[field] or "") > value]
+        return make_page(rows)
+
+    tap = build_tap()
+    tap.load_state(
+        {
+            "bookmarks": {
+                "submissions": {
+                    "replication_key": "updated_at",
+                    "replication_key_value": "2024-02-01 00:00:00",
+                },
+            },
+        },
+    )
+    session = FakeSession(handler)
+    _use_session(tap, session)
+
+    tap.streams["submissions"].sync()
+    tap.streams["submissions"].finalize_state_progress_markers()
+
+    messages = _read_messages(capsys)
+    records = [message["record"] for message in messages if message["type"] == "RECORD"]
+    assert [record["id"] for record in records] == ["3", "4", "2"]
+    assert [json.loads(params["filter"]) for _, params in session.requests] == [
+        {"created_at:gt": "2024-02-01 00:00:00"},
+        {"updated_at:gt": "2024-02-01 00:00:00"},
+    ]
+
+    state = messages[-1]["value"]["bookmarks"]["submissions"]
+    assert state["replication_key_value"] == "2024-03-02"
+
+
+def test_backfill_windows(capsys: pytest.CaptureFixture[str]):
+    submissions: list[dict[str, t.Any]] = [
+        {"id": str(index), "created_at": created_at, "updated_at": None}
+        for index, created_at in enumerate(
+            [
+                "2024-01-15 00:00:00",
+                "2024-02-15 00:00:00",
+                "2024-03-15 00:00:00",
+                # On the boundary between the first two windows
+                "2025-01-01 00:00:00",
+            ],
+        )
+    ]
+
+    def handler(path: str, params: dict[str, str]) -> dict[str, t.Any]:  # noqa: ARG001
+        conditions = json.loads(params["filter"])
+        rows = [
+            row
+            for row in submissions
+            if all(
+                (row[key.split(":")[0]] or "") > value
+                if key.endswith(":gt")
+                else (row[key.split(":")[0]] or "") < value
+                for key, value in conditions.items()
+            )
+        ]
+        return make_page(rows)
+
+    tap = build_tap(
+        start_date="2024-01-01T00:00:00Z",
+        backfill_window_days=366,
+        max_parallel_windows=2,
+    )
+    session = FakeSession(handler)
+    _use_session(tap, session)
+
+    tap.streams["submissions"].sync()
+
+    messages = _read_messages(capsys)
+    records = [message["record"] for message in messages if message["type"] == "RECORD"]
+    assert [record["id"] for record in records] == ["0", "1", "2", "3"]
+
+    filters = [json.loads(params["filter"]) for _, params in session.requests]
+    assert filters[0] == {
+        "created_at:gt": "2023-12-31 23:59:59",
+        "created_at:lt": "2025-01-01 00:00:00",
+    }
+    assert filters[1]["created_at:gt"] == "2024-12-31 23:59:59"
+    assert filters[-1] == {"updated_at:gt": "2024-01-01 00:00:00"}
+
+    checkpoints = [
+        message["value"]["bookmarks"]["submissions"].get("backfilled_until")
+        for message in messages
+        if message["type"] == "STATE"
+    ]
+    assert "2025-01-01 00:00:00" in checkpoints
+    assert checkpoints[-1] is None
+
+
+def _unix_time(value: str) -> int:
+    return int(datetime.datetime.fromisoformat(value + "+00:00").timestamp())
+
+
+def _history_handler(
+    events: list[dict[str, t.Any]],
+) -> t.Callable[..., dict[str, t.Any]]:
+    def handler(path: str, params: dict[str, str]) -> dict[str, t.Any]:  # noqa: ARG001
+        start, end = (
+            datetime.datetime.strptime(params[key], "%m/%d/%Y")
+            .replace(tzinfo=datetime.timezone.utc)
+            .date()
+            for key in ("startDate", "endDate")
+        )
+        return make_page(
+            [
+                event
+                for event in events
+                if start
+                <= datetime.datetime.fromtimestamp(
+                    event["timestamp"],
+                    tz=datetime.timezone.utc,
+                ).date()
+                <= end
+            ],
+        )
+
+    return handler
+
+
+HISTORY_EVENTS = [
+    {"username": "ada", "type": "userLogin", "timestamp": _unix_time(value)}
+    for value in (
+        "2023-12-31 23:00:00",
+        "2024-01-01 00:00:00",
+        "2024-12-31 12:00:00",
+        "2025-01-01 06:00:00",
+        "2025-06-01 00:00:00",
+    )
+]
+
+
+def test_user_history_windows(capsys: pytest.CaptureFixture[str]):
+    tap = build_tap(
+        start_date="2024-01-01T00:00:00Z",
+        history_window_days=366,
+        max_parallel_windows=2,
+    )
+    session = FakeSession(_history_handler(HISTORY_EVENTS))
+    _use_session(tap, session)
+
+    tap.streams["user_history"].sync()
+
+    messages = _read_messages(capsys)
+    records = [message["record"] for message in messages if message["type"] == "RECORD"]
+    assert [record["timestamp"] for record in records] == [
+        event["timestamp"] for event in HISTORY_EVENTS[1:]
+    ]
+    assert session.requests[0][1] == {
+        "action": "all",
+        "sortBy": "ASC",
+        "startDate": "12/31/2023",
+        "endDate": "01/01/2025",
+    }
+    assert session.requests[1][1]["startDate"] == "12/31/2024"
+
+    bookmarks = [
+        message["value"]["bookmarks"]["user_history"]
+        for message in messages
+        if message["type"] == "STATE"
+    ]
+    assert any(
+        bookmark.get("synced_until") == "2024-12-31 00:00:00" for bookmark in bookmarks
+    )
+    assert bookmarks[-1]["replication_key_value"] == HISTORY_EVENTS[-1]["timestamp"]
+    assert bookmarks[-1]["synced_until"] > "2025-06-01"
+
+    # The next run starts from where the previous one stopped
+    tap = build_tap(start_date="2024-01-01T00:00:00Z")
+    tap.load_state({"bookmarks": {"user_history": bookmarks[-1]}})
+    session = FakeSession(_history_handler(HISTORY_EVENTS))
+    _use_session(tap, session)
+
+    tap.streams["user_history"].sync()
+
+    assert len(session.requests) == 1
+    records = [
+        message["record"]
+        for message in _read_messages(capsys)
+        if message["type"] == "RECORD"
+    ]
+    assert records == []
+
+
+def test_user_history_incremental(capsys: pytest.CaptureFixture[str]):
+    bookmark = HISTORY_EVENTS[3]["timestamp"]
+    tap = build_tap(start_date="2024-01-01T00:00:00Z")
+    tap.load_state(
+        {
+            "bookmarks": {
+                "user_history": {
+                    "replication_key": "timestamp",
+                    "replication_key_value": bookmark,
+                },
+            },
+        },
+    )
+    session = FakeSession(_history_handler(HISTORY_EVENTS))
+    _use_session(tap, session)
+
+    tap.streams["user_history"].sync()
+
+    records = [
+        message["record"]
+        for message in _read_messages(capsys)
+        if message["type"] == "RECORD"
+    ]
+    assert [record["timestamp"] for record in records] == [
+        bookmark,
+        HISTORY_EVENTS[4]["timestamp"],
+    ]
+    assert session.requests[0][1]["startDate"] == "12/31/2024"
+
+
+@pytest.mark.parametrize("stream_responses", [False, True])
+def test_resume_interrupted_sync(
+    capsys: pytest.CaptureFixture[str],
+    stream_responses: bool,  # noqa: FBT001
+):
+    submissions: list[dict[str, t.Any]] = [
+        {"id": str(index), "created_at": f"2024-01-0{index + 1} 00:00:00"}
+        for index in range(5)
+    ]
+    for row in submissions:
+        row["updated_at"] = "2024-06-01" if row["id"] == "1" else None
+    fail_at_offset: int | None = 4
+
+    def handler(path: str, params: dict[str, str]) -> dict[str, t.Any]:  # noqa: ARG001
+        offset = int(params.get("offset", 0))
+        if offset == fail_at_offset:
+            msg = "Connection lost"
+            raise RuntimeError(msg)
+        return make_page(submissions[offset : offset + 2], offset=offset, limit=2)
+
+    def sync(state: dict[str, t.Any]) -> tuple[FakeSession, list[dict[str, t.Any]]]:
+        tap = build_tap(stream_responses=stream_responses)
+        tap.load_state(state)
+        stream = tap.streams["submissions"]
+        stream.page_size = 2  # type: ignore[attr-defined]
+        session = FakeSession(handler)
+        _use_session(tap, session)
+        try:
+            stream.sync()
+        except RuntimeError:
+            pass
+        else:
+            stream.finalize_state_progress_markers()
+        return session, _read_messages(capsys)
+
+    _, messages = sync({})
+    records = [message["record"] for message in messages if message["type"] == "RECORD"]
+    assert [record["id"] for record in records] == ["0", "1", "2", "3"]
+    state = [message for message in messages if message["type"] == "STATE"][-1]
+    assert state["value"]["bookmarks"]["submissions"]["resume"] == {
+        "field": "created_at",
+        "after": None,
+        "offset": 4,
+        "replication_key_value": "2024-06-01",
+    }
+
+    fail_at_offset = None
+    session, messages = sync(state["value"])
+    records = [message["record"] for message in messages if message["type"] == "RECORD"]
+    assert [record["id"] for record in records] == ["4"]
+    assert [params.get("offset") for _, params in session.requests] == ["4"]
+
+    bookmark = messages[-1]["value"]["bookmarks"]["submissions"]
+    assert "resume" not in bookmark
+    assert bookmark["replication_key_value"] == "2024-06-01"
+
+
+def test_questions_of_unchanged_forms_skipped(capsys: pytest.CaptureFixture[str]):
+    forms = _forms(3)
+
+    def sync(state: dict[str, t.Any]) -> tuple[FakeSession, dict[str, t.Any]]:
+        tap = build_tap()
+        tap.load_state(state)
+        session = FakeSession(_handler(forms))
+        _use_session(tap, session)
+        tap.streams["forms"].sync()
+        return session, _read_messages(capsys)[-1]["value"]
+
+    _, state = sync({})
+    partitions = state["bookmarks"]["questions"]["partitions"]
+    assert [partition["context"] for partition in partitions] == [
+        {"form_id": str(form_id)} for form_id in range(3)
+    ]
+    assert partitions[0]["fingerprint"] == "2024-01-01 00:00:00"
+
+    # Forms are synced again from scratch, only one was edited
+    forms[1]["updated_at"] = "2024-02-01 00:00:00"
+    del state["bookmarks"]["forms"]
+    session, _ = sync(state)
+
+    question_requests = [path for path, _ in session.requests if "questions" in path]
+    assert question_requests == ["/form/1/questions"]
+
+
+def test_submissions_planned_from_form_counts(capsys: pytest.CaptureFixture[str]):
+    forms = _forms(3)
+    for form, count in zip(forms, ("0", "2", "500")):
+        form["count"] = count
+        form["last_submission"] = "2024-01-02 00:00:00" if count != "0" else None
+
+    tap = build_tap(submissions_by_form=True)
+    tap.load_state(
+        {
+            "bookmarks": {
+                "submissions": {
+                    "partitions": [
+                        {
+                            "context": {"form_id": "1"},
+                            "replication_key": "updated_at",
+                            "replication_key_value": "2024-02-01 00:00:00",
+                        },
+                    ],
+                },
+            },
+        },
+    )
+    session = FakeSession(_handler(forms))
+    _use_session(tap, session)
+
+    tap.streams["submissions"].sync()
+
+    records = [
+        message["record"]
+        for message in _read_messages(capsys)
+        if message["type"] == "RECORD"
+    ]
+    assert [record["id"] for record in records] == ["2-0", "2-1", "1-0", "1-1"]
+
+    submission_requests = [
+        (path, params["limit"], json.loads(params.get("filter", "{}")))
+        for path, params in session.requests
+        if path.endswith("/submissions")
+    ]
+    assert submission_requests == [
+        # The largest form first, in a single page
+        ("/form/2/submissions", "501", {}),
+        # No submissions since the bookmark, only edits are requested
+        ("/form/1/submissions", "100", {"updated_at:gt": "2024-02-01 00:00:00"}),
+    ]
+
+
+def test_deselected_properties(
+    capsys: pytest.CaptureFixture[str],
+    monkeypatch: pytest.MonkeyPatch,
+):
+    def fail(_: t.Any) -> t.Any:
+        pytest.fail("Deselected answers were converted")
+
+    monkeypatch.setitem(streams.ANSWERS_CONVERTERS, "json_list", fail)
+
+    config = {"api_key": "test", "submissions_by_form": True}
+    catalog = Catalog.from_dict(build_tap(**config).catalog_dict)
+    deselected = {
+        "forms": ("count", "last_submission", "created_at"),
+        "submissions": ("answers", "ip"),
+    }
+    for entry in catalog.streams:
+        entry.metadata.root.selected = entry.tap_stream_id in deselected
+        for name in deselected.get(entry.tap_stream_id, ()):
+            entry.metadata[("properties", name)].selected = False
+
+    tap = TapJotform(config=config, catalog=catalog.to_dict(), validate_config=False)
+    forms = _forms(2)
+    forms[0]["count"] = "0"
+    _use_session(tap, FakeSession(_handler(forms)))
+    tap.sync_all()
+
+    records = [
+        (message["stream"], message["record"])
+        for message in _read_messages(capsys)
+        if message["type"] == "RECORD"
+    ]
+    # Forms are still planned from their submission counts
+    assert [record["id"] for _, record in records] == ["0", "1", "1-0", "1-1"]
+    assert records[0][1] == {
+        "id": "0",
+        "height": None,
+        "updated_at": "2024-01-01 00:00:00",
+        "new": None,
+        "favorite": None,
+        "archived": None,
+    }
+    assert "answers" not in records[2][1]
+    assert "ip" not in records[2][1]
+
+
+def test_child_stream_of_deselected_parent(capsys: pytest.CaptureFixture[str]):
+    config = {"api_key": "test"}
+    catalog = Catalog.from_dict(build_tap(**config).catalog_dict)
+    for entry in catalog.streams:
+        entry.metadata.root.selected = entry.tap_stream_id == "questions"
+
+    tap = TapJotform(config=config, catalog=catalog.to_dict(), validate_config=False)
+    _use_session(tap, FakeSession(_handler(_forms(2))))
+    tap.sync_all()
+
+    records = [
+        (message["stream"], message["record"]["form_id"])
+        for message in _read_messages(capsys)
+        if message["type"] == "RECORD"
+    ]
+    assert records == [("questions", "0")] * 2 + [("questions", "1")] * 2
+
+
+@pytest.mark.parametrize(
+    ("answers_format", "expected"),
+    [
+        (
+            "json_list",
+            [
+                {"qid": "1", "answer": '"Caf\\u00e9"'},
+                {"qid": "2", "answer": '["a", "b"]'},
+                {"qid": "3", "answer": '{"first": "Ada"}'},
+                {"qid": "4", "answer": None},
+            ],
+        ),
+        (
+            "objects",
+            [
+                {"qid": "1", "answer": "Café"},
+                {"qid": "2", "answer": ["a", "b"]},
+                {"qid": "3", "answer": {"first": "Ada"}},
+                {"qid": "4", "answer": None},
+            ],
+        ),
+        (
+            "map",
+            {"1": "Café", "2": ["a", "b"], "3": {"first": "Ada"}, "4": None},
+        ),
+    ],
+)
+def test_answers_format(
+    capsys: pytest.CaptureFixture[str],
+    answers_format: str,
+    expected: t.Any,
+):
+    answers = {
+        "1": {"name": "name", "type": "control_textbox", "answer": "Café"},
+        "2": {"name": "options", "type": "control_checkbox", "answer": ["a", "b"]},
+        "3": {
+            "name": "fullName",
+            "type": "control_fullname",
+            "answer": {"first": "Ada"},
+        },
+        "4": {"name": "header", "type": "control_head"},
+    }
+    submission = {
+        "id": "1",
+        "created_at": "2024-01-01 00:00:00",
+        "updated_at": None,
+        "answers": answers,
+    }
+
+    tap = build_tap(answers_format=answers_format)
+    _use_session(tap, FakeSession(lambda *_: make_page([submission])))
+    tap.streams["submissions"].sync()
+
+    messages = _read_messages(capsys)
+    schema = next(message for message in messages if message["type"] == "SCHEMA")
+    (record,) = [
+        message["record"] for message in messages if message["type"] == "RECORD"
+    ]
+    assert record["answers"] == expected
+    assert schema["schema"]["properties"]["answers"]["type"][0] == (
+        "object" if answers_format == "map" else "array"
+    )
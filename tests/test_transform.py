@@ -0,0 +1,148 @@
+"""Tests for record transformers."""
+
+from __future__ import annotations
+
+import pickle
+import typing as t
+
+import pytest
+
+from tap_jotform.streams import FoldersStream, SubmissionsStream
+from tap_jotform.transform import RecordTransformer, split_commas, to_integer
+from tests.conftest import (
+    FakeSession,
+    build_tap,
+    make_page,
+    read_messages,
+    sync_tap,
+)
+from tests.mock_server import MockDataset, MockJotformServer
+
+
+def test_transformer_projects_and_converts():
+    transformer = RecordTransformer(
+        ("id", "count", "fields", "updated_at", "created_at"),
+        converters={"count": to_integer, "fields": split_commas},
+        fallbacks={"updated_at": "created_at"},
+    )
+    row = {
+        "id": "1",
+        "count": "12",
+        "created_at": "2024-01-01 00:00:00",
+        "updated_at": None,
+        "unknown": "dropped",
+    }
+
+    assert transformer(row) == {
+        "id": "1",
+        "count": 12,
+        "fields": [""],
+        "updated_at": "2024-01-01 00:00:00",
+        "created_at": "2024-01-01 00:00:00",
+    }
+
+
+def test_transformer_keeps_all_fields():
+    transformer = RecordTransformer(converters={"new": to_integer})
+    assert transformer({"id": "1", "new": "0", "extra": True}) == {
+        "id": "1",
+        "new": 0,
+        "extra": True,
+    }
+
+
+def test_stream_transformers_can_be_pickled():
+    tap = build_tap(answers_format="objects")
+    submission = {
+        "id": "1",
+        "flag": "1",
+        "created_at": "2024-01-01 00:00:00",
+        "updated_at": None,
+        "answers": {"3": {"answer": {"first": "Ada"}, "text": "Name"}},
+    }
+    folder = {"id": "f", "forms": {"2": {"id": "2", "count": "5", "other": "x"}}}
+
+    for stream, row in (
+        (SubmissionsStream(tap), submission),
+        (FoldersStream(tap), folder),
+    ):
+        transformer = pickle.loads(pickle.dumps(stream.transformer))  # noqa: S301
+        assert transformer(dict(row)) == stream.post_process(dict(row))
+
+    assert SubmissionsStream(tap).post_process(submission) == {
+        "id": "1",
+        "flag": 1,
+        "created_at": "2024-01-01 00:00:00",
+        "updated_at": "2024-01-01 00:00:00",
+        "new": None,
+        "answers": [{"qid": "3", "answer": {"first": "Ada"}}],
+    }
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        pytest.param({}, id="offset"),
+        pytest.param(
+            {"pagination_mode": "keyset", "stream_responses": True}, id="keyset"
+        ),
+        pytest.param({"submissions_by_form": True}, id="partitions"),
+        pytest.param(
+            {
+                "start_date": "2020-01-01T00:00:00Z",
+                "backfill_window_days": 365,
+                "max_parallel_windows": 3,
+            },
+            id="windows",
+        ),
+    ],
+)
+def test_transform_workers_same_output(
+    capsys: pytest.CaptureFixture[str],
+    config: dict[str, t.Any],
+):
+    dataset = MockDataset(forms=3, submissions_per_form=130, history=5)
+    outputs = []
+    with MockJotformServer(dataset) as server:
+        for workers in (0, 2):
+            tap = sync_tap(server, page_size=50, transform_workers=workers, **config)
+            outputs.append(read_messages(capsys.readouterr().out))
+
+    assert tap.transform_pool is not None
+    in_process, in_workers = outputs
+    assert in_workers == in_process
+    ids = [
+        message["record"]["id"]
+        for message in in_workers
+        if message["type"] == "RECORD" and message["stream"] == "submissions"
+    ]
+    assert len(ids) == len(set(ids)) == 390
+
+
+def test_transform_workers_folder_object(capsys: pytest.CaptureFixture[str]):
+    # The API returns the root folder as a single object
+    root = {
+        "id": "root",
+        "path": "root",
+        "name": "Root",
+        "forms": {"1": {"id": "1", "count": "5", "new": "0", "archived": "1"}},
+        "subfolders": [{"id": "child", "path": "root/child"}],
+    }
+    outputs = []
+    for workers in (0, 2):
+        tap = build_tap(transform_workers=workers)
+        stream = tap.streams["folders"]
+        stream._requests_session = FakeSession(lambda *_: make_page(root))  # type: ignore[attr-defined]
+        stream.sync()
+        outputs.append(
+            [
+                message["record"]
+                for message in read_messages(capsys.readouterr().out)
+                if message["type"] == "RECORD"
+            ],
+        )
+
+    in_process, in_workers = outputs
+    assert in_workers == in_process
+    assert [record["id"] for record in in_workers] == ["root"]
+    assert in_workers[0]["forms"]["1"]["count"] == 5
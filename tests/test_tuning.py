@@ -0,0 +1,67 @@
+"""Tests for adaptive page sizing."""
+
+from __future__ import annotations
+
+import json
+
+from tap_jotform.streams import FormsStream
+from tap_jotform.tuning import PageSizeTuner
+from tests.conftest import FakeSession, build_tap, offset_handler
+
+
+def test_tuner_grows_at_most_twofold():
+    tuner = PageSizeTuner(100, target_seconds=2.0, max_bytes=10_000_000)
+    tuner.observe(100, 0.1, 10_000)
+    assert tuner.size == 200
+
+
+def test_tuner_targets_response_time_and_size():
+    tuner = PageSizeTuner(100, target_seconds=2.0, max_bytes=1_000_000)
+    tuner.observe(100, 2.5, 1000)
+    assert tuner.size == 80
+
+    tuner.observe(80, 0.5, 1_000_000)
+    assert tuner.size == 80
+
+
+def test_tuner_bounds_and_failures():
+    tuner = PageSizeTuner(100, min_size=30, max_size=150)
+    tuner.observe(100, 0.01, 100)
+    assert tuner.size == 150
+
+    tuner.failed()
+    assert tuner.size == 75
+    tuner.failed()
+    tuner.failed()
+    assert tuner.size == 30
+
+    # Empty pages say nothing about the cost of a record
+    tuner.observe(0, 10.0, 100)
+    assert tuner.size == 30
+
+
+def test_adaptive_page_size_sync():
+    rows = [
+        {"id": str(i), "title": "x" * 100, "created_at": "2024-01-01 00:00:00"}
+        for i in range(100)
+    ]
+    page_bytes = len(json.dumps(rows[:10]))
+    tap = build_tap(
+        page_size=4,
+        adaptive_page_size=True,
+        min_page_size=2,
+        max_page_bytes=page_bytes,
+    )
+    stream = FormsStream(tap)
+    session = FakeSession(offset_handler(rows))
+    stream._requests_session = session
+
+    records = list(stream.request_records(None))
+
+    assert [record["id"] for record in records] == [row["id"] for row in rows]
+    limits = [int(params["limit"]) for _, params in session.requests]
+    # Grows from the initial size until pages reach the size limit
+    assert limits[:2] == [4, 8]
+    assert all(limit < 10 for limit in limits)
+    offsets = [int(params.get("offset", 0)) for _, params in session.requests]
+    assert offsets[1:] == [sum(limits[:index]) for index in range(1, len(limits))]